@@ -0,0 +1,218 @@
+# File: backend/app/api/v1/batches.py
+
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, BackgroundTasks
+from typing import Any, Dict, List, Optional
+import uuid
+from datetime import datetime
+from ...core.config.settings import settings
+from ...core.database import db
+from ...models.batch import BatchEvaluationCreate, BatchItem, BatchItemStatus, BatchStatusResponse
+from ...models.business_plan import BusinessPlanStatus
+from ...models.evaluation import EvaluationMode
+from ...services.evaluation.batch import batch_manager, build_batch_status
+from ...services.evaluation.progress import evaluation_progress
+from .business_plans import (
+    process_and_evaluate_bp,
+    prepare_business_plan_reprocessing,
+    save_uploaded_business_plan,
+)
+
+router = APIRouter()
+
+# Item fields stored with the batch; the rest is read from the business plan rows
+STORED_ITEM_FIELDS = {"project_id", "bp_id", "status", "error", "started_at"}
+
+
+def _check_batch_size(count: int):
+    if count > settings.BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"批量评估最多支持{settings.BATCH_MAX_ITEMS}个项目"
+        )
+
+
+def _stored_items(items: List[BatchItem]) -> List[Dict[str, Any]]:
+    return [item.model_dump(mode="json", include=STORED_ITEM_FIELDS) for item in items]
+
+
+def save_batch_items(batch_id: str, items: List[BatchItem]):
+    """Record which items have started, so every worker can tell them from queued ones"""
+    db.get_client().table("evaluation_batches").update({
+        "items": _stored_items(items),
+        "updated_at": datetime.utcnow().isoformat()
+    }).eq("id", batch_id).execute()
+
+
+def load_batch_status(batch_id: str) -> Optional[BatchStatusResponse]:
+    """
+    Read a batch and derive the status of its items from their business plans
+
+    A plan still processing is queued until the worker running the batch
+    has recorded its start. A completed plan whose evaluation failed
+    (error_message set, left for manual review) counts as failed; total
+    scores come from the evaluations stored since the batch was created.
+    """
+    supabase = db.get_client()
+    result = supabase.table("evaluation_batches").select("*").eq("id", batch_id).execute()
+    if not result.data:
+        return None
+    batch = result.data[0]
+
+    stored_items = batch["items"]
+    bp_ids = [item["bp_id"] for item in stored_items if item.get("bp_id")]
+    business_plans: Dict[str, Dict[str, Any]] = {}
+    total_scores: Dict[str, float] = {}
+    if bp_ids:
+        bp_rows = (
+            supabase.table("business_plans")
+            .select("id, status, error_message, updated_at")
+            .in_("id", bp_ids)
+            .execute()
+        )
+        business_plans = {bp["id"]: bp for bp in bp_rows.data}
+        evaluation_rows = (
+            supabase.table("evaluations")
+            .select("business_plan_id, total_score, created_at")
+            .in_("business_plan_id", bp_ids)
+            .gte("created_at", batch["created_at"])
+            .order("created_at", desc=True)
+            .execute()
+        )
+        for evaluation in evaluation_rows.data:
+            total_scores.setdefault(evaluation["business_plan_id"], evaluation["total_score"])
+
+    items = []
+    for stored in stored_items:
+        fields = dict(stored)
+        bp_id = stored.get("bp_id")
+        if bp_id:
+            bp = business_plans.get(bp_id)
+            if bp is None:
+                fields.update(status=BatchItemStatus.FAILED, error="Business plan not found")
+            elif bp["status"] == BusinessPlanStatus.PROCESSING.value:
+                fields["status"] = BatchItemStatus.PROCESSING if stored.get("started_at") else BatchItemStatus.QUEUED
+            elif bp["status"] == BusinessPlanStatus.COMPLETED.value and not bp.get("error_message"):
+                fields.update(status=BatchItemStatus.COMPLETED, finished_at=bp["updated_at"])
+                fields["total_score"] = total_scores.get(bp_id)
+            else:
+                fields.update(status=BatchItemStatus.FAILED, error=bp.get("error_message"), finished_at=bp["updated_at"])
+        items.append(BatchItem(**fields))
+
+    return build_batch_status(batch_id, batch["created_at"], items)
+
+
+def _start_batch(
+    items: List[BatchItem],
+    file_paths: dict,
+    background_tasks: BackgroundTasks,
+    evaluation_mode: Optional[EvaluationMode],
+    use_cache: bool
+) -> BatchStatusResponse:
+    """Store the batch and run its items in the background"""
+    batch_id = str(uuid.uuid4())
+    created_at = datetime.utcnow()
+    try:
+        db.get_client().table("evaluation_batches").insert({
+            "id": batch_id,
+            "items": _stored_items(items),
+            "created_at": created_at.isoformat(),
+            "updated_at": created_at.isoformat()
+        }).execute()
+    except Exception as e:
+        # The plans are still evaluated; only the batch status cannot be looked up
+        print(f"⚠️ Failed to save batch {batch_id}: {str(e)}")
+
+    # Queued items may wait a while; their subscribers must not see the last run's result
+    for item in items:
+        if item.bp_id in file_paths:
+            evaluation_progress.reset(item.project_id)
+
+    async def run_item(item: BatchItem):
+        return await process_and_evaluate_bp(
+            item.bp_id,
+            item.project_id,
+            file_paths[item.bp_id],
+            evaluation_mode,
+            use_cache
+        )
+
+    background_tasks.add_task(
+        batch_manager.run,
+        batch_id,
+        items,
+        run_item,
+        lambda started_item: save_batch_items(batch_id, items)
+    )
+    return build_batch_status(batch_id, created_at, [item.model_copy() for item in items])
+
+
+@router.post("/business-plans/batches", response_model=BatchStatusResponse)
+async def create_evaluation_batch(batch_data: BatchEvaluationCreate, background_tasks: BackgroundTasks):
+    """
+    Re-evaluate the latest business plan of several projects as one batch
+
+    Projects without a usable business plan are reported as failed items;
+    the rest are scheduled through the shared evaluation pool.
+    """
+    project_ids = list(dict.fromkeys(batch_data.project_ids))
+    _check_batch_size(len(project_ids))
+
+    items = []
+    file_paths = {}
+    for project_id in project_ids:
+        item = BatchItem(project_id=project_id)
+        try:
+            item.bp_id, file_paths[item.bp_id] = prepare_business_plan_reprocessing(project_id)
+        except HTTPException as e:
+            item.status = BatchItemStatus.FAILED
+            item.error = str(e.detail)
+        except Exception as e:
+            item.status = BatchItemStatus.FAILED
+            item.error = str(e)
+        items.append(item)
+
+    return _start_batch(items, file_paths, background_tasks, batch_data.evaluation_mode, not batch_data.force)
+
+
+@router.post("/business-plans/batches/upload", response_model=BatchStatusResponse)
+async def upload_evaluation_batch(
+    background_tasks: BackgroundTasks,
+    project_ids: List[str] = Form(...),
+    files: List[UploadFile] = File(...),
+    evaluation_mode: Optional[EvaluationMode] = None,
+    force: bool = False
+):
+    """
+    Upload business plans for several projects and evaluate them as one batch
+
+    project_ids and files are matched by position. Rejected uploads are
+    reported as failed items without affecting the rest of the batch.
+    force=true bypasses the LLM response cache.
+    """
+    if len(project_ids) != len(files):
+        raise HTTPException(status_code=400, detail="project_ids与files数量不一致")
+    _check_batch_size(len(files))
+
+    items = []
+    file_paths = {}
+    for project_id, file in zip(project_ids, files):
+        item = BatchItem(project_id=project_id)
+        try:
+            bp_record, file_path = await save_uploaded_business_plan(project_id, file)
+            item.bp_id = bp_record.id
+            file_paths[item.bp_id] = file_path
+        except HTTPException as e:
+            item.status = BatchItemStatus.FAILED
+            item.error = str(e.detail)
+        items.append(item)
+
+    return _start_batch(items, file_paths, background_tasks, evaluation_mode, not force)
+
+
+@router.get("/business-plans/batches/{batch_id}", response_model=BatchStatusResponse)
+async def get_evaluation_batch(batch_id: str):
+    """Aggregate progress and per-item status of a batch, from any worker"""
+    batch_status = load_batch_status(batch_id)
+    if batch_status is None:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    return batch_status
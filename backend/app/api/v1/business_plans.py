@@ -1,8 +1,10 @@
 # File: backend/app/api/v1/business_plans.py
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
-from typing import List
+from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks, Request
+from fastapi.responses import FileResponse, StreamingResponse
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+import asyncio
+import json
 import uuid
 import os
 from datetime import datetime
@@ -12,52 +14,114 @@ from ...models.business_plan import (
     BusinessPlanStatus,
 )
 from ...services.storage import storage_service
-from ...services.document.processor import document_processor
+from ...services.document.processor import ImageOnlyDocumentError, document_processor
+from ...services.document.extraction_pool import extraction_pool
+from ...services.document.document_cache import document_cache
 from ...services.evaluation.deepseek_client import deepseek_client
+from ...services.evaluation.rate_limiter import LLMProviderUnavailableError
+from ...services.evaluation.progress import evaluation_progress
+from .evaluations import save_evaluation_results
+from ...core.config.settings import settings
 from ...core.database import db
 from ...models.project import calculate_status_from_score, calculate_review_result_from_score
+from ...models.evaluation import DimensionReevaluationCreate, EvaluationMode
+from ...models.score import STANDARD_DIMENSIONS
 
 router = APIRouter()
 
 
-async def process_and_evaluate_bp(bp_id: str, project_id: str, file_path: str):
-    """Background task to process document and run evaluation"""
+async def process_and_evaluate_bp(
+    bp_id: str,
+    project_id: str,
+    file_path: str,
+    evaluation_mode: Optional[EvaluationMode] = None,
+    use_cache: bool = True
+) -> Dict[str, Any]:
+    """
+    Background task to process document and run evaluation
+
+    Returns the outcome (status, total_score or error) for batch tracking.
+    """
     supabase = db.get_client()
 
     try:
         print(f"🔄 Starting background processing for BP {bp_id}")
+        evaluation_progress.publish(project_id, {"type": "evaluation_started", "bp_id": bp_id})
+
+        evaluation_options = dict(
+            mode=evaluation_mode.value if evaluation_mode else None,
+            use_cache=use_cache,
+            progress_callback=lambda event: evaluation_progress.publish(project_id, event),
+            owner=bp_id
+        )
 
-        # Step 1: Extract text from PDF
-        print("📄 Extracting text from PDF...")
-        document_text = await document_processor.extract_text_from_pdf(file_path)
+        if settings.PDF_STREAMING_EVALUATION:
+            # Steps 1-2: Extract text page by page, starting dimensions whose
+            # relevant content has been read while later pages are parsed.
+            # Upload only validates the PDF, so a new plan is parsed here;
+            # reprocess runs replay the parsed document
+            print("📄🤖 Extracting text and running AI evaluation (streaming)...")
+            evaluation_result = await deepseek_client.evaluate_business_plan_streaming(
+                stream_business_plan_text(file_path),
+                **evaluation_options
+            )
+        else:
+            # Step 1: Extract text from PDF
+            print("📄 Extracting text from PDF...")
+            document_text = await load_business_plan_text(file_path)
 
-        if len(document_text.strip()) < 50:
-            raise ValueError("Document text too short or extraction failed")
+            # Step 2: Run AI evaluation
+            print("🤖 Running AI evaluation...")
+            evaluation_result = await deepseek_client.evaluate_business_plan(document_text, **evaluation_options)
 
-        # Step 2: Run AI evaluation
-        print("🤖 Running AI evaluation...")
-        evaluation_result = await deepseek_client.evaluate_business_plan(document_text)
+        # Section offsets of the plan, from the document parsed above
+        section_index = await load_section_index(file_path)
+        # Plans sampled under the text budget were evaluated on part of their pages
+        covered_pages = await load_covered_pages(file_path)
+        if covered_pages is not None:
+            evaluation_result["covered_pages"] = covered_pages
 
         # Step 3: Store evaluation results in scores tables
         print("💾 Storing evaluation results...")
         await store_evaluation_results(project_id, evaluation_result)
+        await store_evaluation_record(bp_id, evaluation_result)
 
         # Step 4: Update business plan status
-        supabase.table("business_plans").update({
+        bp_update = {
             "status": BusinessPlanStatus.COMPLETED.value,
             "updated_at": datetime.utcnow().isoformat()
-        }).eq("id", bp_id).execute()
+        }
+        if section_index is not None:
+            bp_update["section_index"] = section_index
+        supabase.table("business_plans").update(bp_update).eq("id", bp_id).execute()
 
         # UPDATED Step 5: Project status will be automatically updated by database trigger
         # based on total_score, so we don't need to set it manually here
+        evaluation_progress.publish(project_id, {
+            "type": "evaluation_completed",
+            "bp_id": bp_id,
+            "total_score": evaluation_result.get("total_score")
+        })
         print(f"✅ Successfully processed BP {bp_id}")
+        return {"status": "completed", "total_score": evaluation_result.get("total_score")}
 
     except Exception as e:
         print(f"❌ Background processing failed for BP {bp_id}: {str(e)}")
-
-        # Update status to completed but mark as needing manual review
+        evaluation_progress.publish(project_id, {
+            "type": "evaluation_failed",
+            "bp_id": bp_id,
+            "error": str(e)
+        })
+
+        # Provider outages leave the BP failed so it can be reprocessed later;
+        # other errors are completed but marked as needing manual review
+        bp_status = (
+            BusinessPlanStatus.FAILED
+            if isinstance(e, LLMProviderUnavailableError)
+            else BusinessPlanStatus.COMPLETED
+        )
         supabase.table("business_plans").update({
-            "status": BusinessPlanStatus.COMPLETED.value,
+            "status": bp_status.value,
             "error_message": f"AI处理失败: {str(e)}",
             "updated_at": datetime.utcnow().isoformat()
         }).eq("id", bp_id).execute()
@@ -69,17 +133,20 @@ async def process_and_evaluate_bp(bp_id: str, project_id: str, file_path: str):
         }).eq("id", project_id).execute()
 
         # Add missing information record to trigger manual review
+        scanned = isinstance(e, ImageOnlyDocumentError)
         supabase.table("missing_information").insert({
             "id": str(uuid.uuid4()),
             "project_id": project_id,
             "dimension": "AI评估",
-            "information_type": "自动评估失败",
-            "description": f"AI自动评估失败: {str(e)}，请进行人工评审",
+            "information_type": "扫描件无法自动评估" if scanned else "自动评估失败",
+            "description": f"{'文档为扫描件' if scanned else 'AI自动评估失败'}: {str(e)}，请进行人工评审",
             "status": "pending",
             "created_at": datetime.utcnow().isoformat(),
             "updated_at": datetime.utcnow().isoformat()
         }).execute()
 
+        return {"status": "failed", "error": str(e)}
+
 
 async def store_evaluation_results(project_id: str, evaluation_result: dict):
     """Store evaluation results in the scores and score_details tables"""
@@ -156,7 +223,336 @@ async def store_evaluation_results(project_id: str, evaluation_result: dict):
         print(f"❌ Failed to store evaluation results: {str(e)}")
         raise
 
-async def save_ai_evaluation_to_history(project_id: str, evaluation_result: dict):
+async def store_evaluation_record(bp_id: str, evaluation_result: dict):
+    """Keep the full evaluation, including its per-call usage summary, in the evaluations table"""
+    try:
+        await save_evaluation_results(bp_id, evaluation_result)
+    except Exception as e:
+        # Scores are already stored; the record is for auditing and capacity planning
+        print(f"⚠️ Failed to save evaluation record for BP {bp_id}: {str(e)}")
+
+
+async def load_business_plan_text(file_path: str) -> str:
+    """
+    Return the extracted text of a BP
+
+    The PDF is parsed by the first evaluation; its parsed-document sidecar
+    serves reprocess runs and re-evaluations without parsing it again.
+    """
+    document_text = await document_processor.extract_text_from_pdf(file_path)
+    if len(document_text.strip()) < 50:
+        raise ValueError("Document text too short or extraction failed")
+    return document_text
+
+
+async def stream_business_plan_text(file_path: str) -> AsyncIterator[str]:
+    """
+    Streaming counterpart of load_business_plan_text
+
+    Yields the text page by page (see DocumentProcessor.stream_text_from_pdf)
+    and raises the same error once the stream ends if it was too short.
+    """
+    extracted_chars = 0
+    async for piece in document_processor.stream_text_from_pdf(file_path):
+        extracted_chars += len(piece.strip())
+        yield piece
+    if extracted_chars < 50:
+        raise ValueError("Document text too short or extraction failed")
+
+
+async def load_section_index(file_path: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Section index of an extracted BP (see DocumentProcessor.get_section_index)
+
+    None when it cannot be built; the sections endpoint then builds it on
+    first request.
+    """
+    try:
+        return await document_processor.get_section_index(file_path)
+    except Exception as e:
+        print(f"⚠️ Failed to build the section index: {str(e)}")
+        return None
+
+
+async def load_covered_pages(file_path: str) -> Optional[List[int]]:
+    """
+    1-based pages read from a BP sampled under PDF_TEXT_BUDGET_TOKENS
+
+    None when every page was read (or the document cannot be loaded).
+    """
+    try:
+        document = await document_processor.parse_document(file_path)
+    except Exception as e:
+        print(f"⚠️ Failed to read the covered pages: {str(e)}")
+        return None
+    return document.info().get("covered_pages")
+
+
+async def load_business_plan_sections(file_path: str, dimension_keys: List[str]) -> str:
+    """
+    Return the overview and the sections of the given dimensions of a BP
+
+    Sliced out of the cached text by the section index built at extraction,
+    so re-evaluating a few dimensions does not send the whole plan
+    through retrieval again. Falls back to the whole text when the index
+    does not give every dimension PDF_SECTION_MIN_CHARS characters.
+    """
+    try:
+        section_text = await document_processor.extract_section_text(
+            file_path,
+            dimension_keys,
+            min_chars=settings.PDF_SECTION_MIN_CHARS,
+            with_overview=True
+        )
+    except Exception as e:
+        print(f"⚠️ Failed to read the section index: {str(e)}")
+        section_text = None
+
+    if section_text is None:
+        return await load_business_plan_text(file_path)
+    print(f"📑 Using the {', '.join(dimension_keys)} sections ({len(section_text)} characters)")
+    return section_text
+
+
+def load_stored_dimensions(project_id: str) -> Dict[str, Dict[str, Any]]:
+    """Read the stored dimension scores of a project in evaluation result format"""
+    supabase = db.get_client()
+    dimensions = {}
+
+    score_rows = supabase.table("scores").select("*").eq("project_id", project_id).execute()
+    for score_row in score_rows.data:
+        detail_rows = supabase.table("score_details").select("*").eq("score_id", score_row['id']).execute()
+        dimensions[score_row['dimension']] = {
+            "score": float(score_row['score']),
+            "max_score": float(score_row['max_score']),
+            "comments": score_row.get('comments') or "",
+            "sub_dimensions": [
+                {
+                    "sub_dimension": detail['sub_dimension'],
+                    "score": float(detail['score']),
+                    "max_score": float(detail['max_score']),
+                    "comments": detail.get('comments') or ""
+                }
+                for detail in detail_rows.data
+            ]
+        }
+
+    return dimensions
+
+
+async def store_dimension_results(
+    project_id: str,
+    dimension_results: Dict[str, Dict[str, Any]],
+    missing_info: List[Dict[str, Any]],
+    resolved_missing_ids: List[str]
+) -> float:
+    """
+    Update only the given dimensions in the scores and score_details tables
+
+    Other dimensions keep their rows. New missing information is added
+    unless already recorded, and resolved items are marked as such.
+    Returns the project's new total score.
+    """
+    supabase = db.get_client()
+
+    try:
+        existing_scores = supabase.table("scores").select("id, dimension").eq("project_id", project_id).execute()
+        score_ids = {row['dimension']: row['id'] for row in existing_scores.data}
+
+        for dimension_name, dimension_data in dimension_results.items():
+            current_time = datetime.utcnow().isoformat()
+            score_fields = {
+                "score": dimension_data.get("score", 0),
+                "max_score": dimension_data.get("max_score", 0),
+                "comments": dimension_data.get("comments", ""),
+                "updated_at": current_time
+            }
+
+            score_id = score_ids.get(dimension_name)
+            if score_id:
+                supabase.table("scores").update(score_fields).eq("id", score_id).execute()
+                # Replace the sub-dimensions of this dimension only
+                supabase.table("score_details").delete().eq("score_id", score_id).execute()
+            else:
+                score_id = str(uuid.uuid4())
+                supabase.table("scores").insert({
+                    "id": score_id,
+                    "project_id": project_id,
+                    "dimension": dimension_name,
+                    **score_fields,
+                    "created_at": current_time
+                }).execute()
+
+            for sub_dim in dimension_data.get("sub_dimensions", []):
+                supabase.table("score_details").insert({
+                    "id": str(uuid.uuid4()),
+                    "score_id": score_id,
+                    "sub_dimension": sub_dim.get("sub_dimension", ""),
+                    "score": sub_dim.get("score", 0),
+                    "max_score": sub_dim.get("max_score", 0),
+                    "comments": sub_dim.get("comments", ""),
+                    "created_at": current_time
+                }).execute()
+
+        for missing_item in missing_info:
+            information_type = missing_item.get("type", "其他")
+            description = missing_item.get("description", "")
+            existing = (
+                supabase.table("missing_information")
+                .select("id")
+                .eq("project_id", project_id)
+                .eq("dimension", information_type)
+                .eq("description", description)
+                .execute()
+            )
+            if existing.data:
+                continue
+
+            supabase.table("missing_information").insert({
+                "id": str(uuid.uuid4()),
+                "project_id": project_id,
+                "dimension": information_type,
+                "information_type": information_type,
+                "description": description,
+                "status": "pending",
+                "created_at": datetime.utcnow().isoformat(),
+                "updated_at": datetime.utcnow().isoformat()
+            }).execute()
+
+        for info_id in resolved_missing_ids:
+            supabase.table("missing_information").update({
+                "status": "resolved",
+                "updated_at": datetime.utcnow().isoformat()
+            }).eq("id", info_id).eq("project_id", project_id).execute()
+
+        # History records the full score set, with the re-run dimensions as returned by the model
+        dimensions = load_stored_dimensions(project_id)
+        dimensions.update(dimension_results)
+        total_score = sum(float(dimension_data.get("score", 0)) for dimension_data in dimensions.values())
+
+        await save_ai_evaluation_to_history(
+            project_id,
+            {"dimensions": dimensions, "total_score": total_score},
+            f"DeepSeek AI重新评估: {', '.join(dimension_results)} (总分: {total_score}/100)"
+        )
+
+        print(f"✅ Updated {list(dimension_results)} for project {project_id}")
+        return total_score
+
+    except Exception as e:
+        print(f"❌ Failed to store dimension results: {str(e)}")
+        raise
+
+
+def restore_project_status(project_id: str):
+    """Set the project status from its stored total score once processing ends"""
+    supabase = db.get_client()
+    score_rows = supabase.table("scores").select("score").eq("project_id", project_id).execute()
+    total_score = sum(float(row['score']) for row in score_rows.data) if score_rows.data else None
+
+    supabase.table("projects").update({
+        "status": calculate_status_from_score(total_score).value,
+        "updated_at": datetime.utcnow().isoformat()
+    }).eq("id", project_id).execute()
+
+
+async def reevaluate_bp_dimensions(
+    bp_id: str,
+    project_id: str,
+    file_path: str,
+    reevaluation: DimensionReevaluationCreate
+) -> Dict[str, Any]:
+    """
+    Background task re-running selected dimensions of an evaluated BP
+
+    Uses the sections of those dimensions in the cached extracted text
+    plus the supplied information and only touches the rows of those
+    dimensions. Dimensions whose call fails keep
+    their stored scores.
+    """
+    supabase = db.get_client()
+
+    try:
+        print(f"🔄 Re-evaluating {reevaluation.dimensions} for BP {bp_id}")
+        evaluation_progress.publish(project_id, {
+            "type": "evaluation_started",
+            "bp_id": bp_id,
+            "dimensions": reevaluation.dimensions
+        })
+
+        document_text = await load_business_plan_sections(file_path, reevaluation.dimensions)
+
+        evaluation_result = await deepseek_client.reevaluate_dimensions(
+            document_text,
+            reevaluation.dimensions,
+            additional_information=reevaluation.additional_information,
+            use_cache=not reevaluation.force,
+            progress_callback=lambda event: evaluation_progress.publish(project_id, event),
+            owner=bp_id
+        )
+
+        dimension_results = {
+            key: value for key, value in evaluation_result["dimensions"].items()
+            if not value.get("fallback")
+        }
+        failed_dimensions = [key for key in evaluation_result["dimensions"] if key not in dimension_results]
+
+        total_score = None
+        if dimension_results:
+            total_score = await store_dimension_results(
+                project_id,
+                dimension_results,
+                evaluation_result["missing_information"],
+                # Only a complete re-evaluation settles the resolved items
+                [] if failed_dimensions else reevaluation.resolved_missing_information_ids
+            )
+            await store_evaluation_record(bp_id, {**evaluation_result, "total_score": total_score})
+
+        supabase.table("business_plans").update({
+            "status": BusinessPlanStatus.COMPLETED.value,
+            "error_message": f"以下维度重新评估失败，保留原评分: {', '.join(failed_dimensions)}" if failed_dimensions else None,
+            "updated_at": datetime.utcnow().isoformat()
+        }).eq("id", bp_id).execute()
+        restore_project_status(project_id)
+
+        evaluation_progress.publish(project_id, {
+            "type": "evaluation_completed",
+            "bp_id": bp_id,
+            "total_score": total_score,
+            "failed_dimensions": failed_dimensions
+        })
+        print(f"✅ Re-evaluated {list(dimension_results)} for BP {bp_id}")
+        return {"status": "completed", "total_score": total_score, "failed_dimensions": failed_dimensions}
+
+    except Exception as e:
+        print(f"❌ Dimension re-evaluation failed for BP {bp_id}: {str(e)}")
+        evaluation_progress.publish(project_id, {
+            "type": "evaluation_failed",
+            "bp_id": bp_id,
+            "error": str(e)
+        })
+
+        # Stored scores are untouched, so the project keeps its previous status
+        bp_status = (
+            BusinessPlanStatus.FAILED
+            if isinstance(e, LLMProviderUnavailableError)
+            else BusinessPlanStatus.COMPLETED
+        )
+        supabase.table("business_plans").update({
+            "status": bp_status.value,
+            "error_message": f"维度重新评估失败: {str(e)}",
+            "updated_at": datetime.utcnow().isoformat()
+        }).eq("id", bp_id).execute()
+        restore_project_status(project_id)
+
+        return {"status": "failed", "error": str(e)}
+
+
+async def save_ai_evaluation_to_history(
+    project_id: str,
+    evaluation_result: dict,
+    modification_notes: Optional[str] = None
+):
     """Save AI evaluation results to review history"""
     supabase = db.get_client()
 
@@ -182,6 +578,11 @@ async def save_ai_evaluation_to_history(project_id: str, evaluation_result: dict
                 "comments": dimension_data.get("comments", ""),
                 "sub_dimensions": sub_dimensions
             }
+            # Cascade evaluations record which tier produced the score
+            if dimension_data.get("tier"):
+                dimensions[dimension_name]["tier"] = dimension_data["tier"]
+                if dimension_data.get("escalation_reasons"):
+                    dimensions[dimension_name]["escalation_reasons"] = dimension_data["escalation_reasons"]
 
         # Calculate total score
         total_score = evaluation_result.get("total_score", 0)
@@ -193,7 +594,7 @@ async def save_ai_evaluation_to_history(project_id: str, evaluation_result: dict
             "total_score": float(total_score),
             "dimensions": dimensions,
             "modified_by": "AI系统",
-            "modification_notes": f"DeepSeek AI自动评估 (总分: {total_score}/100)",
+            "modification_notes": modification_notes or f"DeepSeek AI自动评估 (总分: {total_score}/100)",
             "created_at": datetime.utcnow().isoformat()
         }
 
@@ -208,13 +609,13 @@ async def save_ai_evaluation_to_history(project_id: str, evaluation_result: dict
         print(f"⚠️ Failed to save AI evaluation to history: {str(e)}")
         # Don't fail the main operation if history save fails
 
-@router.post("/projects/{project_id}/business-plans", response_model=BusinessPlanInDB)
-async def upload_business_plan(
-    project_id: str,
-    background_tasks: BackgroundTasks,
-    file: UploadFile = File(...)
-):
-    """Upload business plan and trigger background processing - FIXED VERSION"""
+async def save_uploaded_business_plan(project_id: str, file: UploadFile) -> Tuple[BusinessPlanInDB, str]:
+    """
+    Validate an uploaded PDF, store it and create its BP record
+
+    Returns the new record and the saved file path. Shared by the single
+    and batch upload endpoints; invalid uploads raise HTTPException.
+    """
 
     # FIXED: Basic validations first, before touching the file
     if not file.filename:
@@ -252,9 +653,9 @@ async def upload_business_plan(
             storage_service.delete_file(file_path)
             raise HTTPException(status_code=400, detail="文件为空或保存失败")
 
-        # FIXED: Validate the saved PDF file
+        # FIXED: Validate the saved PDF file; full extraction runs in the background task
         print(f"🔍 Validating PDF file: {file_path}")
-        if not document_processor.validate_pdf_file(file_path):
+        if not await document_processor.validate_pdf(file_path):
             storage_service.delete_file(file_path)
             raise HTTPException(status_code=400, detail="Invalid PDF file or corrupted")
 
@@ -285,18 +686,7 @@ async def upload_business_plan(
             "updated_at": current_time
         }).eq("id", project_id).execute()
 
-        print(f"✅ BP upload successful, starting background processing")
-
-        # Add background task for processing and evaluation
-        background_tasks.add_task(
-            process_and_evaluate_bp,
-            bp_id,
-            project_id,
-            file_path
-        )
-
-        # Return success response immediately
-        return BusinessPlanInDB(
+        bp_record = BusinessPlanInDB(
             id=bp_id,
             project_id=project_id,
             file_name=filename,
@@ -305,6 +695,7 @@ async def upload_business_plan(
             upload_time=datetime.fromisoformat(current_time),
             updated_at=datetime.fromisoformat(current_time)
         )
+        return bp_record, file_path
 
     except HTTPException:
         # Re-raise HTTP exceptions as-is
@@ -317,6 +708,33 @@ async def upload_business_plan(
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
 
+@router.post("/projects/{project_id}/business-plans", response_model=BusinessPlanInDB)
+async def upload_business_plan(
+    project_id: str,
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    evaluation_mode: Optional[EvaluationMode] = None
+):
+    """Upload business plan and trigger background processing - FIXED VERSION"""
+    bp_record, file_path = await save_uploaded_business_plan(project_id, file)
+
+    print(f"✅ BP upload successful, starting background processing")
+
+    # Add background task for processing and evaluation; subscribers wait for
+    # this run instead of replaying the previous plan's result
+    evaluation_progress.reset(project_id)
+    background_tasks.add_task(
+        process_and_evaluate_bp,
+        bp_record.id,
+        project_id,
+        file_path,
+        evaluation_mode
+    )
+
+    # Return success response immediately
+    return bp_record
+
+
 @router.get("/projects/{project_id}/business-plans/status", response_model=BusinessPlanInDB)
 async def get_business_plan_status(project_id: str):
     """Get BP processing status - FIXED VERSION"""
@@ -354,7 +772,8 @@ async def get_business_plan_status(project_id: str):
             status=BusinessPlanStatus(row['status']),
             upload_time=datetime.fromisoformat(row['upload_time'].replace('Z', '+00:00')) if isinstance(row['upload_time'], str) else row['upload_time'],
             updated_at=datetime.fromisoformat(row['updated_at'].replace('Z', '+00:00')) if isinstance(row['updated_at'], str) else row['updated_at'],
-            error_message=row.get('error_message')
+            error_message=row.get('error_message'),
+            section_index=row.get('section_index')
         )
 
     except HTTPException:
@@ -364,6 +783,151 @@ async def get_business_plan_status(project_id: str):
         raise HTTPException(status_code=500, detail=f"Failed to get BP status: {str(e)}")
 
 
+@router.get("/projects/{project_id}/business-plans/sections")
+async def get_business_plan_sections(project_id: str, section: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Section index of the latest business plan, and one section's text on request
+
+    The index stored with the BP record once its evaluation extracted the
+    plan is returned as is. When the column is still empty (evaluation
+    running or failed, or plans uploaded before it existed) the index is
+    built from the parsed document and stored for next time. With section (e.g. 团队能力) only that
+    section's text is sliced out of the cached extracted text.
+    """
+    supabase = db.get_client()
+
+    try:
+        uuid.UUID(project_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid project ID format")
+
+    try:
+        result = (
+            supabase.table("business_plans")
+            .select("*")
+            .eq("project_id", project_id)
+            .order("upload_time", desc=True)
+            .limit(1)
+            .execute()
+        )
+        if not result.data:
+            raise HTTPException(status_code=404, detail="No business plan found for this project")
+
+        bp_record = result.data[0]
+        file_path = os.path.join(storage_service.bp_dir, bp_record['file_name'])
+        section_index = bp_record.get('section_index')
+
+        if section_index is None or section:
+            if not os.path.exists(file_path):
+                raise HTTPException(status_code=404, detail="Business plan file not found on disk")
+
+        if section_index is None:
+            section_index = await document_processor.get_section_index(file_path)
+            supabase.table("business_plans").update({
+                "section_index": section_index
+            }).eq("id", bp_record['id']).execute()
+
+        response_data = {"bp_id": bp_record['id'], "sections": section_index}
+        if section:
+            section_text = await document_processor.extract_section_text(file_path, [section])
+            if section_text is None:
+                raise HTTPException(status_code=404, detail=f"未识别到章节: {section}")
+            response_data.update(section=section, text=section_text)
+        return response_data
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"❌ Failed to get business plan sections: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to get business plan sections: {str(e)}")
+
+
+@router.get("/business-plans/extraction/stats")
+async def get_extraction_pool_stats() -> Dict[str, Any]:
+    """PDF parsing process pool (queue depth, running jobs, timeouts, wait/run time) and parsed-document cache"""
+    return {**extraction_pool.stats(), "document_cache": document_cache.stats()}
+
+
+def _format_sse(event_type: str, data: dict) -> str:
+    """Format one server-sent event; the type travels in the payload so EventSource.onmessage sees it"""
+    payload = {**data, "type": event_type}
+    return f"data: {json.dumps(payload, ensure_ascii=False, default=str)}\n\n"
+
+
+@router.get("/projects/{project_id}/business-plans/events")
+async def stream_business_plan_events(project_id: str, request: Request):
+    """
+    Server-sent events with per-dimension evaluation progress
+
+    Pushes partial scores as they stream from the model, completed
+    dimensions and the final result, so the dashboard does not need to
+    poll /business-plans/status. Progress events come from the worker
+    running the evaluation; the stored BP status is checked periodically
+    so the stream also ends correctly when another worker ran it.
+    """
+    try:
+        uuid.UUID(project_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid project ID format")
+
+    supabase = db.get_client()
+
+    def latest_bp_status() -> Optional[str]:
+        result = (
+            supabase.table("business_plans")
+            .select("status")
+            .eq("project_id", project_id)
+            .order("upload_time", desc=True)
+            .limit(1)
+            .execute()
+        )
+        return result.data[0]["status"] if result.data else None
+
+    async def event_stream():
+        queue = evaluation_progress.subscribe(project_id)
+        try:
+            snapshot = evaluation_progress.snapshot(project_id)
+            if snapshot:
+                yield _format_sse("snapshot", snapshot)
+                if snapshot.get("status") in ("completed", "failed"):
+                    return
+            else:
+                status = latest_bp_status()
+                if status != BusinessPlanStatus.PROCESSING.value:
+                    yield _format_sse("status", {"project_id": project_id, "status": status})
+                    return
+
+            while True:
+                if await request.is_disconnected():
+                    return
+
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    # No local progress: fall back to the stored status
+                    status = latest_bp_status()
+                    if status != BusinessPlanStatus.PROCESSING.value:
+                        yield _format_sse("status", {"project_id": project_id, "status": status})
+                        return
+                    yield ": keep-alive\n\n"
+                    continue
+
+                yield _format_sse(event["type"], event)
+                if event["type"] in ("evaluation_completed", "evaluation_failed"):
+                    return
+        finally:
+            evaluation_progress.unsubscribe(project_id, queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
 @router.get("/projects/{project_id}/business-plans/download")
 async def download_business_plan(project_id: str):
     """Download the business plan PDF for a project"""
@@ -478,6 +1042,7 @@ async def get_business_plan_info(project_id: str):
             "upload_time": bp_record['upload_time'],
             "file_exists": file_exists,
             "download_url": f"/api/v1/projects/{project_id}/business-plans/download" if file_exists else None,
+            "section_index": bp_record.get('section_index'),
             # DEBUG INFO
             "debug_info": {
                 "stored_filename": bp_record['file_name'],
@@ -496,57 +1061,83 @@ async def get_business_plan_info(project_id: str):
         raise HTTPException(status_code=500, detail=f"Failed to get business plan info: {str(e)}")
 
 
-@router.post("/projects/{project_id}/business-plans/reprocess")
-async def reprocess_business_plan(project_id: str, background_tasks: BackgroundTasks):
-    """Reprocess an existing business plan (re-run AI evaluation)"""
+def prepare_business_plan_reprocessing(project_id: str) -> Tuple[str, str]:
+    """
+    Find the latest BP of a project and mark it for re-evaluation
+
+    Returns the BP id and its file path; raises HTTPException when the
+    project has no business plan on disk. Shared by the reprocess and
+    batch endpoints.
+    """
     supabase = db.get_client()
 
+    # Validate UUID format
     try:
-        # Validate UUID format
-        try:
-            uuid.UUID(project_id)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid project ID format")
+        uuid.UUID(project_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid project ID format")
 
-        # Get the business plan record
-        result = (
-            supabase.table("business_plans")
-            .select("*")
-            .eq("project_id", project_id)
-            .order("upload_time", desc=True)
-            .limit(1)
-            .execute()
-        )
+    # Get the business plan record
+    result = (
+        supabase.table("business_plans")
+        .select("*")
+        .eq("project_id", project_id)
+        .order("upload_time", desc=True)
+        .limit(1)
+        .execute()
+    )
 
-        if not result.data:
-            raise HTTPException(status_code=404, detail="No business plan found for this project")
+    if not result.data:
+        raise HTTPException(status_code=404, detail="No business plan found for this project")
 
-        bp_record = result.data[0]
-        file_path = os.path.join(storage_service.bp_dir, bp_record['file_name'])
+    bp_record = result.data[0]
+    file_path = os.path.join(storage_service.bp_dir, bp_record['file_name'])
 
-        # Check if file exists
-        if not os.path.exists(file_path):
-            raise HTTPException(status_code=404, detail="Business plan file not found on disk")
+    # Check if file exists
+    if not os.path.exists(file_path):
+        raise HTTPException(status_code=404, detail="Business plan file not found on disk")
 
-        # Update status to processing
-        supabase.table("business_plans").update({
-            "status": BusinessPlanStatus.PROCESSING.value,
-            "error_message": None,
-            "updated_at": datetime.utcnow().isoformat()
-        }).eq("id", bp_record['id']).execute()
+    # Update status to processing
+    supabase.table("business_plans").update({
+        "status": BusinessPlanStatus.PROCESSING.value,
+        "error_message": None,
+        "updated_at": datetime.utcnow().isoformat()
+    }).eq("id", bp_record['id']).execute()
 
-        # Update project status
-        supabase.table("projects").update({
-            "status": "processing",
-            "updated_at": datetime.utcnow().isoformat()
-        }).eq("id", project_id).execute()
+    # Update project status
+    supabase.table("projects").update({
+        "status": "processing",
+        "updated_at": datetime.utcnow().isoformat()
+    }).eq("id", project_id).execute()
+
+    return bp_record['id'], file_path
+
+
+@router.post("/projects/{project_id}/business-plans/reprocess")
+async def reprocess_business_plan(
+    project_id: str,
+    background_tasks: BackgroundTasks,
+    evaluation_mode: Optional[EvaluationMode] = None,
+    force: bool = False
+):
+    """
+    Reprocess an existing business plan (re-run AI evaluation)
+
+    force=true bypasses the LLM response cache so every dimension is
+    evaluated afresh.
+    """
+    try:
+        bp_id, file_path = prepare_business_plan_reprocessing(project_id)
 
         # Add background task for reprocessing
+        evaluation_progress.reset(project_id)
         background_tasks.add_task(
             process_and_evaluate_bp,
-            bp_record['id'],
+            bp_id,
             project_id,
-            file_path
+            file_path,
+            evaluation_mode,
+            not force
         )
 
         return {"message": "Business plan reprocessing started"}
@@ -554,4 +1145,51 @@ async def reprocess_business_plan(project_id: str, background_tasks: BackgroundT
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to reprocess business plan: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Failed to reprocess business plan: {str(e)}")
+
+
+@router.post("/projects/{project_id}/business-plans/reevaluate")
+async def reevaluate_business_plan_dimensions(
+    project_id: str,
+    reevaluation: DimensionReevaluationCreate,
+    background_tasks: BackgroundTasks
+):
+    """
+    Re-run selected evaluation dimensions with supplementary information
+
+    Costs one LLM call per listed dimension instead of a full reprocess:
+    the cached extracted text is reused and only the scores and
+    score_details rows of those dimensions are replaced.
+    """
+    dimensions = list(dict.fromkeys(reevaluation.dimensions))
+    unknown = [key for key in dimensions if key not in STANDARD_DIMENSIONS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"未知的评审维度: {', '.join(unknown)}; 可选: {', '.join(STANDARD_DIMENSIONS)}"
+        )
+
+    for info_id in reevaluation.resolved_missing_information_ids:
+        try:
+            uuid.UUID(info_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid missing information ID format")
+
+    try:
+        bp_id, file_path = prepare_business_plan_reprocessing(project_id)
+
+        evaluation_progress.reset(project_id)
+        background_tasks.add_task(
+            reevaluate_bp_dimensions,
+            bp_id,
+            project_id,
+            file_path,
+            reevaluation.model_copy(update={"dimensions": dimensions})
+        )
+
+        return {"message": "Dimension re-evaluation started", "dimensions": dimensions}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to re-evaluate business plan: {str(e)}")
@@ -1,19 +1,35 @@
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
 from ...core.database import db
+from ...services.evaluation.cache import llm_cache
+from ...services.evaluation.hedging import request_hedger
+from ...services.evaluation.telemetry import llm_telemetry
 
 router = APIRouter()
 
 @router.get("/projects/{project_id}/evaluation")
 async def get_evaluation_results(project_id: str) -> Dict[str, Any]:
-    """获取项目评估结果"""
+    """获取项目评估结果 (含本次评估的调用用量、延迟与成本汇总)"""
     supabase = db.get_client()
 
+    # Evaluations are stored per business plan; use the latest one
+    bp_result = (
+        supabase.table("business_plans")
+        .select("id")
+        .eq("project_id", project_id)
+        .order("upload_time", desc=True)
+        .limit(1)
+        .execute()
+    )
+
+    if not bp_result.data:
+        raise HTTPException(status_code=404, detail="评估结果未找到")
+
     # Get evaluation results from database
     result = (
         supabase.table("evaluations")
         .select("*")
-        .eq("project_id", project_id)
+        .eq("business_plan_id", bp_result.data[0]["id"])
         .order("created_at", desc=True)
         .limit(1)
         .execute()
@@ -24,6 +40,21 @@ async def get_evaluation_results(project_id: str) -> Dict[str, Any]:
 
     return result.data[0]
 
+@router.get("/evaluations/cache/stats")
+async def get_llm_cache_stats() -> Dict[str, Any]:
+    """获取LLM响应缓存命中统计"""
+    return await llm_cache.stats_async()
+
+@router.get("/evaluations/hedging/stats")
+async def get_hedging_stats() -> Dict[str, Any]:
+    """获取对冲请求统计(触发次数、对冲胜出率、额外调用比例)"""
+    return request_hedger.stats()
+
+@router.get("/evaluations/telemetry/stats")
+async def get_llm_telemetry_stats() -> Dict[str, Any]:
+    """获取LLM调用遥测: 按维度和模型统计token、延迟、重试、降级次数与成本分布"""
+    return llm_telemetry.stats()
+
 async def save_evaluation_results(business_plan_id: str, evaluation: Dict[str, Any]):
     """保存评估结果到数据库"""
     supabase = db.get_client()
@@ -19,6 +19,119 @@ class Settings(BaseSettings):
     # DeepSeek配置 (替换Haystack)
     DEEPSEEK_API_KEY: str = os.getenv("DEEPSEEK_API_KEY", "")
     DEEPSEEK_BASE_URL: str = os.getenv("DEEPSEEK_BASE_URL", "https://api.deepseek.com/v1")
+    DEEPSEEK_MODEL: str = os.getenv("DEEPSEEK_MODEL", "deepseek-chat")
+
+    # DeepSeek评估并发配置
+    DEEPSEEK_MAX_CONCURRENCY: int = int(os.getenv("DEEPSEEK_MAX_CONCURRENCY", "5"))
+    DEEPSEEK_DIMENSION_TIMEOUT: float = float(
+        os.getenv("DEEPSEEK_DIMENSION_TIMEOUT", "90")
+    )
+    # 流式返回LLM结果，逐步解析JSON并推送各维度评分进度
+    DEEPSEEK_STREAMING: bool = os.getenv("DEEPSEEK_STREAMING", "True").lower() == "true"
+    # per_dimension: 每个维度单独调用; combined: 一次调用返回全部维度;
+    # cascade: 先用低成本配置逐维度评分，仅对低置信度结果用完整配置重新评估;
+    # map_reduce: 超出上下文预算的长文档先分块并发摘要，再基于合并后的摘要逐维度评分
+    DEEPSEEK_EVALUATION_MODE: str = os.getenv("DEEPSEEK_EVALUATION_MODE", "per_dimension")
+
+    # 文档检索配置: 每个维度按关键词检索相关片段，而不是固定截取前3000字符
+    # DEEPSEEK_SHARED_CONTEXT=True时所有维度共用同一段文档上下文(合并各维度检索结果)，
+    # 使各次调用拥有相同前缀以命中DeepSeek上下文缓存
+    DEEPSEEK_SHARED_CONTEXT: bool = os.getenv("DEEPSEEK_SHARED_CONTEXT", "True").lower() == "true"
+    DEEPSEEK_PREFIX_WARMUP: bool = os.getenv("DEEPSEEK_PREFIX_WARMUP", "False").lower() == "true"
+    DEEPSEEK_CONTEXT_TOKEN_BUDGET: int = int(os.getenv("DEEPSEEK_CONTEXT_TOKEN_BUDGET", "1800"))
+    DEEPSEEK_SHARED_CONTEXT_TOKEN_BUDGET: int = int(
+        os.getenv("DEEPSEEK_SHARED_CONTEXT_TOKEN_BUDGET", "4000")
+    )
+    # 检索分块按估算token数切分(中英文混排时各块token数相近)
+    RETRIEVAL_CHUNK_TOKENS: int = int(os.getenv("RETRIEVAL_CHUNK_TOKENS", "300"))
+    RETRIEVAL_CHUNK_OVERLAP_TOKENS: int = int(os.getenv("RETRIEVAL_CHUNK_OVERLAP_TOKENS", "40"))
+
+    # DeepSeek限流、重试与熔断配置 (状态文件在多个worker之间共享)
+    DEEPSEEK_REQUESTS_PER_MINUTE: int = int(os.getenv("DEEPSEEK_REQUESTS_PER_MINUTE", "60"))
+    DEEPSEEK_TOKENS_PER_MINUTE: int = int(os.getenv("DEEPSEEK_TOKENS_PER_MINUTE", "200000"))
+    DEEPSEEK_MAX_RETRIES: int = int(os.getenv("DEEPSEEK_MAX_RETRIES", "5"))
+    DEEPSEEK_BACKOFF_BASE: float = float(os.getenv("DEEPSEEK_BACKOFF_BASE", "1"))
+    DEEPSEEK_BACKOFF_MAX: float = float(os.getenv("DEEPSEEK_BACKOFF_MAX", "60"))
+    DEEPSEEK_BREAKER_FAILURE_THRESHOLD: int = int(
+        os.getenv("DEEPSEEK_BREAKER_FAILURE_THRESHOLD", "5")
+    )
+    DEEPSEEK_BREAKER_COOLDOWN: float = float(os.getenv("DEEPSEEK_BREAKER_COOLDOWN", "30"))
+    DEEPSEEK_MAX_QUEUE_WAIT: float = float(os.getenv("DEEPSEEK_MAX_QUEUE_WAIT", "600"))
+    DEEPSEEK_RATE_LIMIT_STATE_PATH: str = os.getenv(
+        "DEEPSEEK_RATE_LIMIT_STATE_PATH", "cache/rate_limiter.sqlite3"
+    )
+
+    # 对冲请求: 维度调用超过近期延迟的指定分位数仍未返回时，再发一次相同请求，取先返回者
+    DEEPSEEK_HEDGING_ENABLED: bool = os.getenv("DEEPSEEK_HEDGING_ENABLED", "False").lower() == "true"
+    DEEPSEEK_HEDGE_PERCENTILE: float = float(os.getenv("DEEPSEEK_HEDGE_PERCENTILE", "95"))
+    DEEPSEEK_HEDGE_MAX_EXTRA_RATIO: float = float(os.getenv("DEEPSEEK_HEDGE_MAX_EXTRA_RATIO", "0.1"))
+    DEEPSEEK_HEDGE_MIN_SAMPLES: int = int(os.getenv("DEEPSEEK_HEDGE_MIN_SAMPLES", "20"))
+    DEEPSEEK_HEDGE_WINDOW: int = int(os.getenv("DEEPSEEK_HEDGE_WINDOW", "200"))
+
+    # 批量评估配置: 同一进程内所有评估共享一个LLM调用池，按BP轮转分配
+    DEEPSEEK_GLOBAL_CONCURRENCY: int = int(os.getenv("DEEPSEEK_GLOBAL_CONCURRENCY", "10"))
+    BATCH_MAX_ACTIVE_PLANS: int = int(os.getenv("BATCH_MAX_ACTIVE_PLANS", "10"))
+    BATCH_MAX_ITEMS: int = int(os.getenv("BATCH_MAX_ITEMS", "100"))
+
+    # 分级评估(cascade模式): 快速档使用较短上下文和可单独配置的模型;
+    # 子维度分数不一致、输出需要修复时升级该维度; 总分距60/80分档线不超过阈值时，
+    # 只升级足以使总分越过分档线的维度(阈值按满分比例分摊到各维度)
+    # 注意: DEEPSEEK_CASCADE_FAST_MODEL须设为比DEEPSEEK_MODEL更便宜的模型，分级评估才能节省成本;
+    # 默认与DEEPSEEK_MODEL相同，此时升级的维度相当于调用两次完整模型，cascade模式改按per_dimension模式评估
+    DEEPSEEK_CASCADE_FAST_MODEL: str = os.getenv("DEEPSEEK_CASCADE_FAST_MODEL", "deepseek-chat")
+    DEEPSEEK_CASCADE_FAST_CONTEXT_TOKEN_BUDGET: int = int(
+        os.getenv("DEEPSEEK_CASCADE_FAST_CONTEXT_TOKEN_BUDGET", "1500")
+    )
+    DEEPSEEK_CASCADE_FAST_MAX_TOKENS: int = int(os.getenv("DEEPSEEK_CASCADE_FAST_MAX_TOKENS", "1500"))
+    DEEPSEEK_CASCADE_THRESHOLD_MARGIN: float = float(os.getenv("DEEPSEEK_CASCADE_THRESHOLD_MARGIN", "5"))
+
+    # 长文档摘要评估(map_reduce模式): 按页分块(分块边界由页面内容决定)，每块提取各维度关键事实，
+    # 摘要按分块内容缓存，重新上传有少量修改的文档时只摘要发生变化的分块; 合并摘要不超过DIGEST预算
+    DEEPSEEK_MAP_REDUCE_CHUNK_TOKENS: int = int(os.getenv("DEEPSEEK_MAP_REDUCE_CHUNK_TOKENS", "3000"))
+    DEEPSEEK_MAP_REDUCE_SUMMARY_MAX_TOKENS: int = int(os.getenv("DEEPSEEK_MAP_REDUCE_SUMMARY_MAX_TOKENS", "800"))
+    DEEPSEEK_MAP_REDUCE_DIGEST_TOKEN_BUDGET: int = int(
+        os.getenv("DEEPSEEK_MAP_REDUCE_DIGEST_TOKEN_BUDGET", "6000")
+    )
+
+    # 调用成本估算: 每百万token的美元价格 (输入区分上下文缓存命中/未命中)
+    DEEPSEEK_PRICE_INPUT_CACHE_HIT: float = float(os.getenv("DEEPSEEK_PRICE_INPUT_CACHE_HIT", "0.07"))
+    DEEPSEEK_PRICE_INPUT_CACHE_MISS: float = float(os.getenv("DEEPSEEK_PRICE_INPUT_CACHE_MISS", "0.27"))
+    DEEPSEEK_PRICE_OUTPUT: float = float(os.getenv("DEEPSEEK_PRICE_OUTPUT", "1.10"))
+
+    # PDF解析进程池: 解析在独立进程中执行，避免阻塞事件循环; 超时的解析进程会被终止
+    PDF_EXTRACTION_WORKERS: int = int(os.getenv("PDF_EXTRACTION_WORKERS", "2"))
+    PDF_EXTRACTION_TIMEOUT: float = float(os.getenv("PDF_EXTRACTION_TIMEOUT", "120"))
+    # 页数达到阈值的长文档按页码区间拆分给多个解析进程并行提取;
+    # 开启文本预算时，页数达到PDF_SAMPLING_MIN_PAGES的文档改为按抽样顺序分批，同样由多个解析进程并行提取
+    PDF_PARALLEL_MIN_PAGES: int = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "100"))
+    PDF_MIN_PAGES_PER_WORKER: int = int(os.getenv("PDF_MIN_PAGES_PER_WORKER", "25"))
+    # 解析结果按文件内容SHA-256缓存: 磁盘上为PDF旁的压缩附属文件，内存中保留最近使用的文档
+    DOCUMENT_CACHE_ENTRIES: int = int(os.getenv("DOCUMENT_CACHE_ENTRIES", "32"))
+    # 文本预算(默认关闭): 页数达到PDF_SAMPLING_MIN_PAGES的长文档按目录/页码标签分节轮流抽样页面，
+    # 提取到约PDF_TEXT_BUDGET_TOKENS个token的文本后停止 (附录最后读取; 0表示始终提取全部页面)
+    # 注意: 开启后未读取的页面不参与评估，已读取的页码记录在评估结果的covered_pages中
+    PDF_TEXT_BUDGET_TOKENS: int = int(os.getenv("PDF_TEXT_BUDGET_TOKENS", "0"))
+    PDF_SAMPLING_MIN_PAGES: int = int(os.getenv("PDF_SAMPLING_MIN_PAGES", "60"))
+    # 只含图片、没有文字操作符的页面不做文字提取; 此类页面占比达到该值的文档视为扫描件，直接转人工评审
+    PDF_IMAGE_ONLY_RATIO: float = float(os.getenv("PDF_IMAGE_ONLY_RATIO", "0.8"))
+    # 页眉页脚去除: 在至少PDF_BOILERPLATE_MIN_PAGES页的文档中，出现在该比例以上页面的行(公司名、口号、保密声明、页码等)被删除，
+    # 重复出现的段落只保留第一次 (0表示不处理)
+    PDF_BOILERPLATE_LINE_RATIO: float = float(os.getenv("PDF_BOILERPLATE_LINE_RATIO", "0.5"))
+    PDF_BOILERPLATE_MIN_PAGES: int = int(os.getenv("PDF_BOILERPLATE_MIN_PAGES", "4"))
+    # 章节索引: 上传时按标题、目录和关键词密度切分章节(团队、产品/技术、市场等)，记录字符和页码范围;
+    # 重新评估部分维度时只读取对应章节，任一维度章节不足该字符数时改用全文
+    PDF_SECTION_MIN_CHARS: int = int(os.getenv("PDF_SECTION_MIN_CHARS", "200"))
+    # 流式评估: 按批(每批PDF_STREAM_BATCH_PAGES页)提取页面文本，边提取边评估；
+    # 已读取页面中与某维度相关的文本达到其上下文预算的PDF_STREAMING_READY_FACTOR倍时，该维度提前开始评估
+    PDF_STREAMING_EVALUATION: bool = os.getenv("PDF_STREAMING_EVALUATION", "True").lower() == "true"
+    PDF_STREAM_BATCH_PAGES: int = int(os.getenv("PDF_STREAM_BATCH_PAGES", "10"))
+    PDF_STREAMING_READY_FACTOR: float = float(os.getenv("PDF_STREAMING_READY_FACTOR", "2.0"))
+
+    # LLM响应缓存配置 (相对路径基于backend目录)
+    LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE_ENABLED", "True").lower() == "true"
+    LLM_CACHE_PATH: str = os.getenv("LLM_CACHE_PATH", "cache/llm_cache.sqlite3")
+    LLM_CACHE_MAX_MB: int = int(os.getenv("LLM_CACHE_MAX_MB", "256"))
+    LLM_CACHE_TTL_HOURS: float = float(os.getenv("LLM_CACHE_TTL_HOURS", "720"))
 
     # JWT配置
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "")
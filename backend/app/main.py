@@ -5,7 +5,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 import os
 from .core.config.settings import settings
-from .api.v1 import business_plans, evaluations, projects, scores
+from .api.v1 import batches, business_plans, evaluations, projects, scores
 
 # Load environment variables
 load_dotenv()
@@ -119,6 +119,10 @@ app.include_router(
     evaluations.router, prefix=settings.API_PREFIX, tags=["评估"]
 )
 
+app.include_router(
+    batches.router, prefix=settings.API_PREFIX, tags=["批量评估"]
+)
+
 # Railway deployment requires the app to be available as 'app'
 if __name__ == "__main__":
     import uvicorn
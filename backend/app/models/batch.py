@@ -0,0 +1,44 @@
+# File: backend/app/models/batch.py
+
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from datetime import datetime
+from enum import Enum
+from .evaluation import EvaluationMode
+
+
+class BatchItemStatus(str, Enum):
+    QUEUED = "queued"          # Waiting for a free plan slot
+    PROCESSING = "processing"  # Extraction or evaluation running
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class BatchEvaluationCreate(BaseModel):
+    project_ids: List[str] = Field(..., min_length=1)
+    evaluation_mode: Optional[EvaluationMode] = None
+    force: bool = False  # Bypass the LLM response cache
+
+
+class BatchItem(BaseModel):
+    project_id: str
+    bp_id: Optional[str] = None
+    status: BatchItemStatus = BatchItemStatus.QUEUED
+    dimensions_completed: int = 0
+    total_score: Optional[float] = None
+    error: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+class BatchStatusResponse(BaseModel):
+    batch_id: str
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    total: int
+    queued: int
+    processing: int
+    completed: int
+    failed: int
+    progress: float  # Fraction of items finished, 0-1
+    items: List[BatchItem]
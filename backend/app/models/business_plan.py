@@ -1,7 +1,7 @@
 # File: backend/app/models/business_plan.py
 
 from pydantic import BaseModel, Field, validator
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -34,6 +34,8 @@ class BusinessPlanInDB(BusinessPlanBase):
     upload_time: datetime
     updated_at: datetime
     error_message: Optional[str] = None
+    # Sections of the plan with character and page offsets, built when the plan is extracted
+    section_index: Optional[List[Dict[str, Any]]] = None
 
     class Config:
         from_attributes = True
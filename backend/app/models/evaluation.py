@@ -1,6 +1,21 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Dict, Any, Optional
+import re
 from datetime import datetime
+from enum import Enum
+
+
+class EvaluationMode(str, Enum):
+    PER_DIMENSION = "per_dimension"  # One LLM call per rubric dimension
+    COMBINED = "combined"            # One LLM call returning every dimension
+    CASCADE = "cascade"              # Fast per-dimension pass, full pass on low confidence
+    MAP_REDUCE = "map_reduce"        # Summarize chunks of long plans, score over the digest
+
+class DimensionReevaluationCreate(BaseModel):
+    dimensions: List[str] = Field(..., min_length=1)  # Rubric dimensions to re-run
+    additional_information: str = ""                  # Supplied after review, added to the context
+    resolved_missing_information_ids: List[str] = []  # Marked resolved once the new scores are stored
+    force: bool = False                               # Bypass the LLM response cache
 
 class SubDimensionScore(BaseModel):
     name: str
@@ -26,6 +41,65 @@ class EvaluationResult(BaseModel):
     status: str
     created_at: datetime
 
+# Raw dimension output of the LLM, before it is checked against the rubric.
+# Scores written as strings ("24", "24分", "24/30") are coerced to numbers.
+_NUMBER = re.compile(r'-?\d+(?:\.\d+)?')
+
+
+def _coerce_score(value: Any) -> Any:
+    if isinstance(value, str):
+        match = _NUMBER.search(value)
+        return float(match.group()) if match else None
+    return value
+
+
+class LLMSubDimensionOutput(BaseModel):
+    sub_dimension: str = ""
+    score: Optional[float] = None
+    max_score: Optional[float] = None
+    comments: str = ""
+
+    _coerce_scores = field_validator("score", "max_score", mode="before")(_coerce_score)
+
+    @field_validator("sub_dimension", "comments", mode="before")
+    @classmethod
+    def _coerce_text(cls, v):
+        return "" if v is None else str(v)
+
+
+class LLMMissingInfoOutput(BaseModel):
+    type: str = "其他"
+    description: str = ""
+
+    @field_validator("type", "description", mode="before")
+    @classmethod
+    def _coerce_text(cls, v):
+        return "" if v is None else str(v)
+
+
+class LLMDimensionOutput(BaseModel):
+    score: Optional[float] = None
+    max_score: Optional[float] = None
+    comments: str = ""
+    sub_dimensions: List[LLMSubDimensionOutput] = []
+    missing_info: List[LLMMissingInfoOutput] = []
+
+    _coerce_scores = field_validator("score", "max_score", mode="before")(_coerce_score)
+
+    @field_validator("comments", mode="before")
+    @classmethod
+    def _coerce_text(cls, v):
+        return "" if v is None else str(v)
+
+    @field_validator("missing_info", mode="before")
+    @classmethod
+    def _coerce_missing_info(cls, v):
+        # Models sometimes list plain strings instead of objects
+        if not isinstance(v, list):
+            return []
+        return [{"description": item} if isinstance(item, str) else item for item in v]
+
+
 class EvaluationInDB(EvaluationResult):
     id: str
     updated_at: datetime
\ No newline at end of file
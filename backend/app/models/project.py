@@ -106,13 +106,18 @@ class ProjectListParams(BaseModel):
         extra = "forbid"
 
 
+# Total score boundaries between the status/review bands
+EXCELLENT_SCORE_THRESHOLD = 80
+QUALIFIED_SCORE_THRESHOLD = 60
+
+
 def calculate_status_from_score(total_score: Optional[float]) -> ProjectStatus:
     """Calculate project status based on total score"""
     if total_score is None:
         return ProjectStatus.PROCESSING
-    elif total_score >= 80:
+    elif total_score >= EXCELLENT_SCORE_THRESHOLD:
         return ProjectStatus.COMPLETED
-    elif total_score >= 60:
+    elif total_score >= QUALIFIED_SCORE_THRESHOLD:
         return ProjectStatus.PENDING_REVIEW
     else:
         return ProjectStatus.FAILED
@@ -122,9 +127,9 @@ def calculate_review_result_from_score(total_score: Optional[float]) -> Optional
     """Calculate review result based on total score"""
     if total_score is None:
         return None
-    elif total_score >= 80:
+    elif total_score >= EXCELLENT_SCORE_THRESHOLD:
         return ReviewResult.PASS
-    elif total_score >= 60:
+    elif total_score >= QUALIFIED_SCORE_THRESHOLD:
         return ReviewResult.CONDITIONAL
     else:
         return ReviewResult.FAIL
\ No newline at end of file
@@ -0,0 +1,86 @@
+# File: backend/app/services/document/document_cache.py
+
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from ...core.config.settings import settings
+
+
+class DocumentCache:
+    """
+    Bounded in-memory LRU of parsed documents, keyed by file content hash.
+
+    Hot documents (a plan being evaluated, re-evaluated or reprocessed)
+    are served without touching the sidecar. Content hashes are memoized
+    per path, size and mtime so a file is only hashed again after it
+    changes. Identical files stored under different names share an entry.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max(0, max_entries)
+        self._documents: "OrderedDict[str, Any]" = OrderedDict()
+        self._fingerprints: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def fingerprint(self, file_path: str) -> str:
+        """SHA-256 of the file content"""
+        stat = Path(file_path).stat()
+        with self._lock:
+            known = self._fingerprints.get(file_path)
+            if known and known[:2] == (stat.st_size, stat.st_mtime_ns):
+                self._fingerprints.move_to_end(file_path)
+                return known[2]
+
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        sha256 = digest.hexdigest()
+
+        with self._lock:
+            self._fingerprints[file_path] = (stat.st_size, stat.st_mtime_ns, sha256)
+            self._fingerprints.move_to_end(file_path)
+            while len(self._fingerprints) > max(self.max_entries * 4, 64):
+                self._fingerprints.popitem(last=False)
+        return sha256
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            document = self._documents.get(key)
+            if document is None:
+                self.misses += 1
+                return None
+            self._documents.move_to_end(key)
+            self.hits += 1
+            return document
+
+    def put(self, key: str, document: Any):
+        if not self.max_entries:
+            return
+        with self._lock:
+            self._documents[key] = document
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.max_entries:
+                self._documents.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._documents),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions
+            }
+
+
+# Global instance
+document_cache = DocumentCache(max_entries=settings.DOCUMENT_CACHE_ENTRIES)
@@ -0,0 +1,143 @@
+# File: backend/app/services/document/extraction_pool.py
+
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+from ...core.config.settings import settings
+
+
+class ExtractionTimeoutError(Exception):
+    """Raised when a document job exceeds its timeout and its worker is killed"""
+
+
+class ExtractionPool:
+    """
+    Process pool for CPU-bound PDF parsing, kept off the event loop.
+
+    At most `workers` jobs run at once; further jobs wait on a semaphore so
+    the queue depth is visible and the executor never holds a backlog. A
+    job that exceeds its timeout cannot be cancelled inside its process, so
+    the pool's processes are terminated and the pool is recreated; other
+    jobs that were running in it are resubmitted once to the new pool.
+    Worker processes are spawned (not forked from the threaded server) on
+    first use.
+    """
+
+    def __init__(self, workers: int, timeout: float):
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._generation = 0
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.restarts = 0
+        self.max_queue_depth = 0
+        self.total_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def _restart(self, generation: int):
+        """Kill the worker processes of the given pool generation and start afresh"""
+        if generation != self._generation or self._executor is None:
+            return  # Already restarted by another job
+
+        executor = self._executor
+        self._executor = None
+        self._generation += 1
+        self.restarts += 1
+
+        # ProcessPoolExecutor has no public way to stop a running task
+        for process in list((getattr(executor, "_processes", None) or {}).values()):
+            if process.is_alive():
+                process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None) -> Any:
+        """
+        Run fn(*args) in a worker process
+
+        fn must be a picklable module-level function. Raises
+        ExtractionTimeoutError after timeout seconds (default: the pool's).
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers)
+
+        timeout = self.timeout if timeout is None else timeout
+        enqueued = time.monotonic()
+        self.queued += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queued)
+
+        try:
+            await self._slots.acquire()
+        finally:
+            self.queued -= 1
+
+        started = time.monotonic()
+        self.total_wait_seconds += started - enqueued
+        self.running += 1
+        loop = asyncio.get_running_loop()
+
+        try:
+            for resubmitted in (False, True):
+                generation = self._generation
+                future = loop.run_in_executor(self._get_executor(), fn, *args)
+                try:
+                    result = await asyncio.wait_for(future, timeout=timeout)
+                except asyncio.TimeoutError:
+                    self.timed_out += 1
+                    self._restart(generation)
+                    raise ExtractionTimeoutError(f"Document job exceeded {timeout:.0f}s and was killed")
+                except BrokenProcessPool:
+                    # Another job's timeout (or a crashed worker) took the pool down
+                    self._restart(generation)
+                    if resubmitted:
+                        raise
+                    continue
+
+                self.completed += 1
+                return result
+
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.running -= 1
+            self.total_run_seconds += time.monotonic() - started
+            self._slots.release()
+
+    def stats(self) -> Dict[str, Any]:
+        finished = self.completed + self.failed
+        return {
+            "workers": self.workers,
+            "timeout_seconds": self.timeout,
+            "queue_depth": self.queued,
+            "max_queue_depth": self.max_queue_depth,
+            "running": self.running,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "restarts": self.restarts,
+            "avg_wait_seconds": round(self.total_wait_seconds / finished, 3) if finished else 0.0,
+            "avg_run_seconds": round(self.total_run_seconds / finished, 3) if finished else 0.0
+        }
+
+
+# Global instance
+extraction_pool = ExtractionPool(
+    workers=settings.PDF_EXTRACTION_WORKERS,
+    timeout=settings.PDF_EXTRACTION_TIMEOUT
+)
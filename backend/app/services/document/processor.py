@@ -1,10 +1,270 @@
 # File: backend/app/services/document/processor.py
 
-from typing import List
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+import asyncio
+import gzip
+from contextlib import closing
+import json
 import os
 from pathlib import Path
+from itertools import zip_longest
 import PyPDF2
 import re
+from ...core.config.settings import settings
+from ...utils.token_utils import estimate_tokens
+from .document_cache import document_cache
+from .extraction_pool import extraction_pool
+from .sections import SECTION_OVERVIEW, build_section_index, section_spans
+from .text_processing import BoilerplateFilter, TextChunker, normalize_text
+
+# Page boundary marker kept in the merged document text
+PAGE_MARKER = "\n--- 第{page_number}页 ---\n"
+
+# Parse results are kept next to the PDF as gzip'd JSON lines: the document
+# header, the cleaned document text, then the raw text of each page. They
+# are keyed by the file's SHA-256 and EXTRACTOR_VERSION; bump the version
+# whenever the stored fields, page extraction or text cleaning change.
+PARSED_SIDECAR_SUFFIX = ".parsed.jsonl.gz"
+PARSED_DOCUMENT_VERSION = 5
+EXTRACTOR_VERSION = f"{PARSED_DOCUMENT_VERSION}/PyPDF2-{PyPDF2.__version__}"
+
+# Outline titles and page-label prefixes of appendices, which are read last
+# when a plan is sampled under the text budget
+APPENDIX_PATTERN = re.compile(r'附录|附件|附表|appendix|appendices|annex|exhibit|attachment', re.IGNORECASE)
+
+# Every text-showing operator sits inside a BT ... ET text object
+TEXT_OBJECT_PATTERN = re.compile(rb'(?<![A-Za-z])BT(?![A-Za-z])')
+
+
+class ImageOnlyDocumentError(ValueError):
+    """Raised for plans that are (mostly) scanned images and need manual review"""
+
+
+class ParsedDocument:
+    """
+    Result of parsing a PDF once: validation, page count, encryption,
+    metadata and the raw text of every page.
+
+    Loaded from the sidecar, only the header line is read; the cleaned
+    text and the page texts are each read on first access. Plans parsed
+    under the text budget list their extracted pages in covered_pages;
+    the other pages have empty text. The section index is built with the
+    text and kept in the header, so a section's text can be sliced out
+    without segmenting the document again.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        valid: bool,
+        page_count: int = 0,
+        encrypted: bool = False,
+        metadata: Optional[Dict[str, str]] = None,
+        error: Optional[str] = None,
+        pages: Optional[List[str]] = None,
+        file_size: int = 0,
+        sha256: str = "",
+        covered_pages: Optional[List[int]] = None,
+        image_only_pages: int = 0
+    ):
+        self.file_path = file_path
+        self.valid = valid
+        self.page_count = page_count
+        self.encrypted = encrypted
+        self.metadata = metadata or {}
+        self.error = error
+        self.file_size = file_size
+        # Content hash of the PDF the document was parsed from
+        self.sha256 = sha256
+        # 0-based pages extracted under the text budget; None when all were
+        self.covered_pages = covered_pages
+        # Pages with images but no text operators, never run through the extractor;
+        # plans parsed in several jobs count them only until mostly_images is decided
+        self.image_only_pages = image_only_pages
+        # Whether each page classified by the first parse job is image-only,
+        # handed to the extraction jobs so no page is classified twice
+        self.classified_pages: Dict[int, bool] = {}
+        # Page extraction order chosen by the worker for budgeted plans
+        self.page_plan: Optional[List[int]] = None
+        # What boilerplate stripping removed from the text (see BoilerplateFilter)
+        self.text_stats: Optional[Dict[str, int]] = None
+        # (0-based page, title) of every outline entry, read by the worker
+        self.outline: List[Tuple[int, str]] = []
+        self._sections: Optional[List[Dict[str, Any]]] = None
+        self._pages = pages
+        self._cleaned_pages: Optional[List[str]] = None
+        self._text: Optional[str] = None
+
+    @staticmethod
+    def sidecar_path(file_path: str) -> Path:
+        return Path(file_path).with_suffix(PARSED_SIDECAR_SUFFIX)
+
+    @property
+    def pages(self) -> List[str]:
+        """Raw text of every page, in page order ("" for pages without text)"""
+        if self._pages is None:
+            self._pages = [json.loads(line) for line in self._read_sidecar_lines(2)]
+        return self._pages
+
+    @property
+    def cleaned_pages(self) -> List[str]:
+        if self._cleaned_pages is None:
+            self._cleaned_pages = [clean_extracted_text(page_text) for page_text in self.pages]
+        return self._cleaned_pages
+
+    @property
+    def mostly_images(self) -> bool:
+        """Whether at least PDF_IMAGE_ONLY_RATIO of the pages are image-only (a scanned plan)"""
+        return bool(self.page_count) and self.image_only_pages >= self.page_count * settings.PDF_IMAGE_ONLY_RATIO
+
+    def classified(self, page_indices: Iterable[int]) -> Dict[int, bool]:
+        """classified_pages restricted to the given pages, for an extraction job"""
+        return {
+            page_index: self.classified_pages[page_index]
+            for page_index in page_indices
+            if page_index in self.classified_pages
+        }
+
+    def page_text(self, page_index: int) -> str:
+        """Cleaned text of one page (0-based)"""
+        return self.cleaned_pages[page_index]
+
+    @property
+    def text(self) -> str:
+        """Cleaned text of the whole document with page markers, without repeated boilerplate"""
+        if self._text is None and self._pages is None:
+            with closing(self._read_sidecar_lines(1)) as lines:
+                self._text = json.loads(next(lines))
+        if self._text is None:
+            boilerplate = BoilerplateFilter.from_pages(
+                self.pages,
+                settings.PDF_BOILERPLATE_LINE_RATIO,
+                settings.PDF_BOILERPLATE_MIN_PAGES
+            )
+            self._text = clean_extracted_text("".join(
+                PAGE_MARKER.format(page_number=page_num + 1) + boilerplate.strip(page_text) + "\n"
+                for page_num, page_text in enumerate(self.pages)
+                if page_text
+            ))
+            self.text_stats = boilerplate.stats()
+            if self.text_stats["tokens_saved"]:
+                print(f"🧹 Stripped boilerplate from {self.file_path}: {self.text_stats}")
+        return self._text
+
+    @property
+    def sections(self) -> List[Dict[str, Any]]:
+        """Section index of the text (see build_section_index)"""
+        if self._sections is None:
+            self._sections = build_section_index(self.text, self.pages, self.outline) if self.valid else []
+        return self._sections
+
+    def section_text(self, section_keys: Iterable[str]) -> str:
+        """Text of the given sections, in document order"""
+        return "\n……\n".join(
+            self.text[entry["start"]:entry["end"]].strip()
+            for entry in section_spans(self.sections, section_keys)
+        )
+
+    def info(self) -> Dict[str, Any]:
+        """Document information in the get_document_info format"""
+        if self.error and not self.page_count:
+            return {"error": self.error}
+        info = {
+            "page_count": self.page_count,
+            "encrypted": self.encrypted,
+            "metadata": self.metadata
+        }
+        if self.covered_pages is not None:
+            info["covered_pages"] = [page_index + 1 for page_index in self.covered_pages]
+        if self.text_stats is not None:
+            info["text_stats"] = self.text_stats
+        return info
+
+    def _header(self) -> Dict[str, Any]:
+        return {
+            "extractor_version": EXTRACTOR_VERSION,
+            "sha256": self.sha256,
+            "file_size": self.file_size,
+            "valid": self.valid,
+            "page_count": self.page_count,
+            "encrypted": self.encrypted,
+            "metadata": self.metadata,
+            "error": self.error,
+            "covered_pages": self.covered_pages,
+            "image_only_pages": self.image_only_pages,
+            "text_stats": self.text_stats,
+            "sections": self.sections,
+            "boilerplate_line_ratio": settings.PDF_BOILERPLATE_LINE_RATIO,
+            "boilerplate_min_pages": settings.PDF_BOILERPLATE_MIN_PAGES,
+            "text_budget_tokens": settings.PDF_TEXT_BUDGET_TOKENS if self.covered_pages is not None else None
+        }
+
+    def save(self):
+        """Write the sidecar; a failed write only costs a re-parse later"""
+        sidecar = self.sidecar_path(self.file_path)
+        temp_path = sidecar.with_name(sidecar.name + ".tmp")
+        try:
+            text = self.text  # Builds text_stats (and with sections, the index) for the header
+            with gzip.open(temp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+                f.write(json.dumps(self._header(), ensure_ascii=False) + "\n")
+                f.write(json.dumps(text, ensure_ascii=False) + "\n")
+                for page_text in self.pages:
+                    f.write(json.dumps(page_text, ensure_ascii=False) + "\n")
+            os.replace(temp_path, sidecar)
+        except Exception as e:
+            print(f"⚠️ Failed to save parsed document for {self.file_path}: {str(e)}")
+            temp_path.unlink(missing_ok=True)
+
+    @classmethod
+    def load(cls, file_path: str, sha256: str) -> Optional["ParsedDocument"]:
+        """Read the sidecar header; None when missing, from another extractor or another file content"""
+        try:
+            with gzip.open(cls.sidecar_path(file_path), "rt", encoding="utf-8") as f:
+                header = json.loads(f.readline())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable parsed document for {file_path}: {str(e)}")
+            return None
+
+        if header.get("extractor_version") != EXTRACTOR_VERSION or header.get("sha256") != sha256:
+            return None
+        if header.get("covered_pages") is not None and header.get("text_budget_tokens") != settings.PDF_TEXT_BUDGET_TOKENS:
+            return None  # Sampled under another budget
+        if (
+            header.get("boilerplate_line_ratio") != settings.PDF_BOILERPLATE_LINE_RATIO
+            or header.get("boilerplate_min_pages") != settings.PDF_BOILERPLATE_MIN_PAGES
+        ):
+            return None  # Text stripped under other settings
+
+        document = cls(
+            file_path,
+            valid=header["valid"],
+            page_count=header["page_count"],
+            encrypted=header["encrypted"],
+            metadata=header["metadata"],
+            error=header.get("error"),
+            file_size=header["file_size"],
+            sha256=sha256,
+            covered_pages=header.get("covered_pages"),
+            image_only_pages=header.get("image_only_pages", 0)
+        )
+        document.text_stats = header.get("text_stats")
+        document._sections = header.get("sections")
+        return document
+
+    def _read_sidecar_lines(self, skip: int) -> Iterator[str]:
+        """Stream sidecar lines after the first `skip` ones"""
+        with gzip.open(self.sidecar_path(self.file_path), "rt", encoding="utf-8") as f:
+            for _ in range(skip):
+                f.readline()
+            yield from f
+
+
+def clean_extracted_text(text: str) -> str:
+    """Clean and normalize extracted text"""
+    return document_processor._clean_extracted_text(text)
+
 
 class DocumentProcessor:
     def __init__(self):
@@ -13,17 +273,348 @@ class DocumentProcessor:
     async def extract_text_from_pdf(self, file_path: str) -> str:
         """
         Extract text from PDF file using PyPDF2
+
+        The PDF is parsed at most once (see parse_document); unreadable,
+        timed-out or text-poor documents return the fallback text. Scanned
+        plans raise ImageOnlyDocumentError so they go to manual review
+        instead of being evaluated from the fallback text.
         """
         try:
-            file_path_obj = Path(file_path)
+            document = await self.parse_document(file_path)
+            if document.error:
+                raise ValueError(document.error)
+            self._check_not_scanned(document)
+
+            cleaned_text = document.text
+            if len(cleaned_text.strip()) < 100:
+                print("⚠️ Very little text extracted, PDF might be image-based")
+                return self._generate_fallback_text(file_path, document.file_size)
+
+            covered = len(document.covered_pages) if document.covered_pages is not None else document.page_count
+            print(f"✅ Using {len(cleaned_text)} characters extracted from {covered} of {document.page_count} pages")
+            return cleaned_text
+
+        except ImageOnlyDocumentError:
+            raise
+        except Exception as e:
+            print(f"❌ Failed to extract text from PDF: {str(e)}")
+            # Return fallback text for evaluation
+            return self._generate_fallback_text(file_path, self._file_size(file_path))
+
+    def _check_not_scanned(self, document: ParsedDocument):
+        if document.mostly_images:
+            print(f"🖼️ {document.image_only_pages} of {document.page_count} pages are image-only, flagging for manual review")
+            raise ImageOnlyDocumentError(
+                f"文档{document.page_count}页中有{document.image_only_pages}页为图片(扫描件)，无法提取文字"
+            )
+
+    async def parse_document(self, file_path: str) -> ParsedDocument:
+        """
+        Return the parsed document, parsing the PDF only on a cache miss
+
+        Documents are looked up by content hash in the in-memory LRU, then
+        in the sidecar; only when both miss is the PDF parsed. Parsing
+        runs in the extraction process pool. With PDF_TEXT_BUDGET_TOKENS
+        set, plans of at least PDF_SAMPLING_MIN_PAGES pages are read under
+        the budget in batches spread across the workers (see _plan_pages).
+        Otherwise plans of at least PDF_PARALLEL_MIN_PAGES pages are cut
+        into page ranges extracted concurrently (each worker opens the file
+        itself) and merged back in page order. Raises
+        ExtractionTimeoutError on runaway parses.
+        """
+        sha256, document = await self._cached_document(file_path)
+        if document is not None:
+            return document
+
+        # Short plans (or a single-worker pool) are parsed by this first job entirely
+        max_pages = settings.PDF_PARALLEL_MIN_PAGES - 1 if extraction_pool.workers > 1 else None
+        if settings.PDF_TEXT_BUDGET_TOKENS > 0:
+            sampling_max_pages = settings.PDF_SAMPLING_MIN_PAGES - 1
+            max_pages = sampling_max_pages if max_pages is None else min(max_pages, sampling_max_pages)
+        document = await extraction_pool.run(_parse_in_worker, file_path, max_pages)
+
+        if document.valid and document.page_plan is not None:
+            async for _ in self._extract_planned_pages(document, sha256):
+                pass
+            return document
+
+        if document.valid and document._pages is None:
+            ranges = self._page_ranges(document.page_count)
+            print(f"📖 Splitting {document.page_count} pages across {len(ranges)} extraction workers")
+            slices = await asyncio.gather(*(
+                extraction_pool.run(
+                    _extract_pages_in_worker, file_path, list(range(start, end)), document.classified(range(start, end))
+                )
+                for start, end in ranges
+            ))
+            document._pages = [page_text for slice_pages in slices for page_text in slice_pages]
+
+        if document._pages is None:
+            document._pages = []
+
+        await self._store_document(document, sha256)
+        return document
+
+    async def stream_pages(self, file_path: str) -> AsyncIterator[str]:
+        """
+        Yield the cleaned text of each page, in page order, as it is parsed
+
+        Cached documents are replayed from memory or the sidecar. Otherwise
+        pages are extracted in batches of PDF_STREAM_BATCH_PAGES, with up
+        to one batch per pool worker in flight ahead of the consumer; the
+        parsed document is stored once the last page has been read. Plans
+        sampled under the text budget yield only their covered pages, in
+        sampling order rather than page order. Raises ValueError for unreadable PDFs and ExtractionTimeoutError
+        on runaway parses.
+        """
+        async for _, page_text in self._stream_raw_pages(file_path):
+            yield clean_extracted_text(page_text)
 
+    async def stream_text_from_pdf(self, file_path: str) -> AsyncIterator[str]:
+        """
+        Streaming counterpart of extract_text_from_pdf
+
+        Yields the document text page by page (cleaned, with page markers).
+        Boilerplate is detected over the pages read so far, so nothing is
+        yielded before PDF_BOILERPLATE_MIN_PAGES pages and at least 100
+        characters were read; joined with spaces the pieces then closely
+        match extract_text_from_pdf's result (in sampling order for plans
+        sampled under the text budget). Image-only or unreadable documents
+        yield only the fallback text. A failure after the first piece is
+        raised, so an evaluation is never scored on part of the plan
+        unnoticed. Scanned plans raise ImageOnlyDocumentError before the
+        first page.
+        """
+        boilerplate = BoilerplateFilter(settings.PDF_BOILERPLATE_LINE_RATIO, settings.PDF_BOILERPLATE_MIN_PAGES)
+
+        def render(page_number: int, page_text: str) -> str:
+            return clean_extracted_text(
+                PAGE_MARKER.format(page_number=page_number) + boilerplate.strip(page_text) + "\n"
+            )
+
+        buffered_pages: List[Tuple[int, str]] = []
+        buffered = 0
+        streaming = False
+        try:
+            async for page_number, page_text in self._stream_raw_pages(file_path):
+                if not page_text:
+                    continue
+                boilerplate.learn(page_text)
+                if streaming:
+                    yield render(page_number, page_text)
+                    continue
+                buffered_pages.append((page_number, page_text))
+                buffered += len(clean_extracted_text(page_text))
+                if buffered >= 100 and boilerplate.pages_seen >= boilerplate.min_pages:
+                    streaming = True
+                    for buffered_page in buffered_pages:
+                        yield render(*buffered_page)
+                    buffered_pages = []
+
+        except ImageOnlyDocumentError:
+            raise
+        except Exception as e:
+            if streaming:
+                print(f"❌ Text extraction failed after {boilerplate.pages_seen} pages: {str(e)}")
+                raise
+            print(f"❌ Failed to extract text from PDF: {str(e)}")
+            yield self._generate_fallback_text(file_path, self._file_size(file_path))
+            return
+
+        if not streaming:
+            # Short plans: everything read, decide on the whole text
+            pieces = [render(*buffered_page) for buffered_page in buffered_pages]
+            if len(" ".join(pieces)) < 100:
+                print("⚠️ Very little text extracted, PDF might be image-based")
+                yield self._generate_fallback_text(file_path, self._file_size(file_path))
+                return
+            for piece in pieces:
+                yield piece
+
+        if boilerplate.tokens_saved:
+            print(f"🧹 Stripped boilerplate from {file_path}: {boilerplate.stats()}")
+
+    async def _stream_raw_pages(self, file_path: str) -> AsyncIterator[Tuple[int, str]]:
+        """(1-based page number, raw page text) pairs; see stream_pages"""
+        batch_pages = max(1, settings.PDF_STREAM_BATCH_PAGES)
+        sha256, document = await self._cached_document(file_path)
+
+        if document is None:
+            # Plans of a single batch are parsed by the first job entirely
+            document = await extraction_pool.run(_parse_in_worker, file_path, batch_pages)
+            if not document.valid or document._pages is not None:
+                if document._pages is None:
+                    document._pages = []
+                await self._store_document(document, sha256)
+
+        if not document.valid:
+            raise ValueError(document.error)
+        self._check_not_scanned(document)
+
+        if document.sha256:
+            # Cached (reprocess runs, re-uploads of the same file) or fully parsed
+            covered = set(document.covered_pages or range(document.page_count))
+            print(f"📖 Reading {len(covered)} parsed pages of {file_path}")
+            for page_index, page_text in enumerate(document.pages):
+                if page_index in covered:
+                    yield page_index + 1, page_text
+            return
+
+        if document.page_plan is not None:
+            async for page in self._extract_planned_pages(document, sha256):
+                yield page
+            return
+
+        page_order = list(range(document.page_count))
+        batches = [page_order[start:start + batch_pages] for start in range(0, document.page_count, batch_pages)]
+        print(f"📖 Streaming {document.page_count} pages in {len(batches)} batches")
+        async for page in self._extract_batches(document, batches, sha256):
+            yield page
+
+    async def _extract_planned_pages(self, document: ParsedDocument, sha256: str) -> AsyncIterator[Tuple[int, str]]:
+        """Extract a budgeted plan's pages in sampling order until PDF_TEXT_BUDGET_TOKENS is reached"""
+        batch_pages = max(1, settings.PDF_STREAM_BATCH_PAGES)
+        plan = document.page_plan
+        batches = [plan[start:start + batch_pages] for start in range(0, len(plan), batch_pages)]
+        print(f"📖 Sampling {document.page_count} pages up to {settings.PDF_TEXT_BUDGET_TOKENS} tokens of text")
+        async for page in self._extract_batches(document, batches, sha256, settings.PDF_TEXT_BUDGET_TOKENS):
+            yield page
+
+    async def _extract_batches(
+        self,
+        document: ParsedDocument,
+        batches: List[List[int]],
+        sha256: str,
+        token_budget: int = 0
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Extract page batches in the pool and yield (page number, raw text)
+
+        Up to one batch per pool worker is in flight ahead of the consumer.
+        With a token_budget no further batch is started once the cleaned
+        text read reaches it; pages never extracted stay empty and the
+        extracted ones are recorded in covered_pages. The document is
+        stored once the extraction is complete.
+        """
+        pages = [""] * document.page_count
+        covered: List[int] = []
+        collected_tokens = 0
+
+        def submit(batch: List[int]) -> Tuple[List[int], asyncio.Future]:
+            return batch, asyncio.ensure_future(
+                extraction_pool.run(_extract_pages_in_worker, document.file_path, batch, document.classified(batch))
+            )
+
+        pending = [submit(batch) for batch in batches[:extraction_pool.workers]]
+        next_batch = len(pending)
+        try:
+            while pending:
+                batch, future = pending.pop(0)
+                for page_index, page_text in zip(batch, await future):
+                    pages[page_index] = page_text
+                    covered.append(page_index)
+                    if token_budget:
+                        collected_tokens += estimate_tokens(clean_extracted_text(page_text))
+                    yield page_index + 1, page_text
+
+                if token_budget and collected_tokens >= token_budget:
+                    break
+                if next_batch < len(batches):
+                    pending.append(submit(batches[next_batch]))
+                    next_batch += 1
+        finally:
+            # The budget was reached, the consumer stopped early or a batch failed
+            for _, future in pending:
+                if future.done() and not future.cancelled():
+                    future.exception()
+                future.cancel()
+
+        document._pages = pages
+        if len(covered) < document.page_count:
+            document.covered_pages = sorted(covered)
+            print(f"✂️ Text budget reached after {len(covered)} of {document.page_count} pages")
+        await self._store_document(document, sha256)
+
+    async def _cached_document(self, file_path: str) -> Tuple[str, Optional[ParsedDocument]]:
+        """Content hash of the file and its parsed document from the LRU or sidecar, if any"""
+        sha256 = await asyncio.to_thread(document_cache.fingerprint, file_path)
+        cache_key = f"{sha256}:{EXTRACTOR_VERSION}"
+
+        document = document_cache.get(cache_key)
+        if document is not None:
+            if document.file_path != file_path:
+                # Same content stored under another name
+                document = await asyncio.to_thread(self._adopt, document, file_path)
+            return sha256, document
+
+        document = await asyncio.to_thread(ParsedDocument.load, file_path, sha256)
+        if document is not None:
+            document_cache.put(cache_key, document)
+        return sha256, document
+
+    async def _store_document(self, document: ParsedDocument, sha256: str):
+        document.sha256 = sha256
+        await asyncio.to_thread(document.save)
+        document_cache.put(f"{sha256}:{EXTRACTOR_VERSION}", document)
+
+    def parse_document_sync(self, file_path: str) -> ParsedDocument:
+        """parse_document in the current process, for synchronous callers"""
+        sha256 = document_cache.fingerprint(file_path)
+        cache_key = f"{sha256}:{EXTRACTOR_VERSION}"
+
+        document = document_cache.get(cache_key)
+        if document is not None:
+            return self._adopt(document, file_path) if document.file_path != file_path else document
+
+        document = ParsedDocument.load(file_path, sha256)
+        if document is None:
+            document = self.parse_pdf_sync(file_path)
+            document.sha256 = sha256
+            document.save()
+        document_cache.put(cache_key, document)
+        return document
+
+    def _adopt(self, document: ParsedDocument, file_path: str) -> ParsedDocument:
+        """Copy a cached parse for another file with the same content, with its own sidecar"""
+        adopted = ParsedDocument(
+            file_path,
+            valid=document.valid,
+            page_count=document.page_count,
+            encrypted=document.encrypted,
+            metadata=document.metadata,
+            error=document.error,
+            pages=document.pages,
+            file_size=document.file_size,
+            sha256=document.sha256,
+            covered_pages=document.covered_pages,
+            image_only_pages=document.image_only_pages
+        )
+        adopted.outline = document.outline
+        adopted._sections = document.sections
+        adopted.save()
+        return adopted
+
+    def parse_pdf_sync(self, file_path: str, max_pages: Optional[int] = None) -> ParsedDocument:
+        """
+        Parse a PDF in the current process
+
+        Never raises for unreadable files: the problem is recorded in
+        error and valid is False. When the document has more than
+        max_pages pages, the page texts are left unextracted (None) so the
+        caller can split the work; if the text budget applies to it, the
+        order to extract its pages in is left in page_plan.
+        """
+        file_path_obj = Path(file_path)
+        document = ParsedDocument(file_path, valid=False)
+
+        try:
             # Check if file exists
             if not file_path_obj.exists():
                 raise FileNotFoundError(f"PDF file not found: {file_path}")
 
             # Check file size
-            file_size = file_path_obj.stat().st_size
-            if file_size == 0:
+            document.file_size = file_path_obj.stat().st_size
+            if document.file_size == 0:
                 raise ValueError("PDF file is empty")
 
             # Check if it's actually a PDF (basic check)
@@ -32,15 +623,13 @@ class DocumentProcessor:
                 if not header.startswith(b'%PDF'):
                     raise ValueError("File is not a valid PDF")
 
-            print(f"📄 Extracting text from PDF: {file_path} ({file_size} bytes)")
-
-            # Extract text using PyPDF2
-            extracted_text = ""
+            print(f"📄 Parsing PDF: {file_path} ({document.file_size} bytes)")
 
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
 
                 # Check if PDF is encrypted
+                document.encrypted = pdf_reader.is_encrypted
                 if pdf_reader.is_encrypted:
                     print("⚠️ PDF is encrypted, attempting to decrypt...")
                     try:
@@ -48,61 +637,256 @@ class DocumentProcessor:
                     except:
                         raise ValueError("PDF is password protected and cannot be read")
 
-                # Extract text from all pages
-                total_pages = len(pdf_reader.pages)
-                print(f"📖 Processing {total_pages} pages...")
+                document.page_count = len(pdf_reader.pages)
+                document.metadata = self._read_metadata(pdf_reader)
+                document.outline = self._read_outline(pdf_reader, document.page_count, nested=True)
 
-                for page_num, page in enumerate(pdf_reader.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            extracted_text += f"\n--- 第{page_num + 1}页 ---\n"
-                            extracted_text += page_text
-                            extracted_text += "\n"
-                    except Exception as e:
-                        print(f"⚠️ Error extracting text from page {page_num + 1}: {str(e)}")
-                        continue
-
-            # Clean and process the extracted text
-            cleaned_text = self._clean_extracted_text(extracted_text)
+                # Check if we can access at least one page
+                if document.page_count == 0:
+                    raise ValueError("PDF has no pages")
+
+                if max_pages is not None and document.page_count > max_pages:
+                    document.classified_pages = self._classify_until_decided(pdf_reader, document.page_count)
+                    document.image_only_pages = sum(document.classified_pages.values())
+                    if document.mostly_images:
+                        # A scanned plan: nothing worth running the extractor on
+                        print(f"🖼️ {document.image_only_pages} of {document.page_count} pages are image-only, skipping text extraction")
+                        document._pages = [""] * document.page_count
+                    else:
+                        # Still make sure the first page can be read
+                        pdf_reader.pages[0].extract_text()
+                        if settings.PDF_TEXT_BUDGET_TOKENS > 0 and document.page_count >= settings.PDF_SAMPLING_MIN_PAGES:
+                            document.page_plan = self._plan_pages(pdf_reader, document.page_count)
+                else:
+                    print(f"📖 Processing {document.page_count} pages...")
+                    image_only: Dict[int, bool] = {}
+                    document._pages = self._extract_page_texts(pdf_reader, range(document.page_count), image_only)
+                    document.image_only_pages = sum(image_only.values())
+
+            document.valid = True
 
-            if len(cleaned_text.strip()) < 100:
-                print("⚠️ Very little text extracted, PDF might be image-based")
-                return self._generate_fallback_text(file_path, file_size)
+        except Exception as e:
+            print(f"❌ Failed to parse PDF: {str(e)}")
+            document.error = str(e)
+
+        return document
+
+    def extract_pages_sync(
+        self,
+        file_path: str,
+        page_indices: List[int],
+        image_only: Optional[Dict[int, bool]] = None
+    ) -> List[str]:
+        """Extract the raw text of the given 0-based pages in the current process (see _extract_page_texts)"""
+        with open(file_path, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            if pdf_reader.is_encrypted:
+                pdf_reader.decrypt("")
+            print(f"📄 Extracting {len(page_indices)} pages from page {page_indices[0] + 1} of {file_path}")
+            return self._extract_page_texts(pdf_reader, page_indices, dict(image_only or {}))
+
+    def _extract_page_texts(
+        self,
+        pdf_reader: PyPDF2.PdfReader,
+        page_indices: Iterable[int],
+        image_only: Optional[Dict[int, bool]] = None
+    ) -> List[str]:
+        """
+        Raw text of the given pages
 
-            print(f"✅ Successfully extracted {len(cleaned_text)} characters from PDF")
-            return cleaned_text
+        image_only holds whether already classified pages are image-only;
+        the other pages are classified here and added to it. Image-only
+        pages would only yield "" and are not run through the extractor.
+        """
+        if image_only is None:
+            image_only = {}
+        page_texts = []
+        for page_num in page_indices:
+            try:
+                page = pdf_reader.pages[page_num]
+                if page_num not in image_only:
+                    has_text, has_image = self._classify_page(page)
+                    image_only[page_num] = has_image and not has_text
+                page_texts.append("" if image_only[page_num] else (page.extract_text() or ""))
+            except Exception as e:
+                print(f"⚠️ Error extracting text from page {page_num + 1}: {str(e)}")
+                page_texts.append("")
+        return page_texts
+
+    def _classify_until_decided(self, pdf_reader: PyPDF2.PdfReader, page_count: int) -> Dict[int, bool]:
+        """
+        Whether each page is image-only, for pages in order until mostly_images is decided
 
-        except Exception as e:
-            print(f"❌ Failed to extract text from PDF: {str(e)}")
-            # Return fallback text for evaluation
-            return self._generate_fallback_text(file_path, file_size)
+        Stops once PDF_IMAGE_ONLY_RATIO of the pages are image-only or too
+        few pages remain to get there, so a text plan is only scanned
+        until its first text pages rule the ratio out.
+        """
+        threshold = page_count * settings.PDF_IMAGE_ONLY_RATIO
+        image_only: Dict[int, bool] = {}
+        found = 0
+        for page_index in range(page_count):
+            if found >= threshold or found + page_count - page_index < threshold:
+                break
+            has_text, has_image = self._classify_page(pdf_reader.pages[page_index])
+            image_only[page_index] = has_image and not has_text
+            found += image_only[page_index]
+        return image_only
 
-    def _clean_extracted_text(self, text: str) -> str:
-        """Clean and normalize extracted text"""
-        if not text:
-            return ""
+    def _classify_page(self, page: PyPDF2.PageObject) -> Tuple[bool, bool]:
+        """
+        (has text, has images) of a page, from its raw content streams
 
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        Looks for BT text objects in the page and the form XObjects it
+        draws, nested forms included, and for image XObjects in their
+        resources, without interpreting any operator. Unreadable pages
+        count as having text so the extractor still runs.
+        """
+        try:
+            streams = []
+            contents = page.get_contents()
+            if contents is not None:
+                streams.append(contents.get_data())
+
+            has_image = self._collect_xobjects(page.get("/Resources"), streams, set())
+            has_text = any(TEXT_OBJECT_PATTERN.search(stream) for stream in streams)
+            return has_text, has_image
+        except Exception:
+            return True, False
+
+    def _collect_xobjects(self, resources: Any, streams: List[bytes], seen: set) -> bool:
+        """Add the content of the form XObjects in resources (recursively) to streams; whether any image is among them"""
+        xobjects = resources.get_object().get("/XObject") if resources is not None else None
+        has_image = False
+        for xobject in (xobjects.get_object().values() if xobjects is not None else []):
+            xobject = xobject.get_object()
+            if id(xobject) in seen:
+                continue  # Forms shared between (or drawing) each other
+            seen.add(id(xobject))
+            subtype = xobject.get("/Subtype")
+            if subtype == "/Image":
+                has_image = True
+            elif subtype == "/Form":
+                streams.append(xobject.get_data())
+                has_image = self._collect_xobjects(xobject.get("/Resources"), streams, seen) or has_image
+        return has_image
+
+    def _read_metadata(self, pdf_reader: PyPDF2.PdfReader) -> Dict[str, str]:
+        # Extract metadata if available
+        if not pdf_reader.metadata:
+            return {}
+        metadata = pdf_reader.metadata
+        return {
+            "title": str(metadata.get("/Title", "")),
+            "author": str(metadata.get("/Author", "")),
+            "subject": str(metadata.get("/Subject", "")),
+            "creator": str(metadata.get("/Creator", "")),
+            "producer": str(metadata.get("/Producer", "")),
+            "creation_date": str(metadata.get("/CreationDate", "")),
+            "modification_date": str(metadata.get("/ModDate", ""))
+        }
+
+    def _plan_pages(self, pdf_reader: PyPDF2.PdfReader, page_count: int) -> List[int]:
+        """
+        Order to read a long plan's pages in under the text budget
 
-        # Remove page breaks and form feeds
-        text = re.sub(r'[\f\r]', '\n', text)
+        The plan is cut into sections at its top-level outline entries,
+        else at its page-label ranges, else into beginning, middle and
+        end thirds. Sections are read round-robin from their first pages,
+        so every part of the plan is sampled before any one is read in
+        full; appendix sections (by title or label) come last.
+        """
+        starts = self._outline_sections(pdf_reader, page_count) or self._page_label_sections(pdf_reader, page_count)
+        if len(starts) < 2:
+            starts = [(page_count * part // 3, False) for part in range(3)]
+        if starts[0][0] > 0:
+            starts.insert(0, (0, False))
+
+        sections, appendices = [], []
+        for (start, appendix), (end, _) in zip(starts, starts[1:] + [(page_count, False)]):
+            (appendices if appendix else sections).append(range(start, end))
+
+        return [
+            page_index
+            for group in (sections, appendices)
+            for round_pages in zip_longest(*group)
+            for page_index in round_pages
+            if page_index is not None
+        ]
+
+    def _outline_sections(self, pdf_reader: PyPDF2.PdfReader, page_count: int) -> List[Tuple[int, bool]]:
+        """(first page, is appendix) of each top-level outline entry"""
+        sections: Dict[int, bool] = {}
+        for page_index, title in self._read_outline(pdf_reader, page_count):
+            sections.setdefault(page_index, bool(APPENDIX_PATTERN.search(title)))
+        return sorted(sections.items())
+
+    def _read_outline(self, pdf_reader: PyPDF2.PdfReader, page_count: int, nested: bool = False) -> List[Tuple[int, str]]:
+        """(0-based page, title) of the top-level outline entries (all entries when nested), in outline order"""
+        entries = []
+
+        def walk(items: list):
+            for item in items:
+                if isinstance(item, list):
+                    # Children of the previous entry
+                    if nested:
+                        walk(item)
+                    continue
+                page_index = pdf_reader.get_destination_page_number(item)
+                if 0 <= page_index < page_count:
+                    entries.append((page_index, str(item.title or "")))
 
-        # Normalize line breaks
-        text = re.sub(r'\n\s*\n', '\n\n', text)
+        try:
+            walk(pdf_reader.outline)
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable PDF outline: {str(e)}")
+            return []
+        return entries
 
-        # Remove very short lines that are likely headers/footers
-        lines = text.split('\n')
-        cleaned_lines = []
+    def _page_label_sections(self, pdf_reader: PyPDF2.PdfReader, page_count: int) -> List[Tuple[int, bool]]:
+        """
+        (first page, is appendix) of each page-label range
 
-        for line in lines:
-            line = line.strip()
-            # Keep lines that are substantial or contain Chinese characters
-            if len(line) > 3 or any('\u4e00' <= char <= '\u9fff' for char in line):
-                cleaned_lines.append(line)
+        Ranges after the first decimal-numbered one that are prefixed or
+        not decimal (A-1, B, ...) count as appendices, as do ranges with
+        an appendix prefix; roman-numbered front matter does not.
+        """
+        try:
+            labels = pdf_reader.trailer["/Root"].get_object().get("/PageLabels")
+            if labels is None:
+                return []
+            numbers = list(labels.get_object().get("/Nums", []))
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable PDF page labels: {str(e)}")
+            return []
 
-        return '\n'.join(cleaned_lines).strip()
+        sections = []
+        seen_decimal = False
+        for start, label in zip(numbers[::2], numbers[1::2]):
+            label = label.get_object()
+            style = label.get("/S")
+            prefix = str(label.get("/P", ""))
+            appendix = bool(APPENDIX_PATTERN.search(prefix)) or (seen_decimal and (style != "/D" or bool(prefix)))
+            seen_decimal = seen_decimal or style == "/D"
+            if 0 <= int(start) < page_count:
+                sections.append((int(start), appendix))
+        return sections
+
+    def _page_ranges(self, page_count: int) -> List[Tuple[int, int]]:
+        """Even page ranges, one per worker, none shorter than PDF_MIN_PAGES_PER_WORKER"""
+        min_pages = max(1, settings.PDF_MIN_PAGES_PER_WORKER)
+        slices = max(1, min(extraction_pool.workers, page_count // min_pages))
+        bounds = [page_count * index // slices for index in range(slices + 1)]
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    def _file_size(self, file_path: str) -> int:
+        try:
+            return Path(file_path).stat().st_size
+        except OSError:
+            return 0
+
+    def _clean_extracted_text(self, text: str) -> str:
+        """Clean and normalize extracted text"""
+        return normalize_text(text)
 
     def _generate_fallback_text(self, file_path: str, file_size: int) -> str:
         """Generate fallback text when extraction fails"""
@@ -127,49 +911,54 @@ class DocumentProcessor:
 请评审专家手动查看原始PDF文件进行评分。
 """
 
-    def chunk_text(self, text: str, chunk_size: int = 4000, overlap: int = 200) -> List[str]:
-        """Split text into manageable chunks for processing"""
-        if not text:
-            return []
-
-        # Remove excessive whitespace first
-        text = re.sub(r'\s+', ' ', text).strip()
-
-        chunks = []
-        text_length = len(text)
-
-        if text_length <= chunk_size:
-            return [text]
-
-        start = 0
-        while start < text_length:
-            end = start + chunk_size
-
-            if end > text_length:
-                end = text_length
-
-            # Try to break at sentence boundaries for Chinese text
-            if end < text_length:
-                # Look for sentence endings in Chinese (。！？) or English (.!?)
-                for i in range(end, max(start + chunk_size - 200, start), -1):
-                    if text[i] in '。！？.!?':
-                        end = i + 1
-                        break
+    async def get_section_index(self, file_path: str) -> List[Dict[str, Any]]:
+        """Section index of a plan (see build_section_index), built when the plan is first parsed"""
+        document = await self.parse_document(file_path)
+        return document.sections
+
+    async def extract_section_text(
+        self,
+        file_path: str,
+        section_keys: Iterable[str],
+        min_chars: int = 0,
+        with_overview: bool = False
+    ) -> Optional[str]:
+        """
+        Text of the given sections only, sliced out by the section index
 
-            chunk = text[start:end].strip()
-            if chunk:
-                chunks.append(chunk)
+        with_overview adds the plan's opening overview. Returns None when
+        any of the sections covers fewer than min_chars characters (or
+        none at all), so the caller can fall back to the whole text.
+        """
+        document = await self.parse_document(file_path)
+        section_keys = list(section_keys)
+        covered: Dict[str, int] = dict.fromkeys(section_keys, 0)
+        for entry in section_spans(document.sections, section_keys):
+            covered[entry["section"]] += entry["end"] - entry["start"]
+        if not section_keys or any(chars < max(1, min_chars) for chars in covered.values()):
+            return None
+        return document.section_text([SECTION_OVERVIEW, *section_keys] if with_overview else section_keys)
 
-            if end == text_length:
-                break
+    def chunk_text(self, text: str, chunk_size: int = 4000, overlap: int = 200) -> List[str]:
+        """Split text into manageable chunks for processing"""
+        return TextChunker(text).chunks(chunk_size, overlap)
 
-            # Set next start position with overlap
-            start = max(end - overlap, start + 1)
+    async def validate_pdf(self, file_path: str) -> bool:
+        """
+        Validate a PDF in the extraction pool; timeouts count as invalid
 
-        return chunks
+        Only the checks of validate_pdf_file run, so uploads stay cheap:
+        the full parse (and the sidecar) is left to the background
+        extraction.
+        """
+        try:
+            return await extraction_pool.run(_validate_in_worker, file_path)
+        except Exception as e:
+            print(f"PDF validation error: {str(e)}")
+            return False
 
     def validate_pdf_file(self, file_path: str) -> bool:
-        """Validate if file is a proper PDF and can be read"""
+        """Validate if file is a proper PDF and can be read: header, page count and first page only"""
         try:
             file_path_obj = Path(file_path)
 
@@ -189,18 +978,16 @@ class DocumentProcessor:
             # Try to open with PyPDF2
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
+                if pdf_reader.is_encrypted:
+                    pdf_reader.decrypt("")  # Same empty password as parse_pdf_sync
 
                 # Check if we can access at least one page
                 if len(pdf_reader.pages) == 0:
                     return False
 
                 # Try to read first page
-                try:
-                    first_page = pdf_reader.pages[0]
-                    _ = first_page.extract_text()
-                    return True
-                except:
-                    return False
+                pdf_reader.pages[0].extract_text()
+                return True
 
         except Exception as e:
             print(f"PDF validation error: {str(e)}")
@@ -208,34 +995,25 @@ class DocumentProcessor:
 
     def get_document_info(self, file_path: str) -> dict:
         """Get metadata information from PDF document"""
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
+        return self.parse_document_sync(file_path).info()
 
-                info = {
-                    "page_count": len(pdf_reader.pages),
-                    "encrypted": pdf_reader.is_encrypted,
-                    "metadata": {}
-                }
-
-                # Extract metadata if available
-                if pdf_reader.metadata:
-                    metadata = pdf_reader.metadata
-                    info["metadata"] = {
-                        "title": metadata.get("/Title", ""),
-                        "author": metadata.get("/Author", ""),
-                        "subject": metadata.get("/Subject", ""),
-                        "creator": metadata.get("/Creator", ""),
-                        "producer": metadata.get("/Producer", ""),
-                        "creation_date": str(metadata.get("/CreationDate", "")),
-                        "modification_date": str(metadata.get("/ModDate", ""))
-                    }
-
-                return info
+# Global instance
+document_processor = DocumentProcessor()
 
-        except Exception as e:
-            print(f"Error getting document info: {str(e)}")
-            return {"error": str(e)}
 
-# Global instance
-document_processor = DocumentProcessor()
\ No newline at end of file
+# Entry points for the extraction pool; they must be module-level to be
+# picklable, and each worker process has its own document_processor
+def _validate_in_worker(file_path: str) -> bool:
+    return document_processor.validate_pdf_file(file_path)
+
+
+def _parse_in_worker(file_path: str, max_pages: Optional[int]) -> ParsedDocument:
+    return document_processor.parse_pdf_sync(file_path, max_pages)
+
+
+def _extract_pages_in_worker(
+    file_path: str,
+    page_indices: List[int],
+    image_only: Optional[Dict[int, bool]] = None
+) -> List[str]:
+    return document_processor.extract_pages_sync(file_path, page_indices, image_only)
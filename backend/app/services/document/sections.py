@@ -0,0 +1,223 @@
+# File: backend/app/services/document/sections.py
+
+import re
+from bisect import bisect_right
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from ..evaluation.retrieval import DIMENSION_KEYWORDS, tokenize
+
+# Sections besides the rubric dimensions: front matter and company
+# overview before the first recognized section, and numbered parts that
+# match no dimension (history, appendices, ...)
+SECTION_OVERVIEW = "项目概况"
+SECTION_OTHER = "其他"
+
+# Words that name a section in a heading or outline title. When several
+# match, the one ending last wins ("技术团队" is a team heading).
+SECTION_HEADING_WORDS = {
+    SECTION_OVERVIEW: [
+        "项目概况", "项目简介", "项目概述", "公司简介", "公司概况", "公司介绍", "企业简介", "执行摘要", "概述", "摘要",
+        "overview", "executive summary", "summary", "introduction", "about us"
+    ],
+    "团队能力": [
+        "团队", "创始人", "管理层", "核心成员", "组织架构", "股权结构", "顾问",
+        "team", "founders", "management", "advisors"
+    ],
+    "产品&技术": [
+        "产品", "技术", "研发", "解决方案", "知识产权", "专利", "核心竞争力",
+        "product", "products", "technology", "solution", "r&d", "patents"
+    ],
+    "市场前景": [
+        "市场", "行业", "竞争", "竞品", "用户", "客户", "营销", "痛点",
+        "market", "industry", "competition", "competitive", "customers", "go-to-market", "marketing"
+    ],
+    "商业模式": [
+        "商业模式", "盈利模式", "收入模式", "运营", "发展规划", "发展战略", "战略", "风险",
+        "business model", "revenue model", "operations", "strategy", "roadmap", "risks"
+    ],
+    "财务情况": [
+        "财务", "融资", "估值", "资金", "投资", "财务预测", "资金用途",
+        "finance", "financial", "financials", "funding", "investment", "use of funds", "the ask"
+    ],
+}
+
+_HEADING_NUMBER = re.compile(
+    r'^(?:第[一二三四五六七八九十百\d]+[章节部分篇]|[一二三四五六七八九十]+[、.．]|[(（][一二三四五六七八九十\d]+[)）]'
+    r'|\d{1,2}(?:\.\d{1,2})+|\d{1,2}[、.．)]|[IVX]+\.|(?:part|chapter|section)\s+\d+)'
+    r'(?!\s*[万亿千百元%个年月日倍\d])\s*',
+    re.IGNORECASE
+)
+_SENTENCE_PUNCTUATION = re.compile(r'[。，,；;：:！？!?]')
+_DIGIT = re.compile(r'\d')
+_PAGE_MARKER = re.compile(r'--- 第(\d+)页 ---')
+
+# Chapter-level numbering; a part numbered like this that names no
+# dimension starts an "other" section, unlike a "1." list item
+_CHAPTER_NUMBER = re.compile(r'^(?:第|[一二三四五六七八九十]+[、.．]|[IVX]+\.|part|chapter|section)', re.IGNORECASE)
+
+# Longest line taken for a numbered heading, and for an unnumbered one
+# (a slide title, which never contains figures): Chinese characters, or
+# words of a title-case English title
+HEADING_MAX_CHARS = 30
+TITLE_MAX_CHARS = 12
+TITLE_MAX_WORDS = 4
+_TITLE_SMALL_WORDS = {"a", "an", "and", "for", "in", "of", "on", "the", "to", "&"}
+
+# A page without headings starts a new section by keyword density only when
+# its dominant dimension has this many keyword hits and twice those of the
+# current section
+DENSITY_MIN_HITS = 4
+
+_DIMENSION_TERMS = {
+    dimension: {term for keyword in keywords for term in tokenize(keyword)}
+    for dimension, keywords in DIMENSION_KEYWORDS.items()
+}
+
+
+def classify_heading(title: str) -> Optional[str]:
+    """Section named by a heading or outline title, or None"""
+    lowered = title.lower()
+    best: Optional[Tuple[int, int, str]] = None
+    for section, words in SECTION_HEADING_WORDS.items():
+        for word in words:
+            position = lowered.rfind(word)
+            if position < 0:
+                continue
+            candidate = (position + len(word), len(word), section)
+            if best is None or candidate[:2] > best[:2]:
+                best = candidate
+    return best[2] if best else None
+
+
+def _is_title(line: str) -> bool:
+    if not line.isascii():
+        return len(line) <= TITLE_MAX_CHARS
+    words = line.split()
+    return len(words) <= TITLE_MAX_WORDS and all(
+        word[0].isupper() or word.lower() in _TITLE_SMALL_WORDS for word in words
+    )
+
+
+def heading_lines(page_text: str) -> List[Tuple[str, str]]:
+    """(normalized line, section) of the lines of a raw page that look like section headings"""
+    headings = []
+    for line in page_text.splitlines():
+        line = " ".join(line.split())
+        if not line or _SENTENCE_PUNCTUATION.search(line):
+            continue
+        numbered = _HEADING_NUMBER.match(line)
+        if numbered:
+            if len(line) > HEADING_MAX_CHARS:
+                continue
+            section = classify_heading(line[numbered.end():])
+            if section is None and _CHAPTER_NUMBER.match(line):
+                section = SECTION_OTHER
+        else:
+            section = classify_heading(line) if _is_title(line) and not _DIGIT.search(line) else None
+        if section:
+            headings.append((line, section))
+    return headings
+
+
+def keyword_hits(text: str) -> Counter:
+    """Rubric keyword occurrences per dimension"""
+    hits: Counter = Counter()
+    for term in tokenize(text):
+        for dimension, terms in _DIMENSION_TERMS.items():
+            if term in terms:
+                hits[dimension] += 1
+    return hits
+
+
+def build_section_index(
+    text: str,
+    pages: List[str],
+    outline: Optional[List[Tuple[int, str]]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Segment a document into sections, with character and page offsets
+
+    text is the cleaned document text with its page markers (see
+    ParsedDocument.text), pages the raw page texts and outline the
+    (0-based page, title) of its outline entries. A section starts at an
+    outline entry or a heading line naming it; pages without either
+    start one when their keyword density clearly favours another
+    dimension. Returns one entry per section in document order:
+    section, title (of its heading or outline entry), start and end
+    character offsets into text, first and last 1-based page and the
+    source of its boundary (outline, heading, keywords, or start for the
+    front matter).
+    """
+    markers = list(_PAGE_MARKER.finditer(text))
+    if not markers:
+        return []
+    marker_starts = [marker.start() for marker in markers]
+    marker_pages = [int(marker.group(1)) for marker in markers]
+
+    outline_titles: Dict[int, str] = {}
+    for page_index, title in outline or []:
+        outline_titles.setdefault(page_index + 1, title)
+
+    # (offset, section, title, source)
+    boundaries: List[Tuple[int, str, Optional[str], str]] = []
+    current = SECTION_OVERVIEW
+    for index, marker in enumerate(markers):
+        page_number = marker_pages[index]
+        region_end = marker_starts[index + 1] if index + 1 < len(markers) else len(text)
+        page_boundaries = []
+
+        title = outline_titles.get(page_number)
+        if title:
+            page_boundaries.append((marker.start(), classify_heading(title) or SECTION_OTHER, title, "outline"))
+
+        raw_page = pages[page_number - 1] if page_number <= len(pages) else ""
+        for line, section in heading_lines(raw_page):
+            if page_boundaries and page_boundaries[-1][1] == section:
+                continue  # Outline entry and heading of the same section
+            position = text.find(line, marker.end(), region_end)
+            offset = position if position >= 0 else marker.start()
+            if page_boundaries and offset < page_boundaries[-1][0]:
+                continue
+            page_boundaries.append((offset, section, line, "heading"))
+
+        if not page_boundaries:
+            hits = keyword_hits(text[marker.end():region_end])
+            if hits:
+                dominant, dominant_hits = hits.most_common(1)[0]
+                if dominant != current and dominant_hits >= DENSITY_MIN_HITS and dominant_hits >= 2 * hits[current]:
+                    page_boundaries.append((marker.start(), dominant, None, "keywords"))
+
+        boundaries.extend(page_boundaries)
+        if page_boundaries:
+            current = page_boundaries[-1][1]
+
+    if not boundaries or boundaries[0][0] > 0:
+        # Front matter up to the first recognized section
+        boundaries.insert(0, (0, SECTION_OVERVIEW, None, "start"))
+
+    def page_at(offset: int) -> int:
+        return marker_pages[max(0, bisect_right(marker_starts, offset) - 1)]
+
+    sections: List[Dict[str, Any]] = []
+    for (start, section, title, source), (end, *_) in zip(boundaries, boundaries[1:] + [(len(text),)]):
+        if end <= start:
+            continue
+        if sections and sections[-1]["section"] == section:
+            sections[-1]["end"] = end
+            sections[-1]["pages"][1] = page_at(end - 1)
+            continue
+        sections.append({
+            "section": section,
+            "title": title,
+            "start": start,
+            "end": end,
+            "pages": [page_at(start), page_at(end - 1)],
+            "source": source
+        })
+    return sections
+
+
+def section_spans(sections: List[Dict[str, Any]], section_keys: Iterable[str]) -> List[Dict[str, Any]]:
+    """Index entries of the given sections, in document order"""
+    keys = set(section_keys)
+    return [entry for entry in sections if entry["section"] in keys]
@@ -0,0 +1,249 @@
+# File: backend/app/services/document/text_processing.py
+
+import re
+from bisect import bisect_right
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from ...utils.token_utils import CJK_CHAR_CLASS, CJK_TOKENS_PER_CHAR, OTHER_TOKENS_PER_CHAR, estimate_tokens
+
+_CHINESE_CHAR = re.compile(r'[\u4e00-\u9fff]')
+_SENTENCE_END = re.compile(r'[。！？.!?]')
+_CJK_RUN = re.compile(CJK_CHAR_CLASS + '+')
+_NUMBER = re.compile(r'\d+')
+_NON_WORD = re.compile(r'[\W_]+')
+
+# How far back from a chunk's size limit a sentence end is looked for
+SENTENCE_LOOKBACK_CHARS = 200
+
+
+def normalize_text(text: str) -> str:
+    """
+    Clean and normalize extracted text
+
+    Collapses every whitespace run into one space and trims the result;
+    fragments of 3 characters or fewer without Chinese are dropped.
+    str.split() splits on exactly the characters regex \\s matches, so
+    this is one pass instead of a chain of regex substitutions.
+    """
+    if not text:
+        return ""
+    text = " ".join(text.split())
+    if len(text) > 3 or _CHINESE_CHAR.search(text):
+        return text
+    return ""
+
+
+class TextChunker:
+    """
+    Splits one document into overlapping chunks that end at sentence
+    boundaries where possible.
+
+    The text is whitespace-normalized and its sentence ends (and, for
+    token chunking, its CJK runs) are indexed once; each chunk boundary
+    is then found by bisecting those indexes instead of scanning the text
+    character by character.
+    """
+
+    def __init__(self, text: str):
+        self.text = " ".join(text.split()) if text else ""
+        self.sentence_ends = [match.start() for match in _SENTENCE_END.finditer(self.text)]
+        self.run_starts: Optional[List[int]] = None
+        self.run_ends: List[int] = []
+        self.cjk_before_run: List[int] = []
+
+    def _index_cjk_runs(self):
+        """CJK runs with the number of CJK characters before each, for token estimates of any slice"""
+        self.run_starts = []
+        cjk_chars = 0
+        for match in _CJK_RUN.finditer(self.text):
+            self.run_starts.append(match.start())
+            self.run_ends.append(match.end())
+            self.cjk_before_run.append(cjk_chars)
+            cjk_chars += match.end() - match.start()
+
+    def chunks(self, chunk_size: int = 4000, overlap: int = 200) -> List[str]:
+        """Chunks of at most chunk_size characters (+1 to keep a sentence end), overlapping by overlap"""
+        text_length = len(self.text)
+        if not text_length:
+            return []
+        if text_length <= chunk_size:
+            return [self.text]
+
+        chunks = []
+        start = 0
+        while start < text_length:
+            end = min(start + chunk_size, text_length)
+
+            # Break after the last sentence end in the final stretch of the chunk
+            if end < text_length:
+                end = self._sentence_end_before(end, max(start + chunk_size - SENTENCE_LOOKBACK_CHARS, start), end + 1)
+
+            chunk = self.text[start:end].strip()
+            if chunk:
+                chunks.append(chunk)
+
+            if end == text_length:
+                break
+
+            # Set next start position with overlap
+            start = max(end - overlap, start + 1)
+
+        return chunks
+
+    def token_chunks(self, max_tokens: int, overlap_tokens: int = 0, lookback_tokens: int = 0) -> List[str]:
+        """
+        Chunks of at most max_tokens estimated tokens (see estimate_tokens)
+
+        Chinese and English text is weighted per character, so chunks of a
+        mixed document carry similar token counts rather than similar
+        lengths. A chunk ends after the last sentence end within its final
+        lookback_tokens (default: a quarter of max_tokens); consecutive
+        chunks share about overlap_tokens.
+        """
+        text_length = len(self.text)
+        if not text_length:
+            return []
+        lookback_tokens = lookback_tokens or max_tokens // 4
+        if self.run_starts is None:
+            self._index_cjk_runs()
+
+        chunks = []
+        start = 0
+        while start < text_length:
+            end = max(self._advance(start, max_tokens), start + 1)
+
+            if end < text_length:
+                end = self._sentence_end_before(end, self._retreat(end, lookback_tokens) - 1, end)
+
+            chunk = self.text[start:end].strip()
+            if chunk:
+                chunks.append(chunk)
+
+            if end == text_length:
+                break
+
+            start = max(self._retreat(end, overlap_tokens), start + 1)
+
+        return chunks
+
+    def _sentence_end_before(self, end: int, lower: int, upper: int) -> int:
+        """end moved to just after the last sentence end at lower < position < upper, if any"""
+        index = bisect_right(self.sentence_ends, upper - 1) - 1
+        if index >= 0 and self.sentence_ends[index] > lower:
+            return self.sentence_ends[index] + 1
+        return end
+
+    def _cjk_before(self, position: int) -> int:
+        index = bisect_right(self.run_starts, position) - 1
+        if index < 0:
+            return 0
+        return self.cjk_before_run[index] + min(position, self.run_ends[index]) - self.run_starts[index]
+
+    def _tokens(self, start: int, end: int) -> float:
+        cjk_chars = self._cjk_before(end) - self._cjk_before(start)
+        return cjk_chars * CJK_TOKENS_PER_CHAR + (end - start - cjk_chars) * OTHER_TOKENS_PER_CHAR
+
+    def _advance(self, start: int, tokens: float) -> int:
+        """Furthest end with at most `tokens` estimated tokens in text[start:end]"""
+        low, high = start, min(len(self.text), start + int(tokens / OTHER_TOKENS_PER_CHAR) + 1)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self._tokens(start, middle) <= tokens:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def _retreat(self, end: int, tokens: float) -> int:
+        """Earliest start with at most `tokens` estimated tokens in text[start:end]"""
+        low, high = max(0, end - int(tokens / OTHER_TOKENS_PER_CHAR) - 1), end
+        while low < high:
+            middle = (low + high) // 2
+            if self._tokens(middle, end) <= tokens:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+
+class BoilerplateFilter:
+    """
+    Removes text repeated across the pages of one document.
+
+    Lines found on at least line_ratio of the pages read so far are
+    headers, footers, slogans or confidentiality notices; the first and
+    last EDGE_LINES lines of a page are compared with their numbers
+    masked so running page numbers match as well. Lines of at least
+    PARAGRAPH_MIN_CHARS characters whose text (ignoring case, spacing and
+    punctuation) already appeared earlier are dropped as duplicates.
+    Pages must be learned before they are stripped.
+    """
+
+    EDGE_LINES = 2
+    PARAGRAPH_MIN_CHARS = 40
+
+    def __init__(self, line_ratio: float, min_pages: int):
+        self.line_ratio = line_ratio
+        self.min_pages = max(2, min_pages)
+        self.pages_seen = 0
+        self.line_pages: Counter = Counter()
+        self.seen_paragraphs: Set[str] = set()
+        self.repeated_lines_removed = 0
+        self.duplicate_paragraphs_removed = 0
+        self.tokens_saved = 0
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[str], line_ratio: float, min_pages: int) -> "BoilerplateFilter":
+        boilerplate = cls(line_ratio, min_pages)
+        for page_text in pages:
+            boilerplate.learn(page_text)
+        return boilerplate
+
+    def _lines(self, page_text: str) -> List[Tuple[str, str]]:
+        """(normalized line, repetition key) of every non-empty line"""
+        lines = [" ".join(line.split()) for line in page_text.splitlines()]
+        lines = [line for line in lines if line]
+        last_body_line = len(lines) - self.EDGE_LINES
+        return [
+            (line, _NUMBER.sub("#", line) if index < self.EDGE_LINES or index >= last_body_line else line)
+            for index, line in enumerate(lines)
+        ]
+
+    def learn(self, page_text: str):
+        """Count the lines of one more page"""
+        if not page_text:
+            return
+        self.pages_seen += 1
+        self.line_pages.update({key for _, key in self._lines(page_text)})
+
+    def is_repeated(self, key: str) -> bool:
+        return (
+            self.line_ratio > 0
+            and self.pages_seen >= self.min_pages
+            and self.line_pages[key] >= self.line_ratio * self.pages_seen
+        )
+
+    def strip(self, page_text: str) -> str:
+        """Page text without repeated lines and already-seen paragraphs, one line per line"""
+        kept = []
+        for line, key in self._lines(page_text):
+            if self.is_repeated(key):
+                self.repeated_lines_removed += 1
+                self.tokens_saved += estimate_tokens(line)
+                continue
+            if self.line_ratio > 0 and len(line) >= self.PARAGRAPH_MIN_CHARS:
+                paragraph_key = _NON_WORD.sub("", line).lower()
+                if paragraph_key in self.seen_paragraphs:
+                    self.duplicate_paragraphs_removed += 1
+                    self.tokens_saved += estimate_tokens(line)
+                    continue
+                self.seen_paragraphs.add(paragraph_key)
+            kept.append(line)
+        return "\n".join(kept)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "repeated_lines_removed": self.repeated_lines_removed,
+            "duplicate_paragraphs_removed": self.duplicate_paragraphs_removed,
+            "tokens_saved": self.tokens_saved
+        }
@@ -0,0 +1,103 @@
+# File: backend/app/services/evaluation/batch.py
+
+import asyncio
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from ...core.config.settings import settings
+from ...models.batch import BatchItem, BatchItemStatus, BatchStatusResponse
+from .progress import evaluation_progress
+
+
+class BatchManager:
+    """
+    Runs the items of batch evaluations.
+
+    At most max_active_plans plans are extracted and evaluated at once
+    across all batches; their dimension calls then share the global fair
+    call pool, so a cohort moves through at the pool's throughput with
+    every plan progressing. The manager keeps no batch state: the caller
+    persists the batch (see api/v1/batches.py), is told through on_start
+    when an item takes a plan slot, and reads outcomes back from the
+    business plan rows, so any worker can report on any batch.
+    """
+
+    def __init__(self, max_active_plans: int):
+        self.max_active_plans = max(1, max_active_plans)
+        self._plan_slots: Optional[asyncio.Semaphore] = None
+
+    async def run(
+        self,
+        batch_id: str,
+        items: List[BatchItem],
+        runner: Callable[[BatchItem], Awaitable[Dict[str, Any]]],
+        on_start: Optional[Callable[[BatchItem], None]] = None
+    ):
+        """Run every queued item; runner is process_and_evaluate_bp, which records the outcome on the BP"""
+        if self._plan_slots is None:
+            self._plan_slots = asyncio.Semaphore(self.max_active_plans)
+
+        async def run_item(item: BatchItem):
+            async with self._plan_slots:
+                item.status = BatchItemStatus.PROCESSING
+                item.started_at = datetime.utcnow()
+                if on_start is not None:
+                    try:
+                        on_start(item)
+                    except Exception as e:
+                        # The item then reads as queued until it finishes
+                        print(f"⚠️ Failed to record the start of batch item {item.bp_id}: {str(e)}")
+                try:
+                    outcome = await runner(item)
+                except Exception as e:
+                    outcome = {"status": "failed", "error": str(e)}
+
+                item.status = (
+                    BatchItemStatus.COMPLETED if outcome.get("status") == "completed" else BatchItemStatus.FAILED
+                )
+                item.finished_at = datetime.utcnow()
+
+        print(f"📦 Starting batch {batch_id} with {len(items)} plans")
+        await asyncio.gather(*(
+            run_item(item) for item in items if item.status == BatchItemStatus.QUEUED
+        ))
+
+        completed = sum(1 for item in items if item.status == BatchItemStatus.COMPLETED)
+        print(f"✅ Batch {batch_id} finished: {completed}/{len(items)} completed")
+
+
+def build_batch_status(batch_id: str, created_at: datetime, items: List[BatchItem]) -> BatchStatusResponse:
+    """
+    Aggregate progress and per-item status of a batch
+
+    Processing items get their completed dimension count from the progress
+    hub, which only knows the evaluations running in this process.
+    """
+    for item in items:
+        if item.status == BatchItemStatus.PROCESSING:
+            dimensions = evaluation_progress.snapshot(item.project_id).get("dimensions", {})
+            item.dimensions_completed = sum(
+                1 for state in dimensions.values() if state.get("status") == "completed"
+            )
+
+    counts = {status: 0 for status in BatchItemStatus}
+    for item in items:
+        counts[item.status] += 1
+    finished = counts[BatchItemStatus.COMPLETED] + counts[BatchItemStatus.FAILED]
+    finished_times = [item.finished_at for item in items if item.finished_at is not None]
+
+    return BatchStatusResponse(
+        batch_id=batch_id,
+        created_at=created_at,
+        finished_at=max(finished_times) if finished == len(items) and finished_times else None,
+        total=len(items),
+        queued=counts[BatchItemStatus.QUEUED],
+        processing=counts[BatchItemStatus.PROCESSING],
+        completed=counts[BatchItemStatus.COMPLETED],
+        failed=counts[BatchItemStatus.FAILED],
+        progress=finished / len(items) if items else 1.0,
+        items=items
+    )
+
+
+# Global instance
+batch_manager = BatchManager(settings.BATCH_MAX_ACTIVE_PLANS)
@@ -0,0 +1,266 @@
+# File: backend/app/services/evaluation/cache.py
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from ...core.config.settings import settings
+
+
+class LLMResponseCache:
+    """
+    Content-addressed, on-disk cache for LLM responses.
+
+    Entries are keyed on a hash of everything that determines the model
+    output (model, evaluation tier, temperature, token limit, system
+    prompt, rendered user prompt) and stored in SQLite so that every
+    uvicorn worker shares the same cache. Entries expire after a TTL and
+    the least recently used entries are evicted once the total payload
+    size exceeds the configured limit.
+
+    Each process keeps one connection; async callers use the *_async
+    methods, which run on a dedicated worker thread so SQLite never blocks
+    the event loop. The payload size is kept as a running total, re-read
+    from the database by the periodic expiry sweep and whenever it crosses
+    the limit (other workers write to the same file); eviction then trims
+    the cache in batches down to EVICT_TARGET_RATIO of the limit.
+    """
+
+    # Share of max_bytes eviction trims the cache to, so a full cache is
+    # not trimmed again on every write
+    EVICT_TARGET_RATIO = 0.9
+    EVICT_BATCH_ROWS = 200
+    # Seconds between sweeps of expired entries
+    EXPIRY_SWEEP_SECONDS = 300
+
+    def __init__(self, db_path: str, max_bytes: int, ttl_seconds: float, enabled: bool = True):
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._total_size = 0
+        self._last_sweep = 0.0
+
+    @staticmethod
+    def make_key(
+        model: str,
+        temperature: float,
+        system_prompt: str,
+        user_prompt: str,
+        tier: str = "",
+        max_tokens: Optional[int] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Build the cache key from the inputs that determine the response
+
+        options are the other request parameters (response_format, ...),
+        compared by value regardless of their order.
+        """
+        payload = json.dumps(
+            [model, tier, temperature, max_tokens, options or {}, system_prompt, user_prompt],
+            ensure_ascii=False,
+            separators=(",", ":"),
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _connection(self) -> sqlite3.Connection:
+        """The process's connection, opened and set up on first use; call with the lock held"""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS llm_cache (
+                        key TEXT PRIMARY KEY,
+                        value TEXT NOT NULL,
+                        size INTEGER NOT NULL,
+                        created_at REAL NOT NULL,
+                        last_accessed REAL NOT NULL
+                    )
+                    """
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_llm_cache_last_accessed ON llm_cache(last_accessed)"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_llm_cache_created_at ON llm_cache(created_at)"
+                )
+            self._total_size = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    async def _run_in_worker(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm-cache")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    async def get_async(self, key: str) -> Optional[str]:
+        """get() off the event loop"""
+        if not self.enabled:
+            return None
+        return await self._run_in_worker(self.get, key)
+
+    async def set_async(self, key: str, value: str):
+        """set() off the event loop"""
+        if self.enabled:
+            await self._run_in_worker(self.set, key, value)
+
+    async def stats_async(self) -> Dict[str, Any]:
+        """stats() off the event loop"""
+        return await self._run_in_worker(self.stats)
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on a miss"""
+        if not self.enabled:
+            return None
+
+        try:
+            with self._lock:
+                conn = self._connection()
+                now = time.time()
+                with conn:
+                    row = conn.execute(
+                        "SELECT value, size, created_at FROM llm_cache WHERE key = ?", (key,)
+                    ).fetchone()
+
+                    if row is None:
+                        self.misses += 1
+                        return None
+
+                    value, size, created_at = row
+                    if now - created_at > self.ttl_seconds:
+                        conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                        self._total_size -= size
+                        self.misses += 1
+                        return None
+
+                    conn.execute(
+                        "UPDATE llm_cache SET last_accessed = ? WHERE key = ?", (now, key)
+                    )
+                    self.hits += 1
+                    return value
+
+        except sqlite3.Error as e:
+            print(f"⚠️ LLM cache read failed: {str(e)}")
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: str):
+        """Store a response and evict least recently used entries if over budget"""
+        if not self.enabled:
+            return
+
+        try:
+            with self._lock:
+                conn = self._connection()
+                now = time.time()
+                size = len(value.encode("utf-8"))
+                with conn:
+                    replaced = conn.execute("SELECT size FROM llm_cache WHERE key = ?", (key,)).fetchone()
+                    conn.execute(
+                        """
+                        INSERT OR REPLACE INTO llm_cache (key, value, size, created_at, last_accessed)
+                        VALUES (?, ?, ?, ?, ?)
+                        """,
+                        (key, value, size, now, now)
+                    )
+                    self._total_size += size - (replaced[0] if replaced else 0)
+
+                    if now - self._last_sweep >= self.EXPIRY_SWEEP_SECONDS:
+                        self._sweep_expired(conn, now)
+                    if self._total_size > self.max_bytes:
+                        self._evict(conn)
+
+        except sqlite3.Error as e:
+            print(f"⚠️ LLM cache write failed: {str(e)}")
+
+    def _sweep_expired(self, conn: sqlite3.Connection, now: float):
+        """Drop entries past their TTL and pick up what other workers wrote since the last sweep"""
+        self._last_sweep = now
+        expired = conn.execute(
+            "DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+        ).rowcount
+        self.evictions += max(expired, 0)
+        self._total_size = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop least recently used entries, a batch at a time, down to the eviction target"""
+        # Other workers write to the same file, so settle the running total first
+        self._total_size = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+        target_size = self.max_bytes * self.EVICT_TARGET_RATIO
+
+        while self._total_size > target_size:
+            rows = conn.execute(
+                "SELECT key, size FROM llm_cache ORDER BY last_accessed ASC LIMIT ?",
+                (self.EVICT_BATCH_ROWS,)
+            ).fetchall()
+            if not rows:
+                break
+
+            stale_keys = []
+            for key, size in rows:
+                if self._total_size <= target_size:
+                    break
+                stale_keys.append((key,))
+                self._total_size -= size
+
+            conn.executemany("DELETE FROM llm_cache WHERE key = ?", stale_keys)
+            self.evictions += len(stale_keys)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for this process plus on-disk usage"""
+        entries, size_bytes = 0, 0
+        if self.enabled:
+            try:
+                with self._lock:
+                    entries, size_bytes = self._connection().execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+                    ).fetchone()
+            except sqlite3.Error as e:
+                print(f"⚠️ LLM cache stats failed: {str(e)}")
+
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": entries,
+            "size_bytes": size_bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds
+        }
+
+
+def _resolve_cache_path(path: str) -> Path:
+    """Resolve relative cache paths against the backend root"""
+    cache_path = Path(path)
+    if not cache_path.is_absolute():
+        cache_path = Path(__file__).parent.parent.parent.parent / cache_path
+    return cache_path
+
+
+# Global instance
+llm_cache = LLMResponseCache(
+    db_path=str(_resolve_cache_path(settings.LLM_CACHE_PATH)),
+    max_bytes=settings.LLM_CACHE_MAX_MB * 1024 * 1024,
+    ttl_seconds=settings.LLM_CACHE_TTL_HOURS * 3600,
+    enabled=settings.LLM_CACHE_ENABLED
+)
@@ -0,0 +1,130 @@
+# File: backend/app/services/evaluation/cascade.py
+
+from typing import Any, Dict, List, Optional
+from ...core.config.settings import settings
+from ...models.project import EXCELLENT_SCORE_THRESHOLD, QUALIFIED_SCORE_THRESHOLD
+
+
+class EvaluationTier:
+    """Model and context sizes used to score a dimension"""
+
+    def __init__(
+        self,
+        name: str,
+        model: str,
+        context_token_budget: int,
+        shared_context_token_budget: int,
+        max_tokens: int
+    ):
+        self.name = name
+        self.model = model
+        self.context_token_budget = context_token_budget
+        self.shared_context_token_budget = shared_context_token_budget
+        self.max_tokens = max_tokens
+
+
+# The configuration every non-cascade evaluation uses
+FULL_TIER = EvaluationTier(
+    name="full",
+    model=settings.DEEPSEEK_MODEL,
+    context_token_budget=settings.DEEPSEEK_CONTEXT_TOKEN_BUDGET,
+    shared_context_token_budget=settings.DEEPSEEK_SHARED_CONTEXT_TOKEN_BUDGET,
+    max_tokens=2000
+)
+
+# Cheap first pass: shorter context and a cheaper model than DEEPSEEK_MODEL.
+# By default both tiers use the same model, and cascade mode falls back to
+# per_dimension until DEEPSEEK_CASCADE_FAST_MODEL is set
+FAST_TIER = EvaluationTier(
+    name="fast",
+    model=settings.DEEPSEEK_CASCADE_FAST_MODEL,
+    context_token_budget=settings.DEEPSEEK_CASCADE_FAST_CONTEXT_TOKEN_BUDGET,
+    shared_context_token_budget=settings.DEEPSEEK_CASCADE_FAST_CONTEXT_TOKEN_BUDGET,
+    max_tokens=settings.DEEPSEEK_CASCADE_FAST_MAX_TOKENS
+)
+
+STATUS_THRESHOLDS = (QUALIFIED_SCORE_THRESHOLD, EXCELLENT_SCORE_THRESHOLD)
+
+
+def dimension_escalation_reasons(result: Dict[str, Any]) -> List[str]:
+    """Why a first-pass dimension result cannot be trusted on its own"""
+    reasons = []
+    if result.get("fallback"):
+        reasons.append("evaluation_failed")
+    if result.get("model_repaired"):
+        reasons.append("json_repaired")
+    if result.get("scores_adjusted"):
+        reasons.append("inconsistent_scores")
+    return reasons
+
+
+def nearest_status_threshold(total_score: float, margin: float) -> Optional[float]:
+    """The status boundary within margin of a total score, if any"""
+    thresholds = [threshold for threshold in STATUS_THRESHOLDS if abs(total_score - threshold) <= margin]
+    return min(thresholds, key=lambda threshold: abs(total_score - threshold)) if thresholds else None
+
+
+def score_swing(result: Dict[str, Any], total_max_score: float, margin: float, upward: bool) -> float:
+    """
+    How far a re-evaluation may move one dimension's score toward a threshold
+
+    The first-pass total is taken to be off by up to margin points, shared
+    among the dimensions by their maximum score and capped by the room the
+    dimension has left in that direction.
+    """
+    max_score = float(result.get("max_score") or 0)
+    score = float(result.get("score") or 0)
+    room = max_score - score if upward else score
+    return max(0.0, min(room, margin * max_score / total_max_score)) if total_max_score else 0.0
+
+
+def select_escalations(
+    results: Dict[str, Dict[str, Any]],
+    margin: float = settings.DEEPSEEK_CASCADE_THRESHOLD_MARGIN
+) -> Dict[str, List[str]]:
+    """
+    Decide which first-pass dimensions to re-evaluate with the full tier.
+
+    Dimensions with failed, repaired or internally inconsistent output are
+    escalated individually. When the first-pass total lies within margin
+    of the 60/80 status thresholds, only the dimensions needed to move it
+    across the threshold are added (see score_swing): those already
+    escalated count first, then the ones with the largest swing, until
+    their combined swing exceeds the distance to the threshold. Nothing is
+    added when even every dimension together could not cross it.
+    """
+    escalations = {}
+    for dimension, result in results.items():
+        reasons = dimension_escalation_reasons(result)
+        if reasons:
+            escalations[dimension] = reasons
+
+    total_score = sum(result["score"] for result in results.values())
+    threshold = nearest_status_threshold(total_score, margin)
+    if threshold is None:
+        return escalations
+
+    upward = total_score < threshold
+    distance = abs(threshold - total_score)
+    total_max_score = sum(float(result.get("max_score") or 0) for result in results.values())
+    swings = {
+        dimension: score_swing(result, total_max_score, margin, upward)
+        for dimension, result in results.items()
+    }
+
+    covered = sum(swings[dimension] for dimension in escalations)
+    candidates = sorted(
+        (dimension for dimension in results if dimension not in escalations),
+        key=lambda dimension: swings[dimension],
+        reverse=True
+    )
+    if covered + sum(swings[dimension] for dimension in candidates) <= distance:
+        return escalations  # No re-evaluation can change the status
+
+    for dimension in candidates:
+        if covered > distance:
+            break
+        escalations[dimension] = ["near_status_threshold"]
+        covered += swings[dimension]
+
+    return escalations
@@ -1,281 +1,1103 @@
 # File: backend/app/services/evaluation/deepseek_client.py
 
 import openai
-from typing import Dict, List, Any
+from typing import AsyncIterator, Callable, Dict, List, Any, Optional, Tuple
 import json
+import time
 import asyncio
 from ...core.config.settings import settings
+from ...models.evaluation import EvaluationMode
+from ...models.score import STANDARD_DIMENSIONS
+from .cache import llm_cache
+from .rate_limiter import rate_limiter, request_scheduler, LLMProviderUnavailableError
+from .fair_scheduler import call_pool
+from .cascade import FAST_TIER, FULL_TIER, EvaluationTier, select_escalations
+from .hedging import request_hedger
+from .retrieval import DocumentIndex, StreamingReadiness
+from .map_reduce import DigestChunker, parse_summary, render_digest
+from .telemetry import estimate_cost, llm_telemetry
+from .prompts import (
+    SYSTEM_PROMPT,
+    build_combined_prompt,
+    build_dimension_prompt,
+    build_repair_prompt,
+    build_summary_prompt,
+    render_combined_structure,
+    render_dimension_structure,
+    with_supplement,
+)
+from .parsing import DimensionCheck, check_dimension_output, extract_json
+from .streaming import IncrementalJSONParser, CompletionResult, JSONPath
+from ...utils.token_utils import estimate_tokens
+
+DEFAULT_TEMPERATURE = 0.3
+
+
+async def _pieces(*texts: str) -> AsyncIterator[str]:
+    """A complete document as a text stream"""
+    for text in texts:
+        yield text
+
+
+class EvaluationRun:
+    """Per-evaluation options and collected state, threaded through every call"""
+
+    def __init__(
+        self,
+        use_cache: bool = True,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        owner: Optional[str] = None
+    ):
+        self.use_cache = use_cache
+        self.progress_callback = progress_callback
+        # Key used to share the global call pool fairly between plans
+        self.owner = owner or f"run-{id(self)}"
+        # Token usage, latency and cost of every API call made for this plan
+        self.usage_log: List[Dict[str, Any]] = []
+        # Dimensions that ended with fallback scores
+        self.fallbacks: List[str] = []
+
+    def publish(self, event_type: str, **fields):
+        """Forward a progress event; progress reporting never breaks an evaluation"""
+        if not self.progress_callback:
+            return
+        try:
+            self.progress_callback({"type": event_type, **fields})
+        except Exception as e:
+            print(f"⚠️ Failed to publish progress event: {str(e)}")
+
 
 class DeepSeekClient:
     def __init__(self):
-        self.client = openai.OpenAI(
+        self.client = openai.AsyncOpenAI(
             api_key=settings.DEEPSEEK_API_KEY,
-            base_url=settings.DEEPSEEK_BASE_URL
+            base_url=settings.DEEPSEEK_BASE_URL,
+            # Retries are handled by the shared request scheduler
+            max_retries=0
         )
 
-    async def evaluate_business_plan(self, document_text: str) -> Dict[str, Any]:
-        """Main evaluation function that processes a business plan"""
+    async def evaluate_business_plan(
+        self,
+        document_text: str,
+        mode: Optional[str] = None,
+        use_cache: bool = True,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        owner: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Main evaluation function that processes a business plan
+
+        mode selects per_dimension, combined, cascade or map_reduce evaluation; defaults
+        to DEEPSEEK_EVALUATION_MODE when not given. use_cache=False skips
+        cached LLM responses (fresh responses are still written back).
+        progress_callback receives partial and completed dimension scores
+        as they stream in. owner identifies the plan (usually the BP id)
+        when sharing the global call pool with other evaluations.
+        """
+        run = EvaluationRun(use_cache=use_cache, progress_callback=progress_callback, owner=owner)
+
         try:
-            # Define the standard evaluation dimensions
-            dimensions = {
-                "团队能力": {
-                    "max_score": 30,
-                    "sub_dimensions": {
-                        "核心团队背景": 10,
-                        "团队完整性": 10,
-                        "团队执行力": 10
-                    }
-                },
-                "产品&技术": {
-                    "max_score": 20,
-                    "sub_dimensions": {
-                        "技术创新性": 8,
-                        "产品成熟度": 6,
-                        "研发能力": 6
-                    }
-                },
-                "市场前景": {
-                    "max_score": 20,
-                    "sub_dimensions": {
-                        "市场空间": 8,
-                        "竞争分析": 6,
-                        "市场策略": 6
-                    }
-                },
-                "商业模式": {
-                    "max_score": 20,
-                    "sub_dimensions": {
-                        "盈利模式": 8,
-                        "运营模式": 6,
-                        "发展模式": 6
-                    }
-                },
-                "财务情况": {
-                    "max_score": 10,
-                    "sub_dimensions": {
-                        "财务状况": 5,
-                        "融资需求": 5
-                    }
-                }
+            evaluation_mode = self._resolve_evaluation_mode(mode)
+
+            # Evaluate against the standard rubric, in rubric order
+            dimensions = STANDARD_DIMENSIONS
+
+            if evaluation_mode == EvaluationMode.COMBINED:
+                evaluation_results = await self._evaluate_combined(dimensions, document_text, run)
+            elif evaluation_mode == EvaluationMode.CASCADE:
+                evaluation_results = await self._evaluate_cascade(dimensions, document_text, run)
+            elif evaluation_mode == EvaluationMode.MAP_REDUCE:
+                evaluation_results, _ = await self._evaluate_map_reduce(dimensions, _pieces(document_text), run)
+            else:
+                evaluation_results = await self._evaluate_per_dimension(dimensions, document_text, run)
+
+            return self._build_evaluation_result(evaluation_results, evaluation_mode, run)
+
+        except LLMProviderUnavailableError:
+            # Let the caller retry later instead of storing fallback scores
+            raise
+        except Exception as e:
+            print(f"❌ Evaluation failed: {str(e)}")
+            # Return fallback evaluation
+            return self._get_fallback_evaluation()
+
+    async def evaluate_business_plan_streaming(
+        self,
+        text_stream: AsyncIterator[str],
+        mode: Optional[str] = None,
+        use_cache: bool = True,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        owner: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        evaluate_business_plan over a document that is still being extracted
+
+        text_stream yields the document text page by page (see
+        DocumentProcessor.stream_text_from_pdf). In per_dimension and
+        cascade mode a dimension call starts as soon as the pages read so
+        far hold enough text relevant to it (see StreamingReadiness); the
+        remaining dimensions start after the last page. In map_reduce mode
+        chunks are sent out for summaries as their pages arrive. Combined
+        mode needs the whole document and waits for the stream to end.
+        Extraction errors propagate to the caller.
+        """
+        run = EvaluationRun(use_cache=use_cache, progress_callback=progress_callback, owner=owner)
+        evaluation_mode = self._resolve_evaluation_mode(mode)
+        dimensions = STANDARD_DIMENSIONS
+
+        if evaluation_mode == EvaluationMode.COMBINED:
+            document_text = " ".join([piece async for piece in text_stream])
+            return await self.evaluate_business_plan(
+                document_text,
+                mode=evaluation_mode.value,
+                use_cache=use_cache,
+                progress_callback=progress_callback,
+                owner=owner
+            )
+
+        if evaluation_mode == EvaluationMode.MAP_REDUCE:
+            evaluation_results, document_text = await self._evaluate_map_reduce(dimensions, text_stream, run)
+        else:
+            tier = FAST_TIER if evaluation_mode == EvaluationMode.CASCADE else FULL_TIER
+            evaluation_results, document_text = await self._evaluate_per_dimension_streaming(
+                dimensions,
+                text_stream,
+                run,
+                tier
+            )
+
+        try:
+            if evaluation_mode == EvaluationMode.CASCADE:
+                evaluation_results = await self._escalate(dimensions, evaluation_results, document_text, run)
+            return self._build_evaluation_result(evaluation_results, evaluation_mode, run)
+
+        except LLMProviderUnavailableError:
+            raise
+        except Exception as e:
+            print(f"❌ Evaluation failed: {str(e)}")
+            return self._get_fallback_evaluation()
+
+    def _build_evaluation_result(
+        self,
+        evaluation_results: Dict[str, Dict[str, Any]],
+        evaluation_mode: EvaluationMode,
+        run: EvaluationRun
+    ) -> Dict[str, Any]:
+        # Collect missing information
+        missing_info = []
+        for dimension_result in evaluation_results.values():
+            if "missing_info" in dimension_result:
+                missing_info.extend(dimension_result["missing_info"])
+
+        # Calculate total score
+        total_score = sum(result["score"] for result in evaluation_results.values())
+
+        return {
+            "dimensions": evaluation_results,
+            "total_score": total_score,
+            "missing_information": missing_info,
+            "evaluation_summary": self._generate_summary(total_score, evaluation_results),
+            "evaluation_mode": evaluation_mode.value,
+            "usage": self._summarize_usage(run.usage_log, run.fallbacks)
+        }
+
+    async def reevaluate_dimensions(
+        self,
+        document_text: str,
+        dimension_keys: List[str],
+        additional_information: str = "",
+        use_cache: bool = True,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        owner: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Re-run only the given rubric dimensions, one API call each
+
+        additional_information (e.g. financial statements supplied for a
+        missing_information item) is appended to every dimension's context.
+        Dimensions whose call fails come back with fallback=True so the
+        caller can keep the stored score. Raises ValueError for dimensions
+        outside the standard rubric.
+        """
+        unknown = [key for key in dimension_keys if key not in STANDARD_DIMENSIONS]
+        if unknown:
+            raise ValueError(f"Unknown evaluation dimensions: {unknown}")
+
+        run = EvaluationRun(use_cache=use_cache, progress_callback=progress_callback, owner=owner)
+
+        # Keep rubric order regardless of the order requested
+        dimensions = {
+            key: config for key, config in STANDARD_DIMENSIONS.items() if key in dimension_keys
+        }
+        evaluation_results = await self._evaluate_per_dimension(
+            dimensions,
+            document_text,
+            run,
+            supplement=additional_information
+        )
+
+        missing_info = []
+        for dimension_result in evaluation_results.values():
+            if not dimension_result.get("fallback"):
+                missing_info.extend(dimension_result.get("missing_info", []))
+
+        return {
+            "dimensions": evaluation_results,
+            "missing_information": missing_info,
+            "evaluation_mode": EvaluationMode.PER_DIMENSION.value,
+            "usage": self._summarize_usage(run.usage_log, run.fallbacks)
+        }
+
+    def _resolve_evaluation_mode(self, mode: Optional[str]) -> EvaluationMode:
+        """
+        Resolve the requested mode, falling back to the deployment default
+
+        Cascade mode needs a fast tier model other than the full one;
+        otherwise every escalated dimension would pay for the same model
+        twice, and per_dimension mode is used instead.
+        """
+        try:
+            evaluation_mode = EvaluationMode(mode or settings.DEEPSEEK_EVALUATION_MODE)
+        except ValueError:
+            print(f"⚠️ Unknown evaluation mode '{mode or settings.DEEPSEEK_EVALUATION_MODE}', using per_dimension")
+            return EvaluationMode.PER_DIMENSION
+
+        if evaluation_mode == EvaluationMode.CASCADE and FAST_TIER.model == FULL_TIER.model:
+            print(
+                "⚠️ Cascade: DEEPSEEK_CASCADE_FAST_MODEL is the full model, using per_dimension; "
+                "set a cheaper one to use cascade mode"
+            )
+            return EvaluationMode.PER_DIMENSION
+        return evaluation_mode
+
+    async def _evaluate_per_dimension(
+        self,
+        dimensions: Dict[str, Dict],
+        document_text: str,
+        run: Optional[EvaluationRun] = None,
+        tier: EvaluationTier = FULL_TIER,
+        supplement: str = ""
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Evaluate each dimension with its own API call, concurrently
+
+        supplement is appended to every dimension's selected context.
+        """
+        run = run or EvaluationRun()
+        contexts = self._select_contexts(dimensions, DocumentIndex.from_text(document_text), tier, supplement)
+        return await self._run_dimensions(dimensions, contexts, run, tier)
+
+    async def _evaluate_per_dimension_streaming(
+        self,
+        dimensions: Dict[str, Dict],
+        text_stream: AsyncIterator[str],
+        run: EvaluationRun,
+        tier: EvaluationTier = FULL_TIER
+    ) -> Tuple[Dict[str, Dict[str, Any]], str]:
+        """
+        _evaluate_per_dimension while the document text streams in
+
+        Dimensions that become ready select their context from the pages
+        read so far and start immediately; with DEEPSEEK_SHARED_CONTEXT
+        all dimensions share one context, so they start together once
+        every one of them is ready. Returns the results in rubric order
+        and the complete document text.
+        """
+        readiness = StreamingReadiness(
+            dimensions.keys(),
+            tier.context_token_budget,
+            settings.PDF_STREAMING_READY_FACTOR
+        )
+        semaphore = asyncio.Semaphore(max(1, settings.DEEPSEEK_MAX_CONCURRENCY))
+        pages: List[str] = []
+        started: List[asyncio.Task] = []
+        pending = dict(dimensions)
+
+        def start(dimension_keys: List[str], document_text: str, final: bool = False):
+            group = {key: pending.pop(key) for key in dimension_keys}
+            if not final:
+                print(f"⏩ Starting {list(group)} after {len(pages)} pages")
+            contexts = self._select_contexts(group, DocumentIndex.from_text(document_text), tier)
+            started.append(asyncio.ensure_future(self._run_dimensions(group, contexts, run, tier, semaphore)))
+
+        try:
+            async for page_text in text_stream:
+                pages.append(page_text)
+                newly_ready = readiness.add_page(page_text)
+                if settings.DEEPSEEK_SHARED_CONTEXT:
+                    if readiness.all_ready and pending:
+                        start(list(pending), " ".join(pages))
+                elif newly_ready:
+                    start(newly_ready, " ".join(pages))
+
+            document_text = " ".join(pages)
+            if pending:
+                start(list(pending), document_text, final=True)
+
+            groups = await asyncio.gather(*started)
+        except BaseException:
+            for task in started:
+                task.cancel()
+            raise
+
+        results = {key: value for group in groups for key, value in group.items()}
+        return {key: results[key] for key in dimensions}, document_text
+
+    def _select_contexts(
+        self,
+        dimensions: Dict[str, Dict],
+        document_index: DocumentIndex,
+        tier: EvaluationTier = FULL_TIER,
+        supplement: str = ""
+    ) -> Dict[str, str]:
+        """Document context of every dimension, selected from the index"""
+        if settings.DEEPSEEK_SHARED_CONTEXT:
+            # One context covering every dimension keeps the prompt prefix
+            # identical across calls so DeepSeek can serve it from its cache
+            shared_context = document_index.select_for_dimensions(
+                dimensions.keys(),
+                tier.shared_context_token_budget
+            )
+            contexts = {key: shared_context for key in dimensions}
+        else:
+            # Each dimension sees the chunks most relevant to its rubric
+            contexts = {
+                key: document_index.select_for_dimension(key, tier.context_token_budget)
+                for key in dimensions
             }
 
-            # Evaluate each dimension
-            evaluation_results = {}
-            missing_info = []
+        if supplement:
+            contexts = {key: with_supplement(context, supplement) for key, context in contexts.items()}
+        return contexts
 
-            for dimension_key, dimension_config in dimensions.items():
-                print(f"🔍 Evaluating dimension: {dimension_key}")
+    async def _run_dimensions(
+        self,
+        dimensions: Dict[str, Dict],
+        contexts: Dict[str, str],
+        run: EvaluationRun,
+        tier: EvaluationTier = FULL_TIER,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Evaluate each dimension over its context with its own API call, concurrently"""
+        # Bound the fan-out by the configured concurrency limit
+        semaphore = semaphore or asyncio.Semaphore(max(1, settings.DEEPSEEK_MAX_CONCURRENCY))
 
-                dimension_result = await self._evaluate_dimension(
+        # DEEPSEEK_DIMENSION_TIMEOUT applies to each API attempt inside the
+        # request scheduler, so time spent queueing for rate-limit capacity
+        # does not turn into fallback scores
+        async def run_dimension(dimension_key: str, dimension_config: Dict) -> Dict[str, Any]:
+            async with semaphore:
+                print(f"🔍 Evaluating dimension: {dimension_key}")
+                return await self._evaluate_dimension(
                     dimension_key,
                     dimension_config,
-                    document_text
+                    contexts[dimension_key],
+                    run,
+                    tier
                 )
 
-                evaluation_results[dimension_key] = dimension_result
+        dimension_items = list(dimensions.items())
+        results = []
 
-                # Collect missing information
-                if "missing_info" in dimension_result:
-                    missing_info.extend(dimension_result["missing_info"])
+        # The provider only caches a prefix once a request using it has been
+        # processed, so optionally send one call first to warm the cache
+        if settings.DEEPSEEK_SHARED_CONTEXT and settings.DEEPSEEK_PREFIX_WARMUP and len(dimension_items) > 1:
+            results.append(await run_dimension(*dimension_items[0]))
+            dimension_items = dimension_items[1:]
 
-            # Calculate total score
-            total_score = sum(result["score"] for result in evaluation_results.values())
+        results.extend(await asyncio.gather(
+            *(run_dimension(key, config) for key, config in dimension_items)
+        ))
 
-            return {
-                "dimensions": evaluation_results,
-                "total_score": total_score,
-                "missing_information": missing_info,
-                "evaluation_summary": self._generate_summary(total_score, evaluation_results)
-            }
+        # gather preserves argument order, so results follow the rubric order
+        return dict(zip(dimensions.keys(), results))
+
+    async def _evaluate_cascade(
+        self,
+        dimensions: Dict[str, Dict],
+        document_text: str,
+        run: Optional[EvaluationRun] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Score every dimension with the fast tier, then re-evaluate only the
+        low-confidence ones (see select_escalations) with the full tier.
+        """
+        run = run or EvaluationRun()
+        results = await self._evaluate_per_dimension(dimensions, document_text, run, FAST_TIER)
+        return await self._escalate(dimensions, results, document_text, run)
+
+    async def _escalate(
+        self,
+        dimensions: Dict[str, Dict],
+        results: Dict[str, Dict[str, Any]],
+        document_text: str,
+        run: EvaluationRun
+    ) -> Dict[str, Dict[str, Any]]:
+        """Re-evaluate the low-confidence fast tier results with the full tier (never with the same model)"""
+        if FAST_TIER.model == FULL_TIER.model:
+            return results
+        escalations = select_escalations(results)
+        if not escalations:
+            print("⚡ Cascade: fast tier accepted for every dimension")
+            return results
+
+        print(f"⬆️ Cascade: escalating {list(escalations)} to the full tier")
+        escalated = await self._evaluate_per_dimension(
+            {key: config for key, config in dimensions.items() if key in escalations},
+            document_text,
+            run,
+            FULL_TIER
+        )
+
+        for dimension_key, result in escalated.items():
+            # A failed full-tier call does not replace a usable fast-tier score
+            if result.get("fallback") and not results[dimension_key].get("fallback"):
+                print(f"⚠️ Full tier failed for {dimension_key}, keeping the fast tier score")
+                continue
+            result["escalation_reasons"] = escalations[dimension_key]
+            results[dimension_key] = result
+
+        return results
+
+    async def _evaluate_map_reduce(
+        self,
+        dimensions: Dict[str, Dict],
+        text_stream: AsyncIterator[str],
+        run: EvaluationRun
+    ) -> Tuple[Dict[str, Dict[str, Any]], str]:
+        """
+        Summarize the chunks of a long document concurrently, then score
+        every dimension over the combined digest
+
+        Chunks (see DigestChunker) are sent out for structured summaries as
+        soon as they are complete and the text read so far exceeds the
+        prompt budget. Documents that fit the budget, or whose summaries
+        all failed, are scored per dimension over the document itself.
+        Returns the results in rubric order and the complete document text.
+        """
+        prompt_budget = (
+            FULL_TIER.shared_context_token_budget if settings.DEEPSEEK_SHARED_CONTEXT
+            else FULL_TIER.context_token_budget
+        )
+        chunker = DigestChunker(settings.DEEPSEEK_MAP_REDUCE_CHUNK_TOKENS)
+        semaphore = asyncio.Semaphore(max(1, settings.DEEPSEEK_MAX_CONCURRENCY))
+        pieces: List[str] = []
+        chunks: List[str] = []
+        summaries: List[asyncio.Task] = []
+        document_tokens = 0
+
+        def summarize(completed_chunks: List[str]):
+            chunks.extend(completed_chunks)
+            if document_tokens <= prompt_budget:
+                return
+            for chunk in chunks[len(summaries):]:
+                summaries.append(asyncio.ensure_future(self._summarize_chunk(dimensions, chunk, run, semaphore)))
+
+        try:
+            async for piece in text_stream:
+                pieces.append(piece)
+                document_tokens += estimate_tokens(piece)
+                summarize(chunker.add_text(piece))
+            document_text = " ".join(pieces)
+            summarize(chunker.finish())
+
+            if document_tokens <= prompt_budget:
+                print(f"📄 Document fits the prompt budget ({document_tokens} tokens), scoring it directly")
+                return await self._evaluate_per_dimension(dimensions, document_text, run), document_text
+
+            chunk_summaries = [summary for summary in await asyncio.gather(*summaries) if summary is not None]
+        except BaseException:
+            for task in summaries:
+                task.cancel()
+            raise
+
+        if not chunk_summaries:
+            print("⚠️ Every chunk summary failed, scoring the document directly")
+            return await self._evaluate_per_dimension(dimensions, document_text, run), document_text
+
+        digest = render_digest(dimensions.keys(), chunk_summaries, settings.DEEPSEEK_MAP_REDUCE_DIGEST_TOKEN_BUDGET)
+        print(
+            f"🗜️ Digest of {len(chunk_summaries)}/{len(chunks)} chunks: "
+            f"{document_tokens} -> {estimate_tokens(digest)} tokens"
+        )
+        # Every dimension is scored over the same digest, a shared prompt prefix
+        contexts = {key: digest for key in dimensions}
+        return await self._run_dimensions(dimensions, contexts, run, FULL_TIER, semaphore), document_text
+
+    async def _summarize_chunk(
+        self,
+        dimensions: Dict[str, Dict],
+        chunk_text: str,
+        run: EvaluationRun,
+        semaphore: asyncio.Semaphore
+    ) -> Optional[Dict[str, List[str]]]:
+        """Facts of one chunk per dimension, or None when the summary fails"""
+        async with semaphore:
+            try:
+                output = await self._request_json(
+                    build_summary_prompt(dimensions, chunk_text),
+                    run,
+                    label="summary",
+                    max_tokens=settings.DEEPSEEK_MAP_REDUCE_SUMMARY_MAX_TOKENS,
+                    accept=lambda output: parse_summary(dimensions, output) is not None,
+                    response_format={"type": "json_object"}
+                )
+            except LLMProviderUnavailableError:
+                raise
+            except Exception as e:
+                print(f"⚠️ Chunk summary failed: {str(e)}")
+                return None
 
+        summary = parse_summary(dimensions, output)
+        if summary is None:
+            print("⚠️ Chunk summary has no rubric dimensions, skipping it")
+        return summary
+
+    async def _evaluate_combined(
+        self,
+        dimensions: Dict[str, Dict],
+        document_text: str,
+        run: Optional[EvaluationRun] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Evaluate every dimension with a single API call"""
+        run = run or EvaluationRun()
+        combined_results: Dict[str, Any] = {}
+
+        def on_partial(path: JSONPath, value: Any):
+            # Scores arrive under dimensions.<name>.score
+            if len(path) == 3 and path[0] == "dimensions" and path[2] in ("score", "max_score"):
+                run.publish("dimension_partial", dimension=path[1], field=path[2], value=value)
+
+        try:
+            document_index = DocumentIndex.from_text(document_text)
+            context_text = document_index.select_for_dimensions(
+                dimensions.keys(),
+                settings.DEEPSEEK_SHARED_CONTEXT_TOKEN_BUDGET
+            )
+            prompt = self._get_combined_prompt(dimensions, context_text)
+
+            print("🤖 Calling DeepSeek API for all dimensions (combined mode)")
+
+            try:
+                parsed = await self._request_json(
+                    prompt,
+                    run,
+                    label="combined",
+                    max_tokens=4000,
+                    on_partial=on_partial,
+                    accept=lambda output: isinstance(output, dict) and isinstance(output.get("dimensions"), dict),
+                    response_format={"type": "json_object"}
+                )
+            except json.JSONDecodeError as e:
+                print(f"⚠️ JSON parse error for combined evaluation: {str(e)}")
+                parsed = await self._repair_combined_output(dimensions, e.doc, run)
+
+            if isinstance(parsed, dict):
+                if isinstance(parsed.get("dimensions"), dict):
+                    combined_results = parsed["dimensions"]
+                else:
+                    # Dimensions returned at the top level
+                    combined_results = {key: value for key, value in parsed.items() if key in dimensions}
+
+        except LLMProviderUnavailableError:
+            raise
+        except json.JSONDecodeError as e:
+            print(f"⚠️ Combined output still invalid after repair: {str(e)}")
         except Exception as e:
-            print(f"❌ Evaluation failed: {str(e)}")
-            # Return fallback evaluation
-            return self._get_fallback_evaluation()
+            print(f"❌ Combined API call failed: {str(e)}")
+
+        # Split the response back into per-dimension results, in rubric order,
+        # repairing locally where possible
+        checks = {
+            dimension_key: check_dimension_output(dimension_config, combined_results.get(dimension_key))
+            for dimension_key, dimension_config in dimensions.items()
+        }
+
+        # Dimensions the model answered but got wrong are sent back for a fix
+        to_repair = [
+            dimension_key for dimension_key, check in checks.items()
+            if not check.ok and dimension_key in combined_results
+        ]
+        if to_repair:
+            repaired = await asyncio.gather(*(
+                self._repair_dimension_output(
+                    dimension_key,
+                    dimensions[dimension_key],
+                    json.dumps(combined_results[dimension_key], ensure_ascii=False),
+                    checks[dimension_key].errors,
+                    run
+                )
+                for dimension_key in to_repair
+            ))
+            checks.update(zip(to_repair, repaired))
+
+        evaluation_results = {}
+        invalid_dimensions = {}
+
+        for dimension_key, dimension_config in dimensions.items():
+            check = checks[dimension_key]
+            if check.ok:
+                dimension_result = check.result
+                dimension_result["tier"] = FULL_TIER.name
+                print(f"✅ Successfully evaluated {dimension_key}: {dimension_result['score']}/{dimension_config['max_score']}")
+                evaluation_results[dimension_key] = dimension_result
+                run.publish(
+                    "dimension_completed",
+                    dimension=dimension_key,
+                    score=dimension_result["score"],
+                    max_score=dimension_config["max_score"],
+                    tier=FULL_TIER.name
+                )
+            else:
+                invalid_dimensions[dimension_key] = dimension_config
+                evaluation_results[dimension_key] = None
+
+        # Re-run only the dimensions the combined response got wrong
+        if invalid_dimensions:
+            print(f"⚠️ Combined response invalid for {list(invalid_dimensions)}, re-evaluating per dimension")
+            retried = await self._evaluate_per_dimension(invalid_dimensions, document_text, run)
+            evaluation_results.update(retried)
+
+        return evaluation_results
 
     async def _evaluate_dimension(
         self,
         dimension: str,
         config: Dict,
-        document_text: str
+        document_text: str,
+        run: Optional[EvaluationRun] = None,
+        tier: EvaluationTier = FULL_TIER
     ) -> Dict[str, Any]:
-        """Evaluate a specific dimension using DeepSeek API"""
+        """Evaluate a specific dimension using DeepSeek API over its selected context"""
+        run = run or EvaluationRun()
+
+        def on_partial(path: JSONPath, value: Any):
+            if path in (("score",), ("max_score",)):
+                run.publish("dimension_partial", dimension=dimension, field=path[0], value=value)
+
         try:
             prompt = self._get_dimension_prompt(dimension, config, document_text)
 
             print(f"🤖 Calling DeepSeek API for dimension: {dimension}")
 
-            response = self.client.chat.completions.create(
-                model="deepseek-chat",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "你是一个专业的项目评审专家，负责评估商业计划书。请严格按照JSON格式返回评估结果。"
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.3,
-                max_tokens=2000
+            try:
+                parsed = await self._request_json(
+                    prompt,
+                    run,
+                    label=dimension,
+                    max_tokens=tier.max_tokens,
+                    on_partial=on_partial,
+                    accept=lambda output: check_dimension_output(config, output).ok,
+                    hedge=True,
+                    tier=tier
+                )
+                check = check_dimension_output(config, parsed)
+                raw_output = json.dumps(parsed, ensure_ascii=False)
+            except json.JSONDecodeError as e:
+                print(f"⚠️ JSON parse error for {dimension}: {str(e)}")
+                check = DimensionCheck(None, ["输出不是有效的JSON"], [])
+                raw_output = e.doc
+
+            # Send only the malformed output back instead of re-evaluating
+            if not check.ok:
+                check = await self._repair_dimension_output(dimension, config, raw_output, check.errors, run, tier)
+
+            if check.ok:
+                result = check.result
+                print(f"✅ Successfully evaluated {dimension}: {result['score']}/{config['max_score']}")
+            else:
+                print(f"⚠️ Invalid output for {dimension} after repair: {check.errors}")
+                result = self._get_fallback_dimension_evaluation(dimension, config)
+
+        except LLMProviderUnavailableError:
+            raise
+        except Exception as e:
+            print(f"❌ API call failed for {dimension}: {str(e)}")
+            result = self._get_fallback_dimension_evaluation(dimension, config)
+
+        if result.get("fallback"):
+            run.fallbacks.append(dimension)
+            llm_telemetry.record_fallback(dimension, tier.model)
+
+        # Record which tier produced the score
+        result["tier"] = tier.name
+        run.publish(
+            "dimension_completed",
+            dimension=dimension,
+            score=result.get("score"),
+            max_score=config["max_score"],
+            tier=tier.name
+        )
+        return result
+
+    async def _repair_dimension_output(
+        self,
+        dimension: str,
+        config: Dict,
+        raw_output: str,
+        problems: List[str],
+        run: EvaluationRun,
+        tier: EvaluationTier = FULL_TIER
+    ) -> DimensionCheck:
+        """Ask the model to fix one dimension's malformed output, without the document"""
+        print(f"🔧 Requesting repair of {dimension} output: {problems}")
+        prompt = build_repair_prompt(
+            dimension,
+            render_dimension_structure(dimension, config),
+            raw_output,
+            problems
+        )
+
+        try:
+            repaired = await self._request_json(
+                prompt,
+                run,
+                label=f"{dimension}:repair",
+                max_tokens=1500,
+                accept=lambda output: check_dimension_output(config, output).ok,
+                tier=tier,
+                response_format={"type": "json_object"}
             )
+        except LLMProviderUnavailableError:
+            raise
+        except Exception as e:
+            return DimensionCheck(None, problems + [f"修复失败: {str(e)}"], [])
 
-            # Parse the response
-            response_content = response.choices[0].message.content.strip()
+        check = check_dimension_output(config, repaired)
+        if check.ok:
+            check.result["repairs"].insert(0, "模型修复: " + "; ".join(problems))
+            check.result["model_repaired"] = True
+        return check
+
+    async def _repair_combined_output(self, dimensions: Dict[str, Dict], raw_output: str, run: EvaluationRun) -> Any:
+        """Ask the model to turn an unparseable combined response into valid JSON"""
+        print("🔧 Requesting repair of combined output")
+        prompt = build_repair_prompt(
+            "全部维度",
+            render_combined_structure(dimensions),
+            raw_output,
+            ["输出不是有效的JSON"]
+        )
+        return await self._request_json(
+            prompt,
+            run,
+            label="combined:repair",
+            max_tokens=4000,
+            response_format={"type": "json_object"}
+        )
 
-            # Clean up the response (remove markdown code blocks if present)
-            if response_content.startswith("```json"):
-                response_content = response_content.replace("```json", "").replace("```", "").strip()
+    async def _request_json(
+        self,
+        prompt: str,
+        run: EvaluationRun,
+        label: str = "",
+        max_tokens: int = 2000,
+        on_partial: Optional[Callable[[JSONPath, Any], None]] = None,
+        accept: Optional[Callable[[Any], bool]] = None,
+        hedge: bool = False,
+        tier: EvaluationTier = FULL_TIER,
+        **request_options
+    ) -> Any:
+        """
+        Send a prompt and return the parsed JSON response.
+
+        Responses are looked up in the LLM cache first unless the run
+        bypasses it; only responses that parse successfully (and pass
+        accept, when given) are written back. With DEEPSEEK_STREAMING the completion is streamed and
+        on_partial is called for each JSON value as soon as it is complete.
+        Raises json.JSONDecodeError when the response is not valid JSON and
+        LLMProviderUnavailableError when the provider cannot be reached.
+        hedge=True lets slow attempts be duplicated when hedging is enabled.
+        tier selects the model. Token usage, latency, retries, estimated
+        cost and outcome of the call (labelled by dimension and tier) are
+        added to the run and to the process-wide telemetry, whether the call
+        succeeded or not.
+        """
+        # The tier is part of the key: both tiers may use the same model, and an
+        # escalation must not get the fast tier's answer back from the cache
+        cache_key = llm_cache.make_key(
+            tier.model, DEFAULT_TEMPERATURE, SYSTEM_PROMPT, prompt,
+            tier=tier.name, max_tokens=max_tokens, options=request_options
+        )
+
+        if run.use_cache:
+            cached_content = await llm_cache.get_async(cache_key)
+            if cached_content is not None:
+                print("💾 LLM cache hit")
+                run.usage_log.append({"label": label, "tier": tier.name, "model": tier.model, "cached_response": True})
+                llm_telemetry.record_cached(label, tier.model)
+                return self._parse_json_response(cached_content)
+
+        messages = [
+            {
+                "role": "system",
+                "content": SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+
+        estimated_tokens = estimate_tokens(SYSTEM_PROMPT) + estimate_tokens(prompt) + max_tokens
+
+        async def admit_hedge() -> bool:
+            return await rate_limiter.admit_extra_async(estimated_tokens)
+
+        def attempt():
+            if not hedge:
+                return self._create_completion(messages, tier.model, max_tokens, on_partial, **request_options)
+            # Only the original request streams partial scores to subscribers;
+            # a duplicate must fit in the shared rate limit to be sent at all
+            return request_hedger.run(
+                lambda duplicate: self._create_completion(
+                    messages, tier.model, max_tokens, None if duplicate else on_partial, **request_options
+                ),
+                admit=admit_hedge
+            )
+
+        # Wall latency includes queueing for a slot, rate limiting and retries
+        started = time.monotonic()
+        completion: Optional[CompletionResult] = None
+        error: Optional[BaseException] = None
+
+        try:
+            # Take a slot in the process-wide pool (round-robin across plans), then
+            # queue on the shared rate limiter; retries and backoff happen there
+            async with call_pool.slot(run.owner):
+                completion = await request_scheduler.run(
+                    attempt,
+                    estimated_tokens=estimated_tokens,
+                    usage_tokens=lambda r: getattr(r.usage, "total_tokens", None)
+                )
+
+            # Parse the response
+            response_content = completion.content.strip()
 
             try:
-                result = json.loads(response_content)
-                print(f"✅ Successfully evaluated {dimension}: {result['score']}/{config['max_score']}")
-                return result
-            except json.JSONDecodeError as e:
-                print(f"⚠️ JSON parse error for {dimension}: {str(e)}")
+                result = self._parse_json_response(response_content)
+            except json.JSONDecodeError:
                 print(f"Raw response: {response_content}")
-                return self._get_fallback_dimension_evaluation(dimension, config)
+                raise
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            # Failed, unparseable and cancelled calls are recorded too, so error
+            # rates and the latency of calls that never returned stay visible
+            self._record_call(run, label, tier, time.monotonic() - started, completion, error)
 
-        except Exception as e:
-            print(f"❌ API call failed for {dimension}: {str(e)}")
-            return self._get_fallback_dimension_evaluation(dimension, config)
+        if accept is None or accept(result):
+            await llm_cache.set_async(cache_key, response_content)
+        return result
 
-    def _get_dimension_prompt(self, dimension: str, config: Dict, document_text: str) -> str:
-        """Generate evaluation prompt for specific dimension"""
-
-        prompts = {
-            "团队能力": f"""
-请分析以下商业计划书中的团队能力维度，总分{config['max_score']}分。
-
-评分标准：
-- 核心团队背景 (10分): 核心成员的行业经验、技术背景、管理经验
-- 团队完整性 (10分): 核心岗位配置完整性、团队规模合理性、团队结构
-- 团队执行力 (10分): 过往项目成就、执行经验、资源整合能力
-
-商业计划书内容：
-{document_text[:3000]}
-
-请返回JSON格式的评估结果：
-{{
-    "score": 总分数值,
-    "max_score": {config['max_score']},
-    "comments": "详细评价，100字以内",
-    "sub_dimensions": [
-        {{"sub_dimension": "核心团队背景", "score": 分数, "max_score": 10, "comments": "评价"}},
-        {{"sub_dimension": "团队完整性", "score": 分数, "max_score": 10, "comments": "评价"}},
-        {{"sub_dimension": "团队执行力", "score": 分数, "max_score": 10, "comments": "评价"}}
-    ],
-    "missing_info": [
-        {{"type": "缺失信息类型", "description": "具体描述缺失的团队信息"}}
-    ]
-}}
-""",
-            "产品&技术": f"""
-请分析以下商业计划书中的产品技术能力维度，总分{config['max_score']}分。
-
-评分标准：
-- 技术创新性 (8分): 技术先进性、专利/IP保护、技术壁垒
-- 产品成熟度 (6分): 产品完成度、技术可行性、产品迭代能力
-- 研发能力 (6分): 研发投入、技术团队实力、创新能力
-
-商业计划书内容：
-{document_text[:3000]}
-
-请返回JSON格式的评估结果：
-{{
-    "score": 总分数值,
-    "max_score": {config['max_score']},
-    "comments": "详细评价，100字以内",
-    "sub_dimensions": [
-        {{"sub_dimension": "技术创新性", "score": 分数, "max_score": 8, "comments": "评价"}},
-        {{"sub_dimension": "产品成熟度", "score": 分数, "max_score": 6, "comments": "评价"}},
-        {{"sub_dimension": "研发能力", "score": 分数, "max_score": 6, "comments": "评价"}}
-    ],
-    "missing_info": [
-        {{"type": "缺失信息类型", "description": "具体描述缺失的技术信息"}}
-    ]
-}}
-""",
-            "市场前景": f"""
-请分析以下商业计划书中的市场竞争力维度，总分{config['max_score']}分。
-
-评分标准：
-- 市场空间 (8分): 市场规模、市场增长率、市场潜力
-- 竞争分析 (6分): 竞争格局、竞争优势、市场定位
-- 市场策略 (6分): 营销策略、渠道建设、品牌建设
-
-商业计划书内容：
-{document_text[:3000]}
-
-请返回JSON格式的评估结果：
-{{
-    "score": 总分数值,
-    "max_score": {config['max_score']},
-    "comments": "详细评价，100字以内",
-    "sub_dimensions": [
-        {{"sub_dimension": "市场空间", "score": 分数, "max_score": 8, "comments": "评价"}},
-        {{"sub_dimension": "竞争分析", "score": 分数, "max_score": 6, "comments": "评价"}},
-        {{"sub_dimension": "市场策略", "score": 分数, "max_score": 6, "comments": "评价"}}
-    ],
-    "missing_info": [
-        {{"type": "缺失信息类型", "description": "具体描述缺失的市场信息"}}
-    ]
-}}
-""",
-            "商业模式": f"""
-请分析以下商业计划书中的商业模式维度，总分{config['max_score']}分。
-
-评分标准：
-- 盈利模式 (8分): 收入来源、成本结构、毛利率
-- 运营模式 (6分): 运营效率、资源利用、流程设计
-- 发展模式 (6分): 扩张策略、资源整合、风险控制
-
-商业计划书内容：
-{document_text[:3000]}
-
-请返回JSON格式的评估结果：
-{{
-    "score": 总分数值,
-    "max_score": {config['max_score']},
-    "comments": "详细评价，100字以内",
-    "sub_dimensions": [
-        {{"sub_dimension": "盈利模式", "score": 分数, "max_score": 8, "comments": "评价"}},
-        {{"sub_dimension": "运营模式", "score": 分数, "max_score": 6, "comments": "评价"}},
-        {{"sub_dimension": "发展模式", "score": 分数, "max_score": 6, "comments": "评价"}}
-    ],
-    "missing_info": [
-        {{"type": "缺失信息类型", "description": "具体描述缺失的商业模式信息"}}
-    ]
-}}
-""",
-            "财务情况": f"""
-请分析以下商业计划书中的财务情况维度，总分{config['max_score']}分。
-
-评分标准：
-- 财务状况 (5分): 收入情况、成本控制、现金流
-- 融资需求 (5分): 资金需求、融资计划、估值合理性
-
-商业计划书内容：
-{document_text[:3000]}
-
-请返回JSON格式的评估结果：
-{{
-    "score": 总分数值,
-    "max_score": {config['max_score']},
-    "comments": "详细评价，100字以内",
-    "sub_dimensions": [
-        {{"sub_dimension": "财务状况", "score": 分数, "max_score": 5, "comments": "评价"}},
-        {{"sub_dimension": "融资需求", "score": 分数, "max_score": 5, "comments": "评价"}}
-    ],
-    "missing_info": [
-        {{"type": "缺失信息类型", "description": "具体描述缺失的财务信息"}}
-    ]
-}}
-"""
+    async def _create_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        max_tokens: int,
+        on_partial: Optional[Callable[[JSONPath, Any], None]] = None,
+        **request_options
+    ) -> CompletionResult:
+        """Run one chat completion, streaming it when DEEPSEEK_STREAMING is on"""
+        started = time.monotonic()
+
+        if not settings.DEEPSEEK_STREAMING:
+            response = await self.client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=DEFAULT_TEMPERATURE,
+                max_tokens=max_tokens,
+                **request_options
+            )
+            return CompletionResult(
+                content=response.choices[0].message.content or "",
+                usage=getattr(response, "usage", None)
+            )
+
+        stream = await self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=DEFAULT_TEMPERATURE,
+            max_tokens=max_tokens,
+            stream=True,
+            stream_options={"include_usage": True},
+            **request_options
+        )
+
+        parser = IncrementalJSONParser()
+        parts: List[str] = []
+        usage = None
+        first_token_latency = None
+
+        try:
+            async for chunk in stream:
+                # The final chunk carries usage and no choices
+                if getattr(chunk, "usage", None):
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+
+                if first_token_latency is None:
+                    first_token_latency = time.monotonic() - started
+                parts.append(delta)
+
+                if on_partial:
+                    for path, value in parser.feed(delta):
+                        on_partial(path, value)
+        finally:
+            # Release the connection promptly when a hedged or timed-out call is cancelled
+            close = getattr(stream, "close", None)
+            if close:
+                await close()
+
+        return CompletionResult(
+            content="".join(parts),
+            usage=usage,
+            first_token_latency=first_token_latency
+        )
+
+    def _record_call(
+        self,
+        run: EvaluationRun,
+        label: str,
+        tier: EvaluationTier,
+        latency: float,
+        completion: Optional[CompletionResult],
+        error: Optional[BaseException]
+    ):
+        """Add one API call, successful or not, to the run's usage log and the telemetry"""
+        usage = self._extract_usage(completion)
+        cost = estimate_cost(usage["prompt_tokens"], usage["completion_tokens"], usage["prompt_cache_hit_tokens"])
+        outcome = self._call_outcome(error)
+
+        if completion is not None:
+            print(
+                f"📊 {label or 'DeepSeek'} usage: prompt={usage['prompt_tokens']} "
+                f"(cache hit {usage['prompt_cache_hit_tokens']}), completion={usage['completion_tokens']}, "
+                f"{latency:.1f}s, ~${cost:.5f}"
+            )
+        if error is not None:
+            print(f"⚠️ {label or 'DeepSeek'} call failed ({outcome}) after {latency:.1f}s: {type(error).__name__}")
+
+        first_token_latency = getattr(completion, "first_token_latency", None)
+        call_record = {
+            "label": label,
+            "tier": tier.name,
+            "model": tier.model,
+            "cached_response": False,
+            "outcome": outcome,
+            "error": f"{type(error).__name__}: {str(error)[:200]}" if error is not None else None,
+            **usage,
+            "latency_seconds": round(latency, 3),
+            "first_token_seconds": round(first_token_latency, 3) if first_token_latency is not None else None,
+            # The scheduler tags both results and raised errors with the retries spent
+            "retries": getattr(completion if completion is not None else error, "retries", 0),
+            "estimated_cost": round(cost, 6),
+            "hedge": getattr(completion, "hedge", None)
         }
+        run.usage_log.append(call_record)
+        llm_telemetry.record_call(label, tier.model, call_record)
 
-        return prompts.get(dimension, "")
+    @staticmethod
+    def _call_outcome(error: Optional[BaseException]) -> str:
+        """Classify how an API call ended, for the usage log and telemetry"""
+        if error is None:
+            return "ok"
+        if isinstance(error, asyncio.CancelledError):
+            return "cancelled"
+        if isinstance(error, json.JSONDecodeError):
+            return "invalid_json"
+        if isinstance(error, LLMProviderUnavailableError):
+            return "unavailable"
+        return "error"
+
+    def _extract_usage(self, response: Any) -> Dict[str, int]:
+        """Read token counts, including DeepSeek's context-cache fields, from a response"""
+        usage = getattr(response, "usage", None)
+        fields = (
+            "prompt_tokens",
+            "completion_tokens",
+            "prompt_cache_hit_tokens",
+            "prompt_cache_miss_tokens",
+        )
+        return {field: int(getattr(usage, field, 0) or 0) for field in fields}
+
+    def _summarize_usage(
+        self,
+        usage_log: List[Dict[str, Any]],
+        fallbacks: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Aggregate per-call token usage, latency and cost for one evaluation"""
+        summary = {
+            "api_calls": 0,
+            "failed_calls": 0,
+            "cached_responses": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "prompt_cache_hit_tokens": 0,
+            "prompt_cache_miss_tokens": 0,
+            "hedged_calls": 0,
+            "hedge_wins": 0,
+            "tier_calls": {},
+            "retries": 0,
+            "estimated_cost": 0.0,
+            "max_latency_seconds": 0.0,
+            "fallback_dimensions": list(fallbacks or []),
+            "by_label": {},
+        }
+        for entry in usage_log:
+            if entry.get("cached_response"):
+                summary["cached_responses"] += 1
+                continue
+            summary["api_calls"] += 1
+            if entry.get("outcome", "ok") != "ok":
+                summary["failed_calls"] += 1
+            tier_name = entry.get("tier", FULL_TIER.name)
+            summary["tier_calls"][tier_name] = summary["tier_calls"].get(tier_name, 0) + 1
+            if entry.get("hedge"):
+                summary["hedged_calls"] += 1
+                summary["hedge_wins"] += entry["hedge"] == "won"
+            for field in ("prompt_tokens", "completion_tokens", "prompt_cache_hit_tokens", "prompt_cache_miss_tokens"):
+                summary[field] += entry.get(field, 0)
+            summary["retries"] += entry.get("retries", 0)
+            summary["estimated_cost"] += entry.get("estimated_cost", 0.0)
+            summary["max_latency_seconds"] = max(summary["max_latency_seconds"], entry.get("latency_seconds", 0.0))
+
+            label_summary = summary["by_label"].setdefault(entry.get("label") or "unlabelled", {
+                "calls": 0,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "latency_seconds": 0.0,
+                "estimated_cost": 0.0
+            })
+            label_summary["calls"] += 1
+            for field in ("prompt_tokens", "completion_tokens", "latency_seconds", "estimated_cost"):
+                label_summary[field] += entry.get(field, 0)
+
+        prompt_tokens = summary["prompt_tokens"]
+        summary["prompt_cache_hit_ratio"] = (
+            round(summary["prompt_cache_hit_tokens"] / prompt_tokens, 4) if prompt_tokens else 0.0
+        )
+        summary["estimated_cost"] = round(summary["estimated_cost"], 6)
+        summary["calls"] = usage_log
+        return summary
+
+    def _parse_json_response(self, response_content: str) -> Any:
+        """Parse a JSON response, tolerating fences, surrounding prose and near-JSON"""
+        return extract_json(response_content)
+
+    def _get_combined_prompt(self, dimensions: Dict[str, Dict], document_text: str) -> str:
+        """Generate a single prompt covering every evaluation dimension"""
+        return build_combined_prompt(dimensions, document_text)
+
+    def _get_dimension_prompt(self, dimension: str, config: Dict, document_text: str) -> str:
+        """Generate evaluation prompt for specific dimension from the template registry"""
+        return build_dimension_prompt(dimension, config, document_text)
 
     def _get_fallback_dimension_evaluation(self, dimension: str, config: Dict) -> Dict[str, Any]:
         """Return fallback evaluation when API fails"""
@@ -297,7 +1119,8 @@ class DeepSeekClient:
                     "type": "AI评估失败",
                     "description": f"{dimension}维度需要人工评审"
                 }
-            ]
+            ],
+            "fallback": True
         }
 
     def _get_fallback_evaluation(self) -> Dict[str, Any]:
@@ -0,0 +1,87 @@
+# File: backend/app/services/evaluation/fair_scheduler.py
+
+import asyncio
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict
+from ...core.config.settings import settings
+
+
+class FairCallPool:
+    """
+    Bounded pool of LLM call slots shared by every evaluation in the process.
+
+    Waiting calls are queued per owner (one business plan) and slots are
+    handed out round-robin across owners, so a plan that queued all of its
+    dimension calls first cannot starve the plans behind it. Each plan in a
+    burst keeps making progress and the pool stays saturated.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max(1, max_concurrency)
+        self._active = 0
+        self._waiting: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+
+    @asynccontextmanager
+    async def slot(self, owner: str) -> AsyncIterator[None]:
+        """Hold one call slot for owner for the duration of the block"""
+        await self._acquire(owner)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, owner: str):
+        if self._active < self.max_concurrency and not self._waiting:
+            self._active += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiting.setdefault(owner, deque()).append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted just as the waiter was cancelled
+                self._release()
+            else:
+                self._discard(owner, future)
+            raise
+
+    def _discard(self, owner: str, future: asyncio.Future):
+        queue = self._waiting.get(owner)
+        if queue and future in queue:
+            queue.remove(future)
+            if not queue:
+                del self._waiting[owner]
+
+    def _release(self):
+        self._active -= 1
+        self._grant_next()
+
+    def _grant_next(self):
+        while self._active < self.max_concurrency and self._waiting:
+            owner, queue = next(iter(self._waiting.items()))
+            future = queue.popleft()
+            # Rotate the owner to the back so the next slot goes to someone else
+            if queue:
+                self._waiting.move_to_end(owner)
+            else:
+                del self._waiting[owner]
+
+            if future.cancelled():
+                continue
+            self._active += 1
+            future.set_result(None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "active": self._active,
+            "queued": sum(len(queue) for queue in self._waiting.values()),
+            "waiting_owners": len(self._waiting)
+        }
+
+
+# Global instance
+call_pool = FairCallPool(settings.DEEPSEEK_GLOBAL_CONCURRENCY)
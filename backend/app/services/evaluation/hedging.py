@@ -0,0 +1,160 @@
+# File: backend/app/services/evaluation/hedging.py
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+from ...core.config.settings import settings
+
+
+class LatencyHistogram:
+    """Rolling window of recent call latencies"""
+
+    def __init__(self, window: int):
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, latency: float):
+        self._samples.append(latency)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[index]
+
+
+class RequestHedger:
+    """
+    Fires a duplicate of a slow call and keeps whichever answers first.
+
+    The hedge delay is the configured percentile of recent request
+    latencies (measured from the original call, whichever attempt
+    answered), so only calls in the slow tail are duplicated. Hedges are
+    capped at max_extra_ratio of the calls in the rolling window, and are
+    skipped when admit() refuses the extra request (e.g. the circuit
+    breaker is tripped or the shared rate limiter has no capacity), so
+    hedging never adds load while throttled or failing.
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        percentile: float,
+        max_extra_ratio: float,
+        min_samples: int,
+        window: int
+    ):
+        self.enabled = enabled
+        self.percentile = percentile
+        self.max_extra_ratio = max_extra_ratio
+        self.min_samples = min_samples
+        self.histogram = LatencyHistogram(window)
+        # Whether each recent call was hedged, for the spend cap
+        self._recent_hedges: Deque[bool] = deque(maxlen=window)
+        self.calls = 0
+        self.hedges_fired = 0
+        self.hedge_wins = 0
+        self.hedges_skipped = 0
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, None while the histogram is warming up"""
+        if len(self.histogram) < self.min_samples:
+            return None
+        return self.histogram.percentile(self.percentile)
+
+    def _within_budget(self) -> bool:
+        hedged = sum(self._recent_hedges)
+        return hedged + 1 <= self.max_extra_ratio * len(self._recent_hedges)
+
+    async def run(
+        self,
+        make_call: Callable[[bool], Awaitable[Any]],
+        admit: Optional[Callable[[], Awaitable[bool]]] = None
+    ) -> Any:
+        """
+        Run make_call(False), hedging with make_call(True) when it is slow.
+
+        The flag tells the call whether it is the duplicate. The winning
+        result gets a hedge attribute: None when no hedge was fired,
+        "won" when the duplicate answered first, "lost" otherwise.
+        """
+        if not self.enabled:
+            return await make_call(False)
+
+        self.calls += 1
+        started = time.monotonic()
+        primary = asyncio.create_task(make_call(False))
+        tasks = {primary}
+        hedge_task = None
+
+        try:
+            delay = self.hedge_delay()
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done:
+                    if self._within_budget() and (admit is None or await admit()):
+                        hedge_task = asyncio.create_task(make_call(True))
+                        tasks.add(hedge_task)
+                        self.hedges_fired += 1
+                        print(f"🏁 Hedging slow DeepSeek call after {delay:.1f}s")
+                    else:
+                        self.hedges_skipped += 1
+
+            self._recent_hedges.append(hedge_task is not None)
+
+            error: Optional[BaseException] = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = error or task.exception()
+                        continue
+
+                    result = task.result()
+                    won = task is hedge_task
+                    # The primary's latency: when the duplicate wins, the primary has taken
+                    # at least this long. Recording the duplicate's shorter time would pull
+                    # the hedge delay down and hedge ever more calls
+                    self.histogram.record(time.monotonic() - started)
+                    if hedge_task is not None:
+                        if won:
+                            self.hedge_wins += 1
+                        setattr(result, "hedge", "won" if won else "lost")
+                    return result
+
+            # Every attempt failed: surface the first error to the scheduler
+            raise error
+        finally:
+            for task in (primary, hedge_task):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        delay = self.hedge_delay()
+        return {
+            "enabled": self.enabled,
+            "percentile": self.percentile,
+            "current_hedge_delay": round(delay, 3) if delay is not None else None,
+            "samples": len(self.histogram),
+            "calls": self.calls,
+            "hedges_fired": self.hedges_fired,
+            "hedges_skipped": self.hedges_skipped,
+            "hedge_wins": self.hedge_wins,
+            "hedge_win_rate": round(self.hedge_wins / self.hedges_fired, 4) if self.hedges_fired else 0.0,
+            "extra_call_ratio": round(self.hedges_fired / self.calls, 4) if self.calls else 0.0,
+            "max_extra_ratio": self.max_extra_ratio
+        }
+
+
+# Global instance
+request_hedger = RequestHedger(
+    enabled=settings.DEEPSEEK_HEDGING_ENABLED,
+    percentile=settings.DEEPSEEK_HEDGE_PERCENTILE,
+    max_extra_ratio=settings.DEEPSEEK_HEDGE_MAX_EXTRA_RATIO,
+    min_samples=settings.DEEPSEEK_HEDGE_MIN_SAMPLES,
+    window=settings.DEEPSEEK_HEDGE_WINDOW
+)
@@ -0,0 +1,109 @@
+# File: backend/app/services/evaluation/map_reduce.py
+
+import re
+import zlib
+from typing import Any, Dict, Iterable, List, Optional
+from ..document.text_processing import TextChunker
+from ...utils.token_utils import estimate_tokens
+
+# DocumentProcessor's page markers once the text is whitespace-normalized
+_PAGE_MARKER = re.compile(r'\s*--- 第\d+页 ---\s*')
+
+DIGEST_HEADER = "（以下为篇幅较长的商业计划书按评审维度整理的要点摘要）\n\n"
+
+
+def split_pages(text: str) -> List[str]:
+    """Page texts of a document or stream piece, without page markers"""
+    return [page for page in _PAGE_MARKER.split(text) if page.strip()]
+
+
+class DigestChunker:
+    """
+    Groups the pages of a long document into chunks to be summarized.
+
+    Chunk boundaries are content-defined: a chunk closes after a page
+    whose checksum hits one in boundary_pages once it holds min_tokens,
+    or before a page that would push it past max_tokens. An edit to one
+    page therefore changes its own chunk (and at most the chunks up to the
+    next content-defined boundary) while every other chunk keeps its exact
+    text, and with it its cached summary. Pages longer than max_tokens are
+    split by TextChunker.
+    """
+
+    def __init__(self, max_tokens: int, boundary_pages: int = 3):
+        self.max_tokens = max(1, max_tokens)
+        self.min_tokens = self.max_tokens // 3
+        self.boundary_pages = max(1, boundary_pages)
+        self._pages: List[str] = []
+        self._tokens = 0
+
+    def add_text(self, text: str) -> List[str]:
+        """Feed one or more pages; returns the chunks they completed"""
+        completed = []
+        for page in split_pages(text):
+            page_tokens = estimate_tokens(page)
+            if self._pages and self._tokens + page_tokens > self.max_tokens:
+                completed.append(self._close())
+
+            if page_tokens > self.max_tokens:
+                completed.extend(TextChunker(page).token_chunks(self.max_tokens))
+                continue
+
+            self._pages.append(page)
+            self._tokens += page_tokens
+            if self._tokens >= self.min_tokens and zlib.crc32(page.encode("utf-8")) % self.boundary_pages == 0:
+                completed.append(self._close())
+        return completed
+
+    def finish(self) -> List[str]:
+        """The last, partial chunk"""
+        return [self._close()] if self._pages else []
+
+    def _close(self) -> str:
+        chunk = "\n".join(self._pages)
+        self._pages = []
+        self._tokens = 0
+        return chunk
+
+
+def parse_summary(dimensions: Iterable[str], output: Any) -> Optional[Dict[str, List[str]]]:
+    """Facts per dimension from a summary response, or None when it has none of the dimensions"""
+    dimensions = list(dimensions)
+    if not isinstance(output, dict) or not any(dimension in output for dimension in dimensions):
+        return None
+    summary = {}
+    for dimension in dimensions:
+        facts = output.get(dimension) or []
+        if isinstance(facts, str):
+            facts = [facts]
+        summary[dimension] = [
+            str(fact).strip() for fact in facts
+            if isinstance(fact, (str, int, float)) and str(fact).strip()
+        ]
+    return summary
+
+
+def render_digest(dimensions: Iterable[str], summaries: List[Dict[str, List[str]]], token_budget: int) -> str:
+    """
+    Combine chunk summaries into one digest, a section per dimension
+
+    Facts keep document order and repeated facts are listed once. Each
+    section gets an equal share of token_budget; facts that no longer fit
+    in their section are left out.
+    """
+    dimensions = list(dimensions)
+    section_budget = token_budget // max(1, len(dimensions))
+    sections = []
+    for dimension in dimensions:
+        facts: Dict[str, None] = {}
+        used_tokens = 0
+        for summary in summaries:
+            for fact in summary.get(dimension, []):
+                fact_tokens = estimate_tokens(fact)
+                if fact in facts or used_tokens + fact_tokens > section_budget:
+                    continue
+                facts[fact] = None
+                used_tokens += fact_tokens
+        lines = "\n".join(f"- {fact}" for fact in facts) or "- 未提及"
+        sections.append(f"【{dimension}】\n{lines}")
+    return DIGEST_HEADER + "\n\n".join(sections)
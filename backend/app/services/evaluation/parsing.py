@@ -0,0 +1,274 @@
+# File: backend/app/services/evaluation/parsing.py
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+from pydantic import ValidationError
+from ...models.evaluation import LLMDimensionOutput
+
+_FENCE = re.compile(r'```(?:json|JSON)?\s*(.*?)```', re.DOTALL)
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+# Differences below this are rounding, not arithmetic mistakes
+SCORE_TOLERANCE = 0.5
+
+
+def _balanced_spans(text: str, start: int) -> List[str]:
+    """
+    Return the JSON value starting at text[start]. When the output was cut
+    off, return repair candidates instead: the text with its open brackets
+    closed, and the text cut back to the last complete element.
+    """
+    stack: List[str] = []
+    quote = None
+    escape = False
+    last_comma = None
+    for i in range(start, len(text)):
+        ch = text[i]
+        if quote:
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == quote:
+                quote = None
+            continue
+        if ch in '"\'':
+            quote = ch
+        elif ch in '{[':
+            stack.append('}' if ch == '{' else ']')
+        elif ch in '}]':
+            if stack:
+                stack.pop()
+            if not stack:
+                return [text[start:i + 1]]
+        elif ch == ',':
+            last_comma = (i, list(stack))
+
+    tail = text[start:]
+    if quote:
+        tail += quote
+    candidates = [tail.rstrip().rstrip(',:') + "".join(reversed(stack))]
+    if last_comma:
+        cut, open_brackets = last_comma
+        candidates.append(text[start:cut] + "".join(reversed(open_brackets)))
+    return candidates
+
+
+def _normalize_tokens(text: str) -> str:
+    """
+    Rewrite near-JSON into JSON outside of string literals: single-quoted
+    strings become double-quoted, bare object keys are quoted, Python
+    literals are lowercased and trailing commas are dropped.
+    """
+    out: List[str] = []
+    i = 0
+    length = len(text)
+    while i < length:
+        ch = text[i]
+
+        if ch in '"\'':
+            # Copy the string literal, re-quoting it with double quotes
+            j = i + 1
+            chars = []
+            while j < length and text[j] != ch:
+                if text[j] == '\\' and j + 1 < length:
+                    if ch == "'" and text[j + 1] == "'":
+                        chars.append("'")
+                    else:
+                        chars.append(text[j:j + 2])
+                    j += 2
+                    continue
+                chars.append('\\"' if text[j] == '"' and ch == "'" else text[j])
+                j += 1
+            out.append('"' + "".join(chars) + '"')
+            i = j + 1
+            continue
+
+        if ch == ',':
+            # Trailing comma before a closing bracket
+            j = i + 1
+            while j < length and text[j].isspace():
+                j += 1
+            if j < length and text[j] in '}]':
+                i += 1
+                continue
+
+        if ch.isalpha() or ch == '_':
+            j = i
+            while j < length and (text[j].isalnum() or text[j] == '_'):
+                j += 1
+            word = text[i:j]
+            k = j
+            while k < length and text[k].isspace():
+                k += 1
+            if k < length and text[k] == ':':
+                out.append(f'"{word}"')
+            else:
+                out.append(_PYTHON_LITERALS.get(word, word))
+            i = j
+            continue
+
+        out.append(ch)
+        i += 1
+
+    return "".join(out)
+
+
+def extract_json(text: str) -> Any:
+    """
+    Extract the JSON value from an LLM response.
+
+    Tries, in order: the text as-is, the contents of a markdown fence, the
+    first balanced object or array (dropping surrounding prose and closing
+    truncated output), and finally the same span after lexical fixes for
+    single quotes, bare keys, Python literals and trailing commas. Raises
+    json.JSONDecodeError with the original text as .doc when nothing parses.
+    """
+    stripped = text.strip()
+    try:
+        return json.loads(stripped)
+    except json.JSONDecodeError:
+        pass
+
+    candidates = []
+    fence = _FENCE.search(stripped)
+    if fence:
+        candidates.append(fence.group(1).strip())
+
+    starts = [pos for pos in (stripped.find('{'), stripped.find('[')) if pos != -1]
+    if starts:
+        candidates.extend(_balanced_spans(stripped, min(starts)))
+
+    for candidate in candidates:
+        try:
+            return json.loads(candidate)
+        except json.JSONDecodeError:
+            pass
+
+    for candidate in candidates:
+        try:
+            return json.loads(_normalize_tokens(candidate))
+        except json.JSONDecodeError:
+            pass
+
+    raise json.JSONDecodeError("No valid JSON value found in response", text, 0)
+
+
+def _match_sub_dimensions(expected: Dict[str, float], received: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Map rubric sub-dimension names to the received entries: exact names
+    first, then names containing each other (e.g. "1. 核心团队背景"), then
+    position when the counts line up.
+    """
+    matched: Dict[str, Dict[str, Any]] = {}
+    remaining = list(received)
+
+    for name in expected:
+        for entry in remaining:
+            if entry["sub_dimension"].strip() == name:
+                matched[name] = entry
+                remaining.remove(entry)
+                break
+
+    for name in expected:
+        if name in matched:
+            continue
+        for entry in remaining:
+            label = entry["sub_dimension"].strip()
+            if label and (name in label or label in name):
+                matched[name] = entry
+                remaining.remove(entry)
+                break
+
+    unmatched = [name for name in expected if name not in matched]
+    if unmatched and len(remaining) == len(unmatched):
+        matched.update(zip(unmatched, remaining))
+
+    return matched
+
+
+class DimensionCheck:
+    """Outcome of checking one dimension's output against the rubric"""
+
+    def __init__(self, result: Optional[Dict[str, Any]], errors: List[str], repairs: List[str]):
+        self.result = result
+        # Problems that need the model to fix the output
+        self.errors = errors
+        # Local fixes already applied to result
+        self.repairs = repairs
+
+    @property
+    def ok(self) -> bool:
+        return self.result is not None and not self.errors
+
+
+def check_dimension_output(config: Dict, data: Any) -> DimensionCheck:
+    """
+    Validate a dimension result against the rubric, fixing what can be
+    fixed locally.
+
+    Sub-dimension names are matched leniently and their scores clamped to
+    the rubric maxima; the dimension score is recomputed from its
+    sub-dimensions when it is missing, out of range or does not add up.
+    Missing or non-numeric sub-dimension scores cannot be fixed locally
+    and are reported as errors.
+    """
+    if not isinstance(data, dict):
+        return DimensionCheck(None, ["输出不是JSON对象"], [])
+
+    try:
+        output = LLMDimensionOutput.model_validate(data)
+    except ValidationError as e:
+        return DimensionCheck(None, [f"字段格式错误: {error['loc']} {error['msg']}" for error in e.errors()], [])
+
+    errors: List[str] = []
+    repairs: List[str] = []
+    # Whether any score had to be changed, as opposed to cosmetic fixes
+    scores_adjusted = False
+    expected = config['sub_dimensions']
+    matched = _match_sub_dimensions(expected, [sub.model_dump() for sub in output.sub_dimensions])
+
+    sub_dimensions = []
+    for name, sub_max in expected.items():
+        entry = matched.get(name)
+        if entry is None:
+            errors.append(f"缺少子维度: {name}")
+            continue
+        score = entry["score"]
+        if score is None:
+            errors.append(f"子维度{name}缺少分数")
+            continue
+        if entry["sub_dimension"] != name:
+            repairs.append(f"子维度名称'{entry['sub_dimension']}'更正为'{name}'")
+        clamped = min(max(score, 0), sub_max)
+        if clamped != score:
+            scores_adjusted = True
+            repairs.append(f"子维度{name}分数{score}限制在0-{sub_max}")
+        sub_dimensions.append({
+            "sub_dimension": name,
+            "score": clamped,
+            "max_score": sub_max,
+            "comments": entry["comments"]
+        })
+
+    if errors:
+        return DimensionCheck(None, errors, repairs)
+
+    sub_total = round(sum(sub["score"] for sub in sub_dimensions), 2)
+    score = output.score
+    if score is None or abs(score - sub_total) > SCORE_TOLERANCE or not 0 <= score <= config['max_score']:
+        repairs.append(f"维度总分{score}按子维度之和更正为{sub_total}")
+        scores_adjusted = True
+        score = sub_total
+
+    result = {
+        "score": min(score, config['max_score']),
+        "max_score": config['max_score'],
+        "comments": output.comments,
+        "sub_dimensions": sub_dimensions,
+        "missing_info": [info.model_dump() for info in output.missing_info],
+        "repairs": repairs,
+        "scores_adjusted": scores_adjusted
+    }
+    return DimensionCheck(result, [], repairs)
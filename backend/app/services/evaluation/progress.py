@@ -0,0 +1,113 @@
+# File: backend/app/services/evaluation/progress.py
+
+import asyncio
+import time
+from typing import Any, Dict, List
+
+
+class EvaluationProgressHub:
+    """
+    In-process fan-out of evaluation progress events per project.
+
+    The background evaluation publishes events (started, per-dimension
+    partial scores, completed dimensions, completion or failure) and every
+    server-sent-events subscriber for that project receives them. A snapshot
+    of the latest state is kept so late subscribers can catch up. Scheduling
+    a new run resets the snapshot, so a subscriber never sees the previous
+    run's result; a finished snapshot is dropped once its subscribers have
+    left, or finished_ttl seconds after the run ended. Events only reach
+    subscribers on the same worker process; the SSE endpoint falls back to
+    the stored business plan status for the rest.
+    """
+
+    def __init__(self, max_queue_size: int = 100, finished_ttl: float = 300):
+        self.max_queue_size = max_queue_size
+        self.finished_ttl = finished_ttl
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+        self._snapshots: Dict[str, Dict[str, Any]] = {}
+        # Monotonic time each finished run ended, for eviction
+        self._finished_at: Dict[str, float] = {}
+
+    def reset(self, project_id: str):
+        """Start a fresh snapshot for a run that was just scheduled"""
+        self._evict_finished()
+        self._finished_at.pop(project_id, None)
+        self._snapshots[project_id] = {"status": "processing", "dimensions": {}}
+
+    def publish(self, project_id: str, event: Dict[str, Any]):
+        """Record an event in the project's snapshot and push it to subscribers"""
+        self._evict_finished()
+        event = {**event, "project_id": project_id, "timestamp": time.time()}
+        self._update_snapshot(project_id, event)
+
+        for queue in self._subscribers.get(project_id, []):
+            if queue.full():
+                # Drop the oldest event rather than block the evaluation
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+            queue.put_nowait(event)
+
+    def subscribe(self, project_id: str) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._subscribers.setdefault(project_id, []).append(queue)
+        return queue
+
+    def unsubscribe(self, project_id: str, queue: asyncio.Queue):
+        queues = self._subscribers.get(project_id, [])
+        if queue in queues:
+            queues.remove(queue)
+        if not queues:
+            self._subscribers.pop(project_id, None)
+            # The last subscriber has seen the result; later ones read the stored status
+            if self._finished_at.pop(project_id, None) is not None:
+                self._snapshots.pop(project_id, None)
+
+    def snapshot(self, project_id: str) -> Dict[str, Any]:
+        """Latest known progress for a project, empty if none on this worker"""
+        self._evict_finished()
+        return self._snapshots.get(project_id, {})
+
+    def _evict_finished(self):
+        """Drop snapshots of runs that ended more than finished_ttl seconds ago"""
+        cutoff = time.monotonic() - self.finished_ttl
+        expired = [project_id for project_id, finished_at in self._finished_at.items() if finished_at < cutoff]
+        for project_id in expired:
+            del self._finished_at[project_id]
+            self._snapshots.pop(project_id, None)
+
+    def _update_snapshot(self, project_id: str, event: Dict[str, Any]):
+        event_type = event.get("type")
+
+        if event_type == "evaluation_started":
+            self._finished_at.pop(project_id, None)
+            self._snapshots[project_id] = {"status": "processing", "dimensions": {}}
+            return
+
+        snapshot = self._snapshots.setdefault(project_id, {"status": "processing", "dimensions": {}})
+        dimension = event.get("dimension")
+
+        if event_type == "dimension_partial" and dimension:
+            snapshot["dimensions"].setdefault(dimension, {}).update(
+                {"status": "streaming", event["field"]: event["value"]}
+            )
+        elif event_type == "dimension_completed" and dimension:
+            snapshot["dimensions"][dimension] = {
+                "status": "completed",
+                "score": event.get("score"),
+                "max_score": event.get("max_score"),
+                "tier": event.get("tier")
+            }
+        elif event_type == "evaluation_completed":
+            snapshot["status"] = "completed"
+            snapshot["total_score"] = event.get("total_score")
+            self._finished_at[project_id] = time.monotonic()
+        elif event_type == "evaluation_failed":
+            snapshot["status"] = "failed"
+            snapshot["error"] = event.get("error")
+            self._finished_at[project_id] = time.monotonic()
+
+
+# Global instance
+evaluation_progress = EvaluationProgressHub()
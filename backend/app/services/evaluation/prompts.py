@@ -0,0 +1,207 @@
+# File: backend/app/services/evaluation/prompts.py
+
+from typing import Dict, List
+from ...models.score import STANDARD_DIMENSIONS
+
+SYSTEM_PROMPT = "你是一个专业的项目评审专家，负责评估商业计划书。请严格按照JSON格式返回评估结果。"
+
+# Scoring criteria per sub-dimension
+DIMENSION_CRITERIA = {
+    "团队能力": {
+        "核心团队背景": "核心成员的行业经验、技术背景、管理经验",
+        "团队完整性": "核心岗位配置完整性、团队规模合理性、团队结构",
+        "团队执行力": "过往项目成就、执行经验、资源整合能力"
+    },
+    "产品&技术": {
+        "技术创新性": "技术先进性、专利/IP保护、技术壁垒",
+        "产品成熟度": "产品完成度、技术可行性、产品迭代能力",
+        "研发能力": "研发投入、技术团队实力、创新能力"
+    },
+    "市场前景": {
+        "市场空间": "市场规模、市场增长率、市场潜力",
+        "竞争分析": "竞争格局、竞争优势、市场定位",
+        "市场策略": "营销策略、渠道建设、品牌建设"
+    },
+    "商业模式": {
+        "盈利模式": "收入来源、成本结构、毛利率",
+        "运营模式": "运营效率、资源利用、流程设计",
+        "发展模式": "扩张策略、资源整合、风险控制"
+    },
+    "财务情况": {
+        "财务状况": "收入情况、成本控制、现金流",
+        "融资需求": "资金需求、融资计划、估值合理性"
+    }
+}
+
+# How each dimension is named in its instructions, and what kind of
+# information its missing_info entries describe
+DIMENSION_LABELS = {
+    "团队能力": ("团队能力", "团队"),
+    "产品&技术": ("产品技术能力", "技术"),
+    "市场前景": ("市场竞争力", "市场"),
+    "商业模式": ("商业模式", "商业模式"),
+    "财务情况": ("财务情况", "财务"),
+}
+
+# Every prompt starts with this block so that the system prompt and the
+# document form a byte-identical prefix across all dimension calls, which
+# DeepSeek's context cache bills at the cached-token rate.
+DOCUMENT_BLOCK = """商业计划书内容：
+{document_text}
+
+"""
+
+
+# Information supplied after the first review (e.g. for a resolved
+# missing_information item); it follows the document so that it is part of
+# the shared prefix when several dimensions are re-evaluated together
+SUPPLEMENT_BLOCK = """
+
+补充材料（企业在评审后补充提供，与商业计划书同等作为评估依据）：
+{additional_information}"""
+
+
+def with_supplement(document_text: str, additional_information: str) -> str:
+    """Append supplementary information to a document context"""
+    if not additional_information.strip():
+        return document_text
+    return document_text + SUPPLEMENT_BLOCK.format(additional_information=additional_information.strip())
+
+
+def render_dimension_structure(dimension: str, config: Dict, indent: str = "") -> str:
+    """Render the expected JSON structure for one dimension"""
+    info_label = DIMENSION_LABELS.get(dimension, (dimension, dimension))[1]
+    sub_examples = ",\n".join(
+        f'{indent}        {{"sub_dimension": "{sub_name}", "score": 分数, "max_score": {sub_max}, "comments": "评价"}}'
+        for sub_name, sub_max in config['sub_dimensions'].items()
+    )
+    return f"""{{
+{indent}    "score": 总分数值,
+{indent}    "max_score": {config['max_score']},
+{indent}    "comments": "详细评价，100字以内",
+{indent}    "sub_dimensions": [
+{sub_examples}
+{indent}    ],
+{indent}    "missing_info": [
+{indent}        {{"type": "缺失信息类型", "description": "具体描述缺失的{info_label}信息"}}
+{indent}    ]
+{indent}}}"""
+
+
+def _render_criteria(dimension: str, config: Dict) -> str:
+    criteria = DIMENSION_CRITERIA.get(dimension, {})
+    return "\n".join(
+        f"- {sub_name} ({sub_max}分): {criteria.get(sub_name, '')}"
+        for sub_name, sub_max in config['sub_dimensions'].items()
+    )
+
+
+def build_dimension_instructions(dimensions: Dict[str, Dict]) -> Dict[str, str]:
+    """Generate the dimension-specific instruction block for every rubric dimension"""
+    registry = {}
+    for dimension, config in dimensions.items():
+        focus = DIMENSION_LABELS.get(dimension, (dimension, dimension))[0]
+        registry[dimension] = f"""请分析以上商业计划书中的{focus}维度，总分{config['max_score']}分。
+
+评分标准：
+{_render_criteria(dimension, config)}
+
+请返回JSON格式的评估结果：
+{render_dimension_structure(dimension, config)}
+"""
+    return registry
+
+
+# Template registry generated from the standard rubric
+DIMENSION_INSTRUCTIONS = build_dimension_instructions(STANDARD_DIMENSIONS)
+
+
+def build_dimension_prompt(dimension: str, config: Dict, document_text: str) -> str:
+    """Document first, dimension-specific instructions last"""
+    instructions = DIMENSION_INSTRUCTIONS.get(dimension)
+    if instructions is None:
+        instructions = build_dimension_instructions({dimension: config})[dimension]
+    return DOCUMENT_BLOCK.format(document_text=document_text) + instructions
+
+
+def build_combined_prompt(dimensions: Dict[str, Dict], document_text: str) -> str:
+    """Single prompt covering every dimension, sharing the same document prefix"""
+    total_max = sum(config['max_score'] for config in dimensions.values())
+
+    criteria_text = "\n".join(
+        f"【{dimension}】({config['max_score']}分)\n{_render_criteria(dimension, config)}"
+        for dimension, config in dimensions.items()
+    )
+    return DOCUMENT_BLOCK.format(document_text=document_text) + f"""请分析以上商业计划书，按照下列全部评审维度分别打分，总分{total_max}分。
+
+评分标准：
+{criteria_text}
+
+请返回JSON格式的评估结果，dimensions中必须包含以上全部维度，且每个维度的分数不得超过其满分：
+{render_combined_structure(dimensions)}
+"""
+
+
+def render_combined_structure(dimensions: Dict[str, Dict]) -> str:
+    """Expected JSON structure of a combined response"""
+    example_text = ",\n".join(
+        f'        "{dimension}": {render_dimension_structure(dimension, config, indent="        ")}'
+        for dimension, config in dimensions.items()
+    )
+    return f"""{{
+    "dimensions": {{
+{example_text}
+    }}
+}}"""
+
+
+# Map step of map_reduce mode: one chunk of a long plan condensed into facts
+# per dimension. The prompt depends on nothing but the chunk text, so the LLM
+# cache serves the summaries of unchanged chunks when a plan is re-uploaded.
+SUMMARY_PROMPT = """以下是一份商业计划书中的一个片段：
+{chunk_text}
+
+请提取该片段中与项目评审相关的关键事实，按下列评审维度归类：
+{categories}
+
+要求：每条事实一句话，保留具体的人名、机构、数字、金额、比例和时间；只摘录片段中明确写出的内容，不要评价或推测；片段中没有相关内容的维度返回空数组。
+请返回JSON格式：
+{structure}
+"""
+
+
+def build_summary_prompt(dimensions: Dict[str, Dict], chunk_text: str) -> str:
+    """Ask for the facts of one document chunk, grouped by rubric dimension"""
+    categories = "\n".join(
+        f"- {dimension}: " + "；".join(DIMENSION_CRITERIA.get(dimension, {}).values())
+        for dimension in dimensions
+    )
+    structure = "{\n" + ",\n".join(f'    "{dimension}": ["事实"]' for dimension in dimensions) + "\n}"
+    return SUMMARY_PROMPT.format(chunk_text=chunk_text, categories=categories, structure=structure)
+
+
+# Follow-up prompt that sends back only a malformed response, never the
+# document, so fixing the output costs a fraction of a re-evaluation
+REPAIR_PROMPT = """以下是你对商业计划书“{label}”的评估输出，但它存在以下问题：
+{problems}
+
+请只修正上述格式和结构问题，保留原有的分数和评价内容，不要重新评估。各子维度分数之和应等于维度总分，且不得超过满分。
+请返回符合以下结构的JSON：
+{structure}
+
+原始输出：
+{raw_output}
+"""
+
+# Longer outputs are cut; the structure above tells the model what to keep
+REPAIR_MAX_OUTPUT_CHARS = 6000
+
+
+def build_repair_prompt(label: str, structure: str, raw_output: str, problems: List[str]) -> str:
+    """Ask the model to fix its own malformed output"""
+    return REPAIR_PROMPT.format(
+        label=label,
+        problems="\n".join(f"- {problem}" for problem in problems),
+        structure=structure,
+        raw_output=raw_output[:REPAIR_MAX_OUTPUT_CHARS]
+    )
@@ -0,0 +1,423 @@
+# File: backend/app/services/evaluation/rate_limiter.py
+
+import asyncio
+import random
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterator, Optional
+import openai
+from ...core.config.settings import settings
+
+
+class LLMProviderUnavailableError(Exception):
+    """Raised when the LLM provider stays unavailable after retries and queueing"""
+    pass
+
+
+# Errors worth retrying: throttling, timeouts, connection drops and 5xx responses
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    asyncio.TimeoutError,
+)
+
+
+class SharedRateLimiter:
+    """
+    Token-bucket limiter and circuit breaker whose state lives in SQLite.
+
+    Every uvicorn worker opens the same database file, so the
+    requests-per-minute and tokens-per-minute budgets and the breaker
+    state are enforced across the whole deployment rather than per
+    process. Each read-modify-write runs in a BEGIN IMMEDIATE transaction.
+
+    Async callers use the *_async methods, which run the transactions on a
+    dedicated worker thread with the process's one connection. A
+    transaction waits at most LOCK_TIMEOUT_SECONDS for the write lock held
+    by another worker, then is retried after an async backoff for up to
+    LOCK_RETRY_SECONDS, so contention never stalls the event loop.
+    """
+
+    LOCK_TIMEOUT_SECONDS = 0.25
+    LOCK_RETRY_SECONDS = 10.0
+
+    def __init__(
+        self,
+        db_path: str,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        failure_threshold: int,
+        cooldown_seconds: float
+    ):
+        self.db_path = Path(db_path)
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """The process's connection, opened on first use; call with the lock held"""
+        if self._conn is None:
+            self._ensure_schema()
+            self._conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=self.LOCK_TIMEOUT_SECONDS,
+                isolation_level=None,
+                check_same_thread=False
+            )
+        return self._conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run an exclusive write transaction, committed on success and rolled back otherwise"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    async def _run_async(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a transaction method on the limiter's worker thread, retrying while the database is locked"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rate-limiter")
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + self.LOCK_RETRY_SECONDS
+        backoff = 0.01
+        while True:
+            try:
+                return await loop.run_in_executor(self._executor, fn, *args)
+            except sqlite3.OperationalError as e:
+                if "locked" not in str(e) or time.monotonic() + backoff > deadline:
+                    raise
+            await asyncio.sleep(random.uniform(0, backoff))
+            backoff = min(backoff * 2, 0.5)
+
+    async def try_acquire_async(self, estimated_tokens: int) -> float:
+        return await self._run_async(self.try_acquire, estimated_tokens)
+
+    async def admit_extra_async(self, estimated_tokens: int) -> bool:
+        return await self._run_async(self.admit_extra, estimated_tokens)
+
+    async def reconcile_tokens_async(self, estimated_tokens: int, actual_tokens: int):
+        await self._run_async(self.reconcile_tokens, estimated_tokens, actual_tokens)
+
+    async def breaker_wait_async(self) -> float:
+        return await self._run_async(self.breaker_wait)
+
+    async def record_success_async(self):
+        await self._run_async(self.record_success)
+
+    async def record_failure_async(self):
+        await self._run_async(self.record_failure)
+
+    def _ensure_schema(self):
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS token_buckets (
+                    name TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS circuit_breakers (
+                    name TEXT PRIMARY KEY,
+                    failures INTEGER NOT NULL,
+                    opened_until REAL NOT NULL
+                )
+                """
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _refill(self, conn: sqlite3.Connection, name: str, capacity: float, now: float) -> float:
+        """Return the current bucket level after refilling for elapsed time"""
+        row = conn.execute(
+            "SELECT tokens, updated_at FROM token_buckets WHERE name = ?", (name,)
+        ).fetchone()
+        if row is None:
+            return capacity
+        tokens, updated_at = row
+        rate_per_second = capacity / 60.0
+        return min(capacity, tokens + max(0.0, now - updated_at) * rate_per_second)
+
+    def try_acquire(self, estimated_tokens: int) -> float:
+        """
+        Take one request and estimated_tokens from the shared buckets.
+
+        Returns 0 when both budgets allowed the call, otherwise the number
+        of seconds to wait before trying again (nothing is deducted).
+        """
+        now = time.time()
+        # A single oversized request must still be able to pass eventually
+        token_cost = min(float(estimated_tokens), float(self.tokens_per_minute))
+
+        with self._transaction() as conn:
+            requests = self._refill(conn, "requests", self.requests_per_minute, now)
+            tokens = self._refill(conn, "tokens", self.tokens_per_minute, now)
+
+            wait_seconds = 0.0
+            if requests < 1:
+                wait_seconds = max(wait_seconds, (1 - requests) * 60.0 / self.requests_per_minute)
+            if tokens < token_cost:
+                wait_seconds = max(wait_seconds, (token_cost - tokens) * 60.0 / self.tokens_per_minute)
+
+            if wait_seconds == 0:
+                requests -= 1
+                tokens -= token_cost
+
+            conn.executemany(
+                "INSERT OR REPLACE INTO token_buckets (name, tokens, updated_at) VALUES (?, ?, ?)",
+                [("requests", requests, now), ("tokens", tokens, now)]
+            )
+
+        return wait_seconds
+
+    def admit_extra(self, estimated_tokens: int) -> bool:
+        """
+        Take the budget of an optional extra request (a hedge) if it can be sent right away
+
+        Refused while the breaker is tripped, open or half-open, so an
+        extra request never adds load to a failing provider or becomes
+        the probe, and when the buckets would make it wait.
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT failures FROM circuit_breakers WHERE name = 'deepseek'"
+            ).fetchone()
+        if row is not None and row[0] >= self.failure_threshold:
+            return False
+        return self.try_acquire(estimated_tokens) == 0
+
+    def reconcile_tokens(self, estimated_tokens: int, actual_tokens: int):
+        """Credit back (or charge) the difference between estimated and actual usage"""
+        now = time.time()
+        with self._transaction() as conn:
+            tokens = self._refill(conn, "tokens", self.tokens_per_minute, now)
+            tokens = min(self.tokens_per_minute, tokens + estimated_tokens - actual_tokens)
+            conn.execute(
+                "INSERT OR REPLACE INTO token_buckets (name, tokens, updated_at) VALUES (?, ?, ?)",
+                ("tokens", tokens, now)
+            )
+
+    def breaker_wait(self) -> float:
+        """
+        Return seconds until the circuit breaker admits a request.
+
+        When the breaker is open and its cooldown has expired, the caller
+        becomes the half-open probe: the breaker is re-armed for another
+        cooldown so other callers keep waiting until the probe reports back.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT failures, opened_until FROM circuit_breakers WHERE name = 'deepseek'"
+            ).fetchone()
+            if row is None:
+                return 0.0
+
+            failures, opened_until = row
+            if failures < self.failure_threshold:
+                return 0.0
+            if now < opened_until:
+                return opened_until - now
+
+            conn.execute(
+                "UPDATE circuit_breakers SET opened_until = ? WHERE name = 'deepseek'",
+                (now + self.cooldown_seconds,)
+            )
+            print("🟡 Circuit breaker half-open, sending probe request")
+            return 0.0
+
+    def record_success(self):
+        """Close the breaker after a successful call"""
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO circuit_breakers (name, failures, opened_until) VALUES ('deepseek', 0, 0)"
+            )
+
+    def record_failure(self):
+        """Count a provider failure and open the breaker past the threshold"""
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT failures FROM circuit_breakers WHERE name = 'deepseek'"
+            ).fetchone()
+            failures = (row[0] if row else 0) + 1
+            opened_until = 0.0
+            if failures >= self.failure_threshold:
+                opened_until = now + self.cooldown_seconds
+                print(f"🔴 Circuit breaker open for {self.cooldown_seconds}s after {failures} failures")
+            conn.execute(
+                "INSERT OR REPLACE INTO circuit_breakers (name, failures, opened_until) VALUES ('deepseek', ?, ?)",
+                (failures, opened_until)
+            )
+
+
+class RequestScheduler:
+    """
+    Runs LLM calls under the shared rate limiter with retries.
+
+    Calls queue on the limiter and the circuit breaker instead of failing
+    fast; retryable errors back off exponentially with full jitter,
+    honouring Retry-After when the provider sends one. When the provider
+    stays unavailable for longer than the queue budget,
+    LLMProviderUnavailableError is raised so callers never substitute
+    made-up scores.
+    """
+
+    def __init__(
+        self,
+        limiter: SharedRateLimiter,
+        max_retries: int,
+        backoff_base: float,
+        backoff_max: float,
+        attempt_timeout: float,
+        max_queue_wait: float
+    ):
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.attempt_timeout = attempt_timeout
+        self.max_queue_wait = max_queue_wait
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[Any]],
+        estimated_tokens: int,
+        usage_tokens: Optional[Callable[[Any], Optional[int]]] = None
+    ) -> Any:
+        """Execute call() once capacity is available, retrying transient failures"""
+        deadline = time.monotonic() + self.max_queue_wait
+        attempt = 0
+        retries = 0
+
+        try:
+            while True:
+                await self._wait_for_capacity(estimated_tokens, deadline)
+
+                try:
+                    result = await asyncio.wait_for(call(), timeout=self.attempt_timeout)
+                except RETRYABLE_ERRORS as e:
+                    await self.limiter.record_failure_async()
+                    attempt += 1
+                    if attempt > self.max_retries:
+                        raise LLMProviderUnavailableError(
+                            f"DeepSeek unavailable after {self.max_retries} retries: {type(e).__name__}"
+                        ) from e
+
+                    delay = self._backoff_delay(attempt, e)
+                    if time.monotonic() + delay > deadline:
+                        raise LLMProviderUnavailableError(
+                            f"DeepSeek unavailable, queue wait exceeded {self.max_queue_wait}s"
+                        ) from e
+
+                    retries += 1
+                    print(f"🔁 Retry {attempt}/{self.max_retries} in {delay:.1f}s after {type(e).__name__}")
+                    await asyncio.sleep(delay)
+                    continue
+
+                await self.limiter.record_success_async()
+                if usage_tokens:
+                    actual_tokens = usage_tokens(result)
+                    if actual_tokens is not None:
+                        await self.limiter.reconcile_tokens_async(estimated_tokens, actual_tokens)
+                setattr(result, "retries", retries)
+                return result
+        except BaseException as e:
+            # Retries already spent, so telemetry can report failed calls too
+            setattr(e, "retries", retries)
+            raise
+
+    async def _wait_for_capacity(self, estimated_tokens: int, deadline: float):
+        """Sleep until the breaker is closed and the token buckets admit the call"""
+        while True:
+            wait_seconds = await self.limiter.breaker_wait_async()
+            if wait_seconds <= 0:
+                wait_seconds = await self.limiter.try_acquire_async(estimated_tokens)
+                if wait_seconds <= 0:
+                    return
+
+            if time.monotonic() + wait_seconds > deadline:
+                raise LLMProviderUnavailableError(
+                    f"DeepSeek capacity unavailable, queue wait exceeded {self.max_queue_wait}s"
+                )
+            await asyncio.sleep(wait_seconds)
+
+    def _backoff_delay(self, attempt: int, error: Exception) -> float:
+        """Retry-After when provided, else exponential backoff with full jitter"""
+        retry_after = self._retry_after_seconds(error)
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def _retry_after_seconds(error: Exception) -> Optional[float]:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if not headers:
+            return None
+
+        value = headers.get("retry-after")
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+def _resolve_state_path(path: str) -> Path:
+    """Resolve relative state paths against the backend root"""
+    state_path = Path(path)
+    if not state_path.is_absolute():
+        state_path = Path(__file__).parent.parent.parent.parent / state_path
+    return state_path
+
+
+# Global instances
+rate_limiter = SharedRateLimiter(
+    db_path=str(_resolve_state_path(settings.DEEPSEEK_RATE_LIMIT_STATE_PATH)),
+    requests_per_minute=settings.DEEPSEEK_REQUESTS_PER_MINUTE,
+    tokens_per_minute=settings.DEEPSEEK_TOKENS_PER_MINUTE,
+    failure_threshold=settings.DEEPSEEK_BREAKER_FAILURE_THRESHOLD,
+    cooldown_seconds=settings.DEEPSEEK_BREAKER_COOLDOWN
+)
+
+request_scheduler = RequestScheduler(
+    limiter=rate_limiter,
+    max_retries=settings.DEEPSEEK_MAX_RETRIES,
+    backoff_base=settings.DEEPSEEK_BACKOFF_BASE,
+    backoff_max=settings.DEEPSEEK_BACKOFF_MAX,
+    attempt_timeout=settings.DEEPSEEK_DIMENSION_TIMEOUT,
+    max_queue_wait=settings.DEEPSEEK_MAX_QUEUE_WAIT
+)
@@ -0,0 +1,199 @@
+# File: backend/app/services/evaluation/retrieval.py
+
+import math
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+from ..document.text_processing import TextChunker
+from ...core.config.settings import settings
+from ...utils.token_utils import estimate_tokens
+
+# Rubric keywords used to query the document index for each dimension
+DIMENSION_KEYWORDS = {
+    "团队能力": [
+        "团队", "创始人", "核心成员", "CEO", "CTO", "COO", "合伙人", "管理层",
+        "经验", "背景", "毕业", "曾任", "履历", "顾问", "员工", "组织架构", "股权",
+        "team", "founder", "co-founder", "management", "experience", "background",
+        "advisor", "employees", "hire", "leadership"
+    ],
+    "产品&技术": [
+        "产品", "技术", "研发", "专利", "知识产权", "算法", "平台", "系统",
+        "创新", "壁垒", "迭代", "原型", "版本", "架构", "核心技术", "技术路线",
+        "product", "technology", "patent", "platform", "research", "development",
+        "innovation", "prototype", "algorithm", "roadmap", "features"
+    ],
+    "市场前景": [
+        "市场", "规模", "增长", "行业", "用户", "客户", "需求", "竞争", "竞品",
+        "对手", "份额", "渠道", "营销", "品牌", "趋势", "TAM", "SAM",
+        "market", "growth", "industry", "customers", "competition", "competitors",
+        "segment", "marketing", "channels", "demand", "share"
+    ],
+    "商业模式": [
+        "商业模式", "盈利", "收入", "收费", "定价", "成本", "毛利", "运营",
+        "合作", "供应链", "扩张", "战略", "风险", "订阅", "客单价", "复购",
+        "revenue", "pricing", "business", "model", "subscription", "margin",
+        "cost", "operations", "partnerships", "strategy", "risks"
+    ],
+    "财务情况": [
+        "财务", "营收", "收入", "利润", "现金流", "预算", "融资", "估值",
+        "资金", "投资", "万元", "亿元", "轮", "股权", "资金用途", "预测", "报表",
+        "financial", "revenue", "profit", "cash", "funding", "investment",
+        "valuation", "raise", "projections", "budget", "burn", "expenses"
+    ]
+}
+
+_CJK_RUN = re.compile(r'[\u4e00-\u9fff]+')
+_ASCII_WORD = re.compile(r'[A-Za-z][A-Za-z0-9\-]*|\d+(?:\.\d+)?%?')
+
+
+def tokenize(text: str) -> List[str]:
+    """Tokenize mixed text: Chinese character bigrams plus lowercased ASCII words"""
+    tokens = []
+    for run in _CJK_RUN.findall(text):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    tokens.extend(word.lower() for word in _ASCII_WORD.findall(text))
+    return tokens
+
+
+class DocumentIndex:
+    """
+    In-memory BM25 index over the chunks of a single document.
+
+    Built once per evaluation and queried with the rubric keywords of each
+    dimension to pick the most relevant chunks within a token budget.
+    """
+
+    K1 = 1.5
+    B = 0.75
+
+    def __init__(self, chunks: List[str]):
+        self.chunks = chunks
+        self.chunk_tokens = [estimate_tokens(chunk) for chunk in chunks]
+        self.term_freqs = [Counter(tokenize(chunk)) for chunk in chunks]
+        self.doc_lengths = [sum(tf.values()) for tf in self.term_freqs]
+        self.avg_length = (sum(self.doc_lengths) / len(self.doc_lengths)) if chunks else 0.0
+
+        doc_freqs: Counter = Counter()
+        for tf in self.term_freqs:
+            doc_freqs.update(tf.keys())
+        total = len(chunks)
+        self.idf = {
+            term: math.log(1 + (total - df + 0.5) / (df + 0.5))
+            for term, df in doc_freqs.items()
+        }
+
+    @classmethod
+    def from_text(cls, document_text: str) -> "DocumentIndex":
+        chunks = TextChunker(document_text).token_chunks(
+            settings.RETRIEVAL_CHUNK_TOKENS,
+            overlap_tokens=settings.RETRIEVAL_CHUNK_OVERLAP_TOKENS
+        )
+        return cls(chunks)
+
+    def score(self, query_terms: Iterable[str]) -> List[float]:
+        """BM25 score of every chunk for the given query terms"""
+        terms = set(query_terms)
+        scores = []
+        for tf, length in zip(self.term_freqs, self.doc_lengths):
+            norm = self.K1 * (1 - self.B + self.B * length / self.avg_length) if self.avg_length else self.K1
+            total = 0.0
+            for term in terms:
+                freq = tf.get(term)
+                if freq:
+                    total += self.idf.get(term, 0.0) * freq * (self.K1 + 1) / (freq + norm)
+            scores.append(total)
+        return scores
+
+    def select(self, keywords: Iterable[str], token_budget: int, include_opening: bool = True) -> str:
+        """
+        Return the best-matching chunks that fit in token_budget.
+
+        Chunks are chosen by descending BM25 score and emitted in document
+        order. The opening chunk is kept when include_opening is set, since
+        it usually carries the company overview every dimension needs.
+        """
+        if not self.chunks:
+            return ""
+
+        if sum(self.chunk_tokens) <= token_budget:
+            return "\n".join(self.chunks)
+
+        query_terms = [term for keyword in keywords for term in tokenize(keyword)]
+        scores = self.score(query_terms)
+
+        selected = set()
+        used_tokens = 0
+
+        if include_opening and self.chunk_tokens[0] <= token_budget:
+            selected.add(0)
+            used_tokens += self.chunk_tokens[0]
+
+        ranked = sorted(range(len(self.chunks)), key=lambda i: scores[i], reverse=True)
+        for i in ranked:
+            if i in selected or scores[i] <= 0:
+                continue
+            if used_tokens + self.chunk_tokens[i] > token_budget:
+                continue
+            selected.add(i)
+            used_tokens += self.chunk_tokens[i]
+
+        return "\n……\n".join(self.chunks[i] for i in sorted(selected))
+
+    def select_for_dimension(self, dimension: str, token_budget: Optional[int] = None) -> str:
+        """Select context for one rubric dimension"""
+        return self.select(
+            DIMENSION_KEYWORDS.get(dimension, []),
+            token_budget or settings.DEEPSEEK_CONTEXT_TOKEN_BUDGET
+        )
+
+    def select_for_dimensions(self, dimensions: Iterable[str], token_budget: Optional[int] = None) -> str:
+        """Select context covering several dimensions at once"""
+        keywords: Dict[str, None] = {}
+        for dimension in dimensions:
+            keywords.update(dict.fromkeys(DIMENSION_KEYWORDS.get(dimension, [])))
+        return self.select(
+            keywords.keys(),
+            token_budget or settings.DEEPSEEK_CONTEXT_TOKEN_BUDGET
+        )
+
+
+class StreamingReadiness:
+    """
+    Tracks which dimensions can select their context while a document is
+    still streaming in page by page.
+
+    A dimension becomes ready once the pages mentioning its rubric
+    keywords hold ready_factor times its context token budget, i.e. the
+    pages read so far already offer more relevant text than its context
+    can take. Documents shorter than that never start a dimension early.
+    """
+
+    def __init__(self, dimensions: Iterable[str], token_budget: int, ready_factor: float):
+        self.query_terms = {
+            dimension: {term for keyword in DIMENSION_KEYWORDS.get(dimension, []) for term in tokenize(keyword)}
+            for dimension in dimensions
+        }
+        self.required_tokens = token_budget * ready_factor
+        self.relevant_tokens = dict.fromkeys(self.query_terms, 0)
+        self.ready: Dict[str, None] = {}
+
+    def add_page(self, page_text: str) -> List[str]:
+        """Account for one more page; returns the dimensions that just became ready"""
+        page_terms = set(tokenize(page_text))
+        page_tokens = estimate_tokens(page_text)
+        newly_ready = []
+        for dimension, query_terms in self.query_terms.items():
+            if dimension in self.ready or not page_terms & query_terms:
+                continue
+            self.relevant_tokens[dimension] += page_tokens
+            if self.relevant_tokens[dimension] >= self.required_tokens:
+                self.ready[dimension] = None
+                newly_ready.append(dimension)
+        return newly_ready
+
+    @property
+    def all_ready(self) -> bool:
+        return len(self.ready) == len(self.query_terms)
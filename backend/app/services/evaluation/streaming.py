@@ -0,0 +1,125 @@
+# File: backend/app/services/evaluation/streaming.py
+
+import json
+from typing import Any, List, Optional, Tuple
+
+JSONPath = Tuple[Any, ...]
+
+_SCALAR_END = set(',}] \t\r\n')
+
+
+class IncrementalJSONParser:
+    """
+    Push parser that reports scalar JSON values as soon as they are complete.
+
+    Feed it the text deltas of a streamed completion; every call returns the
+    (path, value) pairs finished by that delta, where path is the tuple of
+    object keys and array indexes leading to the value. For example a
+    dimension response yields (("score",), 24) as soon as the model has
+    written the score, well before the comments and sub-dimensions arrive.
+    Text before the first '{' or '[' (prose, markdown fences) is skipped,
+    as is anything after the top-level value closes.
+    """
+
+    def __init__(self):
+        # Each frame is [kind, key_or_index, expecting_key]
+        self._stack: List[list] = []
+        self._in_string = False
+        self._string_is_key = False
+        self._escape = False
+        self._in_scalar = False
+        self._buffer: List[str] = []
+        self.done = False
+
+    def _path(self) -> JSONPath:
+        return tuple(frame[1] for frame in self._stack)
+
+    def _finish_scalar(self, events: List[Tuple[JSONPath, Any]]):
+        raw = "".join(self._buffer)
+        self._buffer = []
+        self._in_scalar = False
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            value = raw
+        events.append((self._path(), value))
+
+    def feed(self, text: str) -> List[Tuple[JSONPath, Any]]:
+        events: List[Tuple[JSONPath, Any]] = []
+        if self.done:
+            return events
+
+        for ch in text:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    self._buffer.append(ch)
+                elif ch == '\\':
+                    self._escape = True
+                    self._buffer.append(ch)
+                elif ch == '"':
+                    self._in_string = False
+                    raw = '"' + "".join(self._buffer) + '"'
+                    self._buffer = []
+                    try:
+                        value = json.loads(raw)
+                    except json.JSONDecodeError:
+                        value = raw[1:-1]
+                    if self._string_is_key:
+                        self._stack[-1][1] = value
+                    else:
+                        events.append((self._path(), value))
+                else:
+                    self._buffer.append(ch)
+                continue
+
+            if self._in_scalar:
+                if ch not in _SCALAR_END:
+                    self._buffer.append(ch)
+                    continue
+                self._finish_scalar(events)
+
+            if not self._stack:
+                if ch in '{[':
+                    self._stack.append(['obj', None, True] if ch == '{' else ['arr', 0, False])
+                continue
+
+            frame = self._stack[-1]
+            if ch == '{':
+                self._stack.append(['obj', None, True])
+            elif ch == '[':
+                self._stack.append(['arr', 0, False])
+            elif ch in '}]':
+                self._stack.pop()
+                if not self._stack:
+                    self.done = True
+                    break
+            elif ch == '"':
+                self._in_string = True
+                self._string_is_key = frame[0] == 'obj' and frame[2]
+            elif ch == ':':
+                frame[2] = False
+            elif ch == ',':
+                if frame[0] == 'obj':
+                    frame[1] = None
+                    frame[2] = True
+                else:
+                    frame[1] += 1
+            elif not ch.isspace():
+                self._in_scalar = True
+                self._buffer = [ch]
+
+        return events
+
+
+class CompletionResult:
+    """Text and usage of one chat completion, streamed or not"""
+
+    def __init__(self, content: str, usage: Any = None, first_token_latency: Optional[float] = None):
+        self.content = content
+        self.usage = usage
+        self.first_token_latency = first_token_latency
+        # Set by the request hedger: None, "won" or "lost"
+        self.hedge: Optional[str] = None
+        # Set by the request scheduler: failed attempts before this one
+        self.retries = 0
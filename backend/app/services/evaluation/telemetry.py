@@ -0,0 +1,170 @@
+# File: backend/app/services/evaluation/telemetry.py
+
+import bisect
+import threading
+from typing import Any, Dict, Optional, Sequence
+from ...core.config.settings import settings
+
+# Bucket upper bounds per metric; values above the last bound land in +Inf
+LATENCY_BUCKETS = (0.5, 1, 2, 5, 10, 20, 30, 45, 60, 90, 120, 180)
+TOKEN_BUCKETS = (100, 250, 500, 1000, 1500, 2000, 3000, 4000, 6000, 8000, 12000, 16000)
+COST_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05)
+RETRY_BUCKETS = (0, 1, 2, 3, 5, 10)
+
+METRIC_BUCKETS = {
+    "latency_seconds": LATENCY_BUCKETS,
+    "first_token_seconds": LATENCY_BUCKETS,
+    "prompt_tokens": TOKEN_BUCKETS,
+    "completion_tokens": TOKEN_BUCKETS,
+    "prompt_cache_hit_tokens": TOKEN_BUCKETS,
+    "estimated_cost": COST_BUCKETS,
+    "retries": RETRY_BUCKETS,
+}
+
+
+def estimate_cost(prompt_tokens: int, completion_tokens: int, prompt_cache_hit_tokens: int = 0) -> float:
+    """Estimated USD cost of one call at the configured per-million-token prices"""
+    cache_miss_tokens = max(prompt_tokens - prompt_cache_hit_tokens, 0)
+    return (
+        prompt_cache_hit_tokens * settings.DEEPSEEK_PRICE_INPUT_CACHE_HIT
+        + cache_miss_tokens * settings.DEEPSEEK_PRICE_INPUT_CACHE_MISS
+        + completion_tokens * settings.DEEPSEEK_PRICE_OUTPUT
+    ) / 1_000_000
+
+
+class Histogram:
+    """Fixed-bucket histogram with count, sum, min and max"""
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float):
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Upper bound of the bucket holding the percentile (max for the +Inf bucket)"""
+        if not self.count:
+            return None
+        rank = pct / 100 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return self.bounds[index] if index < len(self.bounds) else self.max
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [str(bound) for bound in self.bounds] + ["+Inf"]
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "mean": round(self.total / self.count, 6) if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "buckets": dict(zip(labels, self.buckets))
+        }
+
+
+class CallStats:
+    """Counters and histograms for one group of calls (a dimension or a model)"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.outcomes: Dict[str, int] = {}
+        self.cached_responses = 0
+        self.retries = 0
+        self.fallbacks = 0
+        self.estimated_cost = 0.0
+        self.histograms = {name: Histogram(bounds) for name, bounds in METRIC_BUCKETS.items()}
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "outcomes": dict(self.outcomes),
+            "cached_responses": self.cached_responses,
+            "retries": self.retries,
+            "fallbacks": self.fallbacks,
+            "estimated_cost": round(self.estimated_cost, 6),
+            "histograms": {name: histogram.snapshot() for name, histogram in self.histograms.items()}
+        }
+
+
+class LLMTelemetry:
+    """
+    Process-wide aggregation of per-call LLM telemetry.
+
+    Every DeepSeek call, including failed, unparseable and cancelled
+    ones, is recorded under its dimension label (repair and combined
+    calls have their own labels) and under its model: outcome, token
+    counts from the usage field, wall latency including queueing and
+    retries, time to first token, retry count and estimated cost.
+    Fallback dimension results are counted separately. Like the hedging
+    stats this is per worker and resets on restart.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.by_dimension: Dict[str, CallStats] = {}
+        self.by_model: Dict[str, CallStats] = {}
+
+    def _groups(self, dimension: str, model: str):
+        dimension_stats = self.by_dimension.setdefault(dimension or "unlabelled", CallStats())
+        model_stats = self.by_model.setdefault(model, CallStats())
+        return dimension_stats, model_stats
+
+    def record_call(self, dimension: str, model: str, call: Dict[str, Any]):
+        """Record one usage_log entry of an API call"""
+        outcome = call.get("outcome", "ok")
+        with self._lock:
+            for stats in self._groups(dimension, model):
+                stats.calls += 1
+                stats.outcomes[outcome] = stats.outcomes.get(outcome, 0) + 1
+                if outcome != "ok":
+                    stats.errors += 1
+                stats.retries += call.get("retries", 0)
+                stats.estimated_cost += call.get("estimated_cost", 0.0)
+                for name, histogram in stats.histograms.items():
+                    value = call.get(name)
+                    if value is not None:
+                        histogram.observe(value)
+
+    def record_cached(self, dimension: str, model: str):
+        """Record a call answered from the LLM response cache"""
+        with self._lock:
+            for stats in self._groups(dimension, model):
+                stats.cached_responses += 1
+
+    def record_fallback(self, dimension: str, model: str):
+        """Record a dimension that ended with fallback scores"""
+        with self._lock:
+            for stats in self._groups(dimension, model):
+                stats.fallbacks += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "prices_per_million_tokens": {
+                    "input_cache_hit": settings.DEEPSEEK_PRICE_INPUT_CACHE_HIT,
+                    "input_cache_miss": settings.DEEPSEEK_PRICE_INPUT_CACHE_MISS,
+                    "output": settings.DEEPSEEK_PRICE_OUTPUT
+                },
+                "by_dimension": {key: stats.snapshot() for key, stats in self.by_dimension.items()},
+                "by_model": {key: stats.snapshot() for key, stats in self.by_model.items()}
+            }
+
+
+# Global instance
+llm_telemetry = LLMTelemetry()
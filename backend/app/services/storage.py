@@ -87,9 +87,12 @@ class StorageService:
             return 0
 
     def delete_file(self, file_path: str) -> bool:
-        """删除文件"""
+        """删除文件 (连同同名的解析结果等附属文件)"""
         try:
-            Path(file_path).unlink(missing_ok=True)
+            path = Path(file_path)
+            path.unlink(missing_ok=True)
+            for sidecar in path.parent.glob(f"{path.stem}.*"):
+                sidecar.unlink(missing_ok=True)
             return True
         except Exception as e:
             print(f"❌ Failed to delete file {file_path}: {e}")
@@ -0,0 +1,22 @@
+# File: backend/app/utils/token_utils.py
+
+import re
+
+# DeepSeek's tokenizer guidance: roughly 0.6 tokens per Chinese character
+# and 0.3 tokens per English/other character.
+CJK_TOKENS_PER_CHAR = 0.6
+OTHER_TOKENS_PER_CHAR = 0.3
+
+# Characters counted at the CJK rate
+CJK_CHAR_CLASS = r'[\u4e00-\u9fff\u3400-\u4dbf\uf900-\ufaff\u3000-\u303f\uff00-\uffef]'
+
+_CJK_PATTERN = re.compile(CJK_CHAR_CLASS)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the DeepSeek token count for mixed Chinese/English text"""
+    if not text:
+        return 0
+    cjk_chars = len(_CJK_PATTERN.findall(text))
+    other_chars = len(text) - cjk_chars
+    return int(cjk_chars * CJK_TOKENS_PER_CHAR + other_chars * OTHER_TOKENS_PER_CHAR) + 1
@@ -0,0 +1,261 @@
+# File: backend/benchmarks/fake_deepseek.py
+
+"""
+OpenAI-compatible stand-in for the DeepSeek chat completions API.
+
+Answers evaluation prompts with well-formed rubric JSON so the whole
+pipeline runs without spending API credits. Behaviour is tuned through
+environment variables:
+
+    FAKE_DEEPSEEK_LATENCY            seconds before the first token (default 0.5)
+    FAKE_DEEPSEEK_TOKENS_PER_SECOND  completion throughput (default 60)
+    FAKE_DEEPSEEK_ERROR_RATE         fraction of calls answered 429/500 (default 0)
+    FAKE_DEEPSEEK_MALFORMED_RATE     fraction of dimension answers that need repair (default 0)
+    FAKE_DEEPSEEK_SLOW_RATE          fraction of calls that stall in the tail (default 0)
+    FAKE_DEEPSEEK_SLOW_FACTOR        how many times slower a stalled call is (default 10)
+    FAKE_DEEPSEEK_SEED               random seed (default 42)
+
+Run on its own with:
+    uvicorn benchmarks.fake_deepseek:app --port 8101
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.models.score import STANDARD_DIMENSIONS  # noqa: E402
+from app.services.evaluation.prompts import DIMENSION_LABELS  # noqa: E402
+from app.utils.token_utils import estimate_tokens  # noqa: E402
+
+LATENCY = float(os.getenv("FAKE_DEEPSEEK_LATENCY", "0.5"))
+TOKENS_PER_SECOND = float(os.getenv("FAKE_DEEPSEEK_TOKENS_PER_SECOND", "60"))
+ERROR_RATE = float(os.getenv("FAKE_DEEPSEEK_ERROR_RATE", "0"))
+MALFORMED_RATE = float(os.getenv("FAKE_DEEPSEEK_MALFORMED_RATE", "0"))
+SLOW_RATE = float(os.getenv("FAKE_DEEPSEEK_SLOW_RATE", "0"))
+SLOW_FACTOR = float(os.getenv("FAKE_DEEPSEEK_SLOW_FACTOR", "10"))
+
+# Characters sent per streamed chunk, roughly a few tokens
+STREAM_CHUNK_CHARS = 12
+
+app = FastAPI(title="Fake DeepSeek")
+
+_random = random.Random(int(os.getenv("FAKE_DEEPSEEK_SEED", "42")))
+_seen_prefixes: set = set()
+_stats: Dict[str, int] = {
+    "requests": 0,
+    "errors": 0,
+    "malformed": 0,
+    "repairs": 0,
+    "slow": 0,
+    "streamed": 0,
+    "prompt_tokens": 0,
+    "completion_tokens": 0,
+    "prompt_cache_hit_tokens": 0
+}
+
+
+def _dimension_result(dimension: str, config: Dict) -> Dict[str, Any]:
+    """Plausible evaluation of one dimension, scored 50-90% of the maximum"""
+    ratio = _random.uniform(0.5, 0.9)
+    sub_dimensions = [
+        {
+            "sub_dimension": sub_name,
+            "score": round(sub_max * ratio, 1),
+            "max_score": sub_max,
+            "comments": f"{sub_name}表现一般，部分信息需要补充。"
+        }
+        for sub_name, sub_max in config["sub_dimensions"].items()
+    ]
+    return {
+        "score": round(sum(sub["score"] for sub in sub_dimensions), 1),
+        "max_score": config["max_score"],
+        "comments": f"{dimension}整体情况良好，但仍有提升空间。",
+        "sub_dimensions": sub_dimensions,
+        "missing_info": [
+            {"type": f"{dimension}信息", "description": f"缺少更详细的{dimension}数据"}
+        ]
+    }
+
+
+def _malformed(result: Dict[str, Any]) -> str:
+    """Wrap a dimension answer in prose and drop a sub-dimension, as models sometimes do"""
+    _stats["malformed"] += 1
+    broken = dict(result, sub_dimensions=result["sub_dimensions"][:-1])
+    return "评估结果如下：\n" + json.dumps(broken, ensure_ascii=False) + "\n以上评估仅供参考。"
+
+
+def _answer(prompt: str) -> str:
+    """Build the JSON answer the evaluation prompt asks for"""
+    if prompt.startswith("以下是你对商业计划书"):
+        # Repair request: answer with a well-formed result for the label
+        _stats["repairs"] += 1
+        label = prompt.split("“", 1)[1].split("”", 1)[0]
+        if label in STANDARD_DIMENSIONS:
+            return json.dumps(_dimension_result(label, STANDARD_DIMENSIONS[label]), ensure_ascii=False)
+        return json.dumps(
+            {"dimensions": {name: _dimension_result(name, cfg) for name, cfg in STANDARD_DIMENSIONS.items()}},
+            ensure_ascii=False
+        )
+
+    if "dimensions中必须" in prompt:
+        return json.dumps(
+            {"dimensions": {name: _dimension_result(name, cfg) for name, cfg in STANDARD_DIMENSIONS.items()}},
+            ensure_ascii=False
+        )
+
+    instructions = prompt[prompt.rfind("请分析以上商业计划书"):]
+    for name, config in STANDARD_DIMENSIONS.items():
+        focus = DIMENSION_LABELS.get(name, (name, name))[0]
+        if f"中的{focus}维度" in instructions:
+            result = _dimension_result(name, config)
+            if MALFORMED_RATE and _random.random() < MALFORMED_RATE:
+                return _malformed(result)
+            return json.dumps(result, ensure_ascii=False)
+
+    return json.dumps({"score": 0}, ensure_ascii=False)
+
+
+def _usage(messages: List[Dict[str, str]], completion: str) -> Dict[str, int]:
+    """Token usage including a simulated prefix cache keyed on the document block"""
+    system = "".join(m.get("content", "") for m in messages if m.get("role") == "system")
+    user = "".join(m.get("content", "") for m in messages if m.get("role") != "system")
+    cut = user.rfind("请分析以上商业计划书")
+    prefix = system + (user[:cut] if cut > 0 else "")
+
+    prompt_tokens = estimate_tokens(system + user)
+    prefix_key = hashlib.sha256(prefix.encode("utf-8")).hexdigest()
+    hit_tokens = 0
+    if prefix and prefix_key in _seen_prefixes:
+        hit_tokens = min(prompt_tokens, estimate_tokens(prefix))
+    _seen_prefixes.add(prefix_key)
+
+    completion_tokens = estimate_tokens(completion)
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+        "prompt_cache_hit_tokens": hit_tokens,
+        "prompt_cache_miss_tokens": prompt_tokens - hit_tokens
+    }
+
+
+def _record(usage: Dict[str, int]):
+    _stats["prompt_tokens"] += usage["prompt_tokens"]
+    _stats["completion_tokens"] += usage["completion_tokens"]
+    _stats["prompt_cache_hit_tokens"] += usage["prompt_cache_hit_tokens"]
+
+
+def _error_response() -> JSONResponse:
+    _stats["errors"] += 1
+    if _random.random() < 0.5:
+        return JSONResponse(
+            status_code=429,
+            content={"error": {"message": "Rate limit reached", "type": "rate_limit_error"}},
+            headers={"Retry-After": "1"}
+        )
+    return JSONResponse(
+        status_code=500,
+        content={"error": {"message": "Internal server error", "type": "server_error"}}
+    )
+
+
+@app.post("/chat/completions")
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    _stats["requests"] += 1
+
+    if ERROR_RATE and _random.random() < ERROR_RATE:
+        await asyncio.sleep(LATENCY / 2)
+        return _error_response()
+
+    messages = body.get("messages", [])
+    prompt = messages[-1]["content"] if messages else ""
+    content = _answer(prompt)
+    usage = _usage(messages, content)
+    _record(usage)
+
+    completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+    created = int(time.time())
+    model = body.get("model", "deepseek-chat")
+    generation_seconds = usage["completion_tokens"] / TOKENS_PER_SECOND if TOKENS_PER_SECOND > 0 else 0.0
+    latency = LATENCY
+    if SLOW_RATE and _random.random() < SLOW_RATE:
+        _stats["slow"] += 1
+        latency *= SLOW_FACTOR
+
+    if not body.get("stream"):
+        await asyncio.sleep(latency + generation_seconds)
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": usage
+        }
+
+    _stats["streamed"] += 1
+    include_usage = (body.get("stream_options") or {}).get("include_usage", False)
+
+    async def event_stream():
+        await asyncio.sleep(latency)
+        pieces = [content[i:i + STREAM_CHUNK_CHARS] for i in range(0, len(content), STREAM_CHUNK_CHARS)]
+        delay = generation_seconds / len(pieces) if pieces else 0.0
+
+        for piece in pieces:
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]
+            }
+            yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+            if delay:
+                await asyncio.sleep(delay)
+
+        final = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": model,
+            "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]
+        }
+        yield f"data: {json.dumps(final)}\n\n"
+
+        if include_usage:
+            usage_chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [],
+                "usage": usage
+            }
+            yield f"data: {json.dumps(usage_chunk)}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+@app.get("/stats")
+async def stats():
+    """Counters for the benchmark report"""
+    return _stats
@@ -0,0 +1,195 @@
+# File: backend/benchmarks/fake_supabase.py
+
+"""
+In-memory stand-in for the Supabase PostgREST API.
+
+Implements the subset of PostgREST the backend uses: select with column
+lists, eq/neq/gt/gte/lt/lte/in filters, order, limit/offset and exact
+counts, plus insert, update and delete. Tables are created on first use
+and nothing is persisted. Point SUPABASE_URL at it; any SUPABASE_KEY is
+accepted.
+
+    FAKE_SUPABASE_LATENCY   seconds added to every request (default 0.005)
+
+Run on its own with:
+    uvicorn benchmarks.fake_supabase:app --port 8102
+"""
+
+import asyncio
+import json
+import os
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+from fastapi import FastAPI, Request, Response
+
+LATENCY = float(os.getenv("FAKE_SUPABASE_LATENCY", "0.005"))
+
+# Query parameters that are not column filters
+RESERVED_PARAMS = {"select", "order", "limit", "offset", "on_conflict", "columns"}
+
+app = FastAPI(title="Fake Supabase")
+
+_tables: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+_request_count = 0
+
+
+def _coerce(value: str) -> Any:
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def _matches(row: Dict[str, Any], filters: List[Tuple[str, str]]) -> bool:
+    for column, expression in filters:
+        operator, _, raw = expression.partition(".")
+        actual = row.get(column)
+
+        if operator == "eq":
+            if str(actual) != raw and actual != _coerce(raw):
+                return False
+        elif operator == "neq":
+            if str(actual) == raw or actual == _coerce(raw):
+                return False
+        elif operator == "in":
+            options = [option.strip().strip('"') for option in raw.strip("()").split(",")]
+            if str(actual) not in options:
+                return False
+        elif operator == "is":
+            if raw == "null" and actual is not None:
+                return False
+        elif operator in ("gt", "gte", "lt", "lte"):
+            if actual is None:
+                return False
+            target = _coerce(raw)
+            try:
+                if operator == "gt" and not actual > target:
+                    return False
+                if operator == "gte" and not actual >= target:
+                    return False
+                if operator == "lt" and not actual < target:
+                    return False
+                if operator == "lte" and not actual <= target:
+                    return False
+            except TypeError:
+                return False
+    return True
+
+
+def _filters(request: Request) -> List[Tuple[str, str]]:
+    return [(key, value) for key, value in request.query_params.multi_items() if key not in RESERVED_PARAMS]
+
+
+def _project(rows: List[Dict[str, Any]], select: str) -> List[Dict[str, Any]]:
+    if not select or select == "*":
+        return [dict(row) for row in rows]
+    # Embedded resources ("table(*)") are not supported and are dropped
+    columns = [column.strip() for column in select.split(",") if "(" not in column]
+    return [{column: row.get(column) for column in columns} for row in rows]
+
+
+def _apply_order(rows: List[Dict[str, Any]], order: str) -> List[Dict[str, Any]]:
+    for term in reversed(order.split(",")):
+        parts = term.split(".")
+        column = parts[0]
+        descending = "desc" in parts[1:]
+        rows = sorted(
+            rows,
+            key=lambda row: (row.get(column) is None, row.get(column) if row.get(column) is not None else ""),
+            reverse=descending
+        )
+    return rows
+
+
+def _json_response(data: Any, status_code: int = 200, content_range: str = None) -> Response:
+    headers = {"Content-Range": content_range} if content_range else {}
+    return Response(
+        content=json.dumps(data, ensure_ascii=False, default=str),
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers
+    )
+
+
+@app.middleware("http")
+async def simulate_latency(request: Request, call_next):
+    global _request_count
+    _request_count += 1
+    if LATENCY:
+        await asyncio.sleep(LATENCY)
+    return await call_next(request)
+
+
+@app.get("/rest/v1/{table}")
+@app.head("/rest/v1/{table}")
+async def select_rows(table: str, request: Request):
+    params = request.query_params
+    rows = [row for row in _tables[table] if _matches(row, _filters(request))]
+    total = len(rows)
+
+    if params.get("order"):
+        rows = _apply_order(rows, params["order"])
+
+    offset = int(params.get("offset", 0))
+    limit = params.get("limit")
+    rows = rows[offset:offset + int(limit)] if limit is not None else rows[offset:]
+
+    content_range = None
+    if "count=exact" in request.headers.get("prefer", ""):
+        end = offset + len(rows) - 1 if rows else offset
+        content_range = f"{offset}-{end}/{total}"
+
+    data = _project(rows, params.get("select", "*"))
+    if request.method == "HEAD":
+        return _json_response([], content_range=content_range)
+    return _json_response(data, content_range=content_range)
+
+
+@app.post("/rest/v1/{table}")
+async def insert_rows(table: str, request: Request):
+    payload = await request.json()
+    rows = payload if isinstance(payload, list) else [payload]
+    prefer = request.headers.get("prefer", "")
+
+    inserted = []
+    for row in rows:
+        if "resolution=merge-duplicates" in prefer and "id" in row:
+            existing = next((r for r in _tables[table] if r.get("id") == row["id"]), None)
+            if existing is not None:
+                existing.update(row)
+                inserted.append(existing)
+                continue
+        _tables[table].append(dict(row))
+        inserted.append(row)
+
+    return _json_response(inserted, status_code=201)
+
+
+@app.patch("/rest/v1/{table}")
+async def update_rows(table: str, request: Request):
+    changes = await request.json()
+    filters = _filters(request)
+    updated = []
+    for row in _tables[table]:
+        if _matches(row, filters):
+            row.update(changes)
+            updated.append(dict(row))
+    return _json_response(updated)
+
+
+@app.delete("/rest/v1/{table}")
+async def delete_rows(table: str, request: Request):
+    filters = _filters(request)
+    deleted = [row for row in _tables[table] if _matches(row, filters)]
+    _tables[table] = [row for row in _tables[table] if not _matches(row, filters)]
+    return _json_response(deleted)
+
+
+@app.get("/stats")
+async def stats():
+    """Row counts per table for the benchmark report"""
+    return {
+        "requests": _request_count,
+        "tables": {table: len(rows) for table, rows in _tables.items()}
+    }
@@ -0,0 +1,418 @@
+# File: backend/benchmarks/run_pipeline.py
+
+"""
+End-to-end benchmark of the business plan pipeline.
+
+Starts the fake DeepSeek and fake Supabase servers as subprocesses, points
+the backend at them and pushes the sample PDFs from uploads/business_plans
+through process_and_evaluate_bp directly (--target process), the upload
+endpoint served by uvicorn (--target upload) or a single batch request
+(--target batch). Reports plans per minute, end-to-end latency
+percentiles, event-loop lag and peak RSS.
+
+Run from the backend directory:
+    python -m benchmarks.run_pipeline --plans 20 --concurrency 5
+    python -m benchmarks.run_pipeline --target upload --latency 1.5 --error-rate 0.05
+    python -m benchmarks.run_pipeline --target batch --plans 40
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import resource
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+BACKEND_ROOT = Path(__file__).parent.parent
+SAMPLE_DIR = BACKEND_ROOT / "uploads" / "business_plans"
+
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.models.evaluation import EvaluationMode  # noqa: E402
+
+TERMINAL_EVENTS = ("evaluation_completed", "evaluation_failed")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the BP processing pipeline against local stand-in servers")
+    parser.add_argument("--plans", type=int, default=20, help="Number of business plans to process")
+    parser.add_argument("--concurrency", type=int, default=5, help="Plans in flight at the same time")
+    parser.add_argument("--target", choices=["process", "upload", "batch"], default="process",
+                        help="Call process_and_evaluate_bp directly, go through the upload endpoint or submit one batch")
+    parser.add_argument("--mode", choices=[mode.value for mode in EvaluationMode], default=None,
+                        help="Evaluation mode (defaults to DEEPSEEK_EVALUATION_MODE)")
+    parser.add_argument("--latency", type=float, default=0.5, help="Fake DeepSeek seconds to first token")
+    parser.add_argument("--tokens-per-second", type=float, default=60, help="Fake DeepSeek completion throughput")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of fake DeepSeek calls that fail with 429/500")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="Fraction of fake DeepSeek dimension answers that need repair")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="Fraction of fake DeepSeek calls that stall (latency x10)")
+    parser.add_argument("--db-latency", type=float, default=0.005, help="Fake Supabase seconds per request")
+    parser.add_argument("--use-llm-cache", action="store_true", help="Keep the LLM response cache enabled")
+    parser.add_argument("--timeout", type=float, default=600, help="Seconds to wait for a single plan")
+    parser.add_argument("--output", help="Write the report as JSON to this path")
+    parser.add_argument("--verbose", action="store_true", help="Show pipeline logs")
+    return parser.parse_args()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(module: str, port: int, env: Dict[str, str]) -> subprocess.Popen:
+    """Launch a stand-in server and wait until it answers /stats"""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", f"{module}:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=str(BACKEND_ROOT),
+        env={**os.environ, **env}
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{module} exited with code {process.returncode}")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/stats", timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"{module} did not start on port {port}")
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def monitor_loop_lag(samples: List[float], stop: asyncio.Event, interval: float = 0.05):
+    """Record how late the event loop wakes up a sleeping task"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, loop.time() - start - interval))
+
+
+async def run_benchmark(args: argparse.Namespace, workdir: Path) -> Dict[str, Any]:
+    # Imported here so settings pick up the environment prepared in main()
+    from app.core.database import db
+    from app.main import app
+    from app.api.v1.business_plans import process_and_evaluate_bp
+    from app.services.evaluation.progress import evaluation_progress
+    from app.services.evaluation.hedging import request_hedger
+    from app.services.evaluation.telemetry import llm_telemetry
+    from app.services.storage import storage_service
+    from app.core.config.settings import settings
+
+    # Keep uploaded copies out of the repository
+    storage_service.bp_dir = workdir / "uploads"
+    storage_service.bp_dir.mkdir(parents=True, exist_ok=True)
+
+    samples = sorted(SAMPLE_DIR.glob("*.pdf"))
+    if not samples:
+        raise RuntimeError(f"No sample PDFs found in {SAMPLE_DIR}")
+
+    supabase = db.get_client()
+    evaluation_mode = EvaluationMode(args.mode) if args.mode else None
+    semaphore = asyncio.Semaphore(args.concurrency)
+    results: List[Dict[str, Any]] = []
+
+    server = None
+    server_task = None
+    client = None
+    if args.target in ("upload", "batch"):
+        import uvicorn
+
+        port = free_port()
+        server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", lifespan="off"))
+        server_task = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.05)
+        client = httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}{settings.API_PREFIX}", timeout=args.timeout)
+
+    def create_project(index: int) -> str:
+        project_id = str(uuid.uuid4())
+        now = datetime.utcnow().isoformat()
+        supabase.table("projects").insert({
+            "id": project_id,
+            "enterprise_name": "Benchmark Co",
+            "project_name": f"Benchmark plan {index}",
+            "status": "pending_review",
+            "created_at": now,
+            "updated_at": now
+        }).execute()
+        return project_id
+
+    async def run_plan(index: int):
+        pdf_path = samples[index % len(samples)]
+        project_id = create_project(index)
+        now = datetime.utcnow().isoformat()
+
+        async with semaphore:
+            start = time.perf_counter()
+            error = None
+
+            if args.target == "process":
+                bp_id = str(uuid.uuid4())
+                supabase.table("business_plans").insert({
+                    "id": bp_id,
+                    "project_id": project_id,
+                    "file_name": pdf_path.name,
+                    "file_size": pdf_path.stat().st_size,
+                    "status": "processing",
+                    "upload_time": now,
+                    "updated_at": now
+                }).execute()
+                await asyncio.wait_for(
+                    process_and_evaluate_bp(bp_id, project_id, str(pdf_path), evaluation_mode),
+                    timeout=args.timeout
+                )
+            else:
+                queue = evaluation_progress.subscribe(project_id)
+                try:
+                    params = {"evaluation_mode": evaluation_mode.value} if evaluation_mode else None
+                    response = await client.post(
+                        f"/projects/{project_id}/business-plans",
+                        files={"file": (pdf_path.name, pdf_path.read_bytes(), "application/pdf")},
+                        params=params
+                    )
+                    if response.status_code != 200:
+                        error = f"upload returned {response.status_code}"
+                    else:
+                        deadline = time.monotonic() + args.timeout
+                        while True:
+                            event = await asyncio.wait_for(queue.get(), timeout=max(0.0, deadline - time.monotonic()))
+                            if event["type"] in TERMINAL_EVENTS:
+                                break
+                finally:
+                    evaluation_progress.unsubscribe(project_id, queue)
+
+            latency = time.perf_counter() - start
+
+        if error is None:
+            row = (
+                supabase.table("business_plans")
+                .select("status,error_message")
+                .eq("project_id", project_id)
+                .limit(1)
+                .execute()
+            ).data
+            if not row:
+                error = "business plan record missing"
+            elif row[0].get("error_message"):
+                error = row[0]["error_message"]
+
+        results.append({"plan": pdf_path.name, "latency": latency, "error": error})
+
+    lag_samples: List[float] = []
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(monitor_loop_lag(lag_samples, stop))
+
+    async def run_batch():
+        # Plans already stored with a BP record, re-evaluated by one request
+        project_ids = []
+        for index in range(args.plans):
+            pdf_path = samples[index % len(samples)]
+            project_id = create_project(index)
+            file_name = f"{project_id}_{pdf_path.name}"
+            shutil.copy(pdf_path, storage_service.bp_dir / file_name)
+            now = datetime.utcnow().isoformat()
+            supabase.table("business_plans").insert({
+                "id": str(uuid.uuid4()),
+                "project_id": project_id,
+                "file_name": file_name,
+                "file_size": pdf_path.stat().st_size,
+                "status": "completed",
+                "upload_time": now,
+                "updated_at": now
+            }).execute()
+            project_ids.append(project_id)
+
+        payload = {"project_ids": project_ids}
+        if evaluation_mode:
+            payload["evaluation_mode"] = evaluation_mode.value
+        submitted = time.perf_counter()
+        response = await client.post("/business-plans/batches", json=payload)
+        response.raise_for_status()
+        batch_id = response.json()["batch_id"]
+
+        deadline = submitted + args.timeout
+        while time.perf_counter() < deadline:
+            await asyncio.sleep(0.5)
+            batch = (await client.get(f"/business-plans/batches/{batch_id}")).json()
+            if batch["finished_at"]:
+                break
+        else:
+            raise RuntimeError(f"Batch {batch_id} did not finish within {args.timeout}s")
+
+        created_at = datetime.fromisoformat(batch["created_at"])
+        for item in batch["items"]:
+            finished_at = item["finished_at"]
+            results.append({
+                "plan": item["project_id"],
+                "latency": (datetime.fromisoformat(finished_at) - created_at).total_seconds() if finished_at else 0.0,
+                "error": item["error"]
+            })
+
+    started = time.perf_counter()
+    if args.target == "batch":
+        outcomes = await asyncio.gather(run_batch(), return_exceptions=True)
+    else:
+        outcomes = await asyncio.gather(*(run_plan(i) for i in range(args.plans)), return_exceptions=True)
+    wall_seconds = time.perf_counter() - started
+
+    stop.set()
+    await lag_task
+    if client:
+        await client.aclose()
+    if server:
+        server.should_exit = True
+        await server_task
+
+    crashed = [repr(outcome) for outcome in outcomes if isinstance(outcome, BaseException)]
+    latencies = [result["latency"] for result in results]
+    succeeded = [result for result in results if result["error"] is None]
+
+    return {
+        "target": args.target,
+        "mode": args.mode or settings.DEEPSEEK_EVALUATION_MODE,
+        "plans": args.plans,
+        "concurrency": args.concurrency,
+        "succeeded": len(succeeded),
+        "failed": args.plans - len(succeeded),
+        "errors": sorted({result["error"] for result in results if result["error"]} | set(crashed)),
+        "wall_seconds": wall_seconds,
+        "plans_per_minute": len(succeeded) / wall_seconds * 60 if wall_seconds else 0.0,
+        "latency_seconds": {
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "max": max(latencies) if latencies else None
+        },
+        "event_loop_lag_ms": {
+            "p50": (percentile(lag_samples, 50) or 0.0) * 1000,
+            "p99": (percentile(lag_samples, 99) or 0.0) * 1000,
+            "max": max(lag_samples, default=0.0) * 1000
+        },
+        "peak_rss_mb": peak_rss_mb(),
+        "hedging": request_hedger.stats(),
+        "telemetry": llm_telemetry.stats()
+    }
+
+
+def print_report(report: Dict[str, Any]):
+    latency = report["latency_seconds"]
+    lag = report["event_loop_lag_ms"]
+    llm = report.get("fake_deepseek", {})
+    database = report.get("fake_supabase", {})
+
+    def fmt(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value:.2f}"
+
+    print("📊 Pipeline benchmark")
+    print(f"   target={report['target']} mode={report['mode']} plans={report['plans']} concurrency={report['concurrency']}")
+    print(f"   succeeded={report['succeeded']} failed={report['failed']} wall={report['wall_seconds']:.1f}s")
+    print(f"   throughput: {report['plans_per_minute']:.1f} plans/min")
+    print(f"   latency (s): p50={fmt(latency['p50'])} p95={fmt(latency['p95'])} p99={fmt(latency['p99'])} max={fmt(latency['max'])}")
+    print(f"   event loop lag (ms): p50={lag['p50']:.1f} p99={lag['p99']:.1f} max={lag['max']:.1f}")
+    print(f"   peak RSS: {report['peak_rss_mb']:.1f} MB")
+    hedging = report.get("hedging") or {}
+    if hedging.get("enabled"):
+        print(
+            f"   hedging: {hedging['hedges_fired']} hedges for {hedging['calls']} calls "
+            f"({hedging['extra_call_ratio']:.0%} extra), won {hedging['hedge_wins']}"
+        )
+    if llm:
+        prompt_tokens = llm.get("prompt_tokens", 0)
+        hit_ratio = llm.get("prompt_cache_hit_tokens", 0) / prompt_tokens if prompt_tokens else 0.0
+        print(
+            f"   LLM: {llm.get('requests', 0)} requests, {llm.get('errors', 0)} injected errors, "
+            f"{llm.get('malformed', 0)} malformed / {llm.get('repairs', 0)} repair requests, "
+            f"{prompt_tokens} prompt / {llm.get('completion_tokens', 0)} completion tokens, "
+            f"prefix cache hit {hit_ratio:.0%}"
+        )
+    if database:
+        print(f"   DB: {database.get('requests', 0)} requests")
+    for error in report["errors"][:5]:
+        print(f"   ❌ {error}")
+
+
+def main():
+    args = parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="pitchai-bench-") as tmp:
+        workdir = Path(tmp)
+        llm_port = free_port()
+        db_port = free_port()
+
+        servers = []
+        try:
+            servers.append(start_server("benchmarks.fake_deepseek", llm_port, {
+                "FAKE_DEEPSEEK_LATENCY": str(args.latency),
+                "FAKE_DEEPSEEK_TOKENS_PER_SECOND": str(args.tokens_per_second),
+                "FAKE_DEEPSEEK_ERROR_RATE": str(args.error_rate),
+                "FAKE_DEEPSEEK_MALFORMED_RATE": str(args.malformed_rate),
+                "FAKE_DEEPSEEK_SLOW_RATE": str(args.slow_rate)
+            }))
+            servers.append(start_server("benchmarks.fake_supabase", db_port, {
+                "FAKE_SUPABASE_LATENCY": str(args.db_latency)
+            }))
+
+            os.environ.update({
+                "DEEPSEEK_API_KEY": "sk-benchmark",
+                "DEEPSEEK_BASE_URL": f"http://127.0.0.1:{llm_port}/v1",
+                "SUPABASE_URL": f"http://127.0.0.1:{db_port}",
+                "SUPABASE_KEY": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJyb2xlIjoiYW5vbiJ9.benchmark",
+                "LLM_CACHE_ENABLED": "true" if args.use_llm_cache else "false",
+                "LLM_CACHE_PATH": str(workdir / "llm_cache.sqlite3"),
+                "DEEPSEEK_RATE_LIMIT_STATE_PATH": str(workdir / "rate_limiter.sqlite3")
+            })
+            # The stand-in has no provider quota; keep explicit overrides if given
+            os.environ.setdefault("DEEPSEEK_REQUESTS_PER_MINUTE", "100000")
+            os.environ.setdefault("DEEPSEEK_TOKENS_PER_MINUTE", "1000000000")
+            # A batch runs its plans through the batch manager's own plan slots
+            os.environ.setdefault("BATCH_MAX_ACTIVE_PLANS", str(args.concurrency))
+
+            log_target = sys.stdout if args.verbose else open(os.devnull, "w")
+            with contextlib.redirect_stdout(log_target):
+                report = asyncio.run(run_benchmark(args, workdir))
+
+            report["fake_deepseek"] = httpx.get(f"http://127.0.0.1:{llm_port}/stats").json()
+            report["fake_supabase"] = httpx.get(f"http://127.0.0.1:{db_port}/stats").json()
+        finally:
+            for server in servers:
+                server.terminate()
+                server.wait(timeout=10)
+
+    print_report(report)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2))
+        print(f"💾 Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
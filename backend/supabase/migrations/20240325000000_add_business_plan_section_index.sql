@@ -0,0 +1,8 @@
+-- File: backend/supabase/migrations/20240325000000_add_business_plan_section_index.sql
+
+-- Add section_index field to business_plans table
+ALTER TABLE business_plans
+ADD COLUMN IF NOT EXISTS section_index JSONB;
+
+-- Add comment for documentation
+COMMENT ON COLUMN business_plans.section_index IS 'Sections of the plan (section, title, start, end, pages, source) with character offsets into the extracted text, built when the plan is extracted';
@@ -0,0 +1,24 @@
+-- File: backend/supabase/migrations/20240326000000_create_evaluation_batches.sql
+
+-- Create evaluation_batches table: batch evaluations submitted to any worker
+CREATE TABLE IF NOT EXISTS evaluation_batches (
+    id UUID PRIMARY KEY,
+    items JSONB NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+-- Create index on created_at
+CREATE INDEX IF NOT EXISTS idx_evaluation_batches_created_at ON evaluation_batches(created_at);
+
+-- Add RLS policies (simplified for demo - no user authentication yet)
+ALTER TABLE evaluation_batches ENABLE ROW LEVEL SECURITY;
+
+-- Allow all operations for now (update with proper auth later)
+CREATE POLICY "Allow all operations on evaluation_batches"
+    ON evaluation_batches
+    FOR ALL
+    USING (true);
+
+-- Add comment for documentation
+COMMENT ON COLUMN evaluation_batches.items IS 'Batch items (project_id, bp_id, status, error, started_at) in submission order; the outcome of each item is read from its business_plans row';
@@ -0,0 +1,17 @@
+# File: backend/tests/conftest.py
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Settings are read at import time: keep the tests off real services and
+# out of the checkout's cache and rate-limiter state files
+_STATE_DIR = tempfile.mkdtemp(prefix="pitchai-tests-")
+os.environ.setdefault("DEEPSEEK_API_KEY", "test-key")
+os.environ.setdefault("SUPABASE_URL", "http://127.0.0.1:9")
+os.environ.setdefault("SUPABASE_KEY", "test-key")
+os.environ.setdefault("LLM_CACHE_PATH", os.path.join(_STATE_DIR, "llm_cache.sqlite3"))
+os.environ.setdefault("DEEPSEEK_RATE_LIMIT_STATE_PATH", os.path.join(_STATE_DIR, "rate_limit.sqlite3"))
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,121 @@
+# File: backend/tests/pdf_builder.py
+
+"""Small PDFs built with PyPDF2 for the document processing tests"""
+
+from typing import Dict, List, Sequence, Tuple, Union
+
+from PyPDF2 import PdfWriter
+from PyPDF2.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    NameObject,
+    NumberObject,
+    TextStringObject,
+)
+
+
+class ImagePage:
+    """A page that only draws an image (a scanned page)"""
+
+
+class NestedFormPage:
+    """A page whose text is drawn by a form XObject nested in another form"""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+Page = Union[str, ImagePage, NestedFormPage]
+
+
+def _name(value: str) -> NameObject:
+    return NameObject(value)
+
+
+def _text_operators(text: str, top: int = 720) -> bytes:
+    lines = [line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") for line in text.split("\n")]
+    shown = " T* ".join(f"({line}) Tj" for line in lines)
+    return f"BT /F1 11 Tf 14 TL 72 {top} Td {shown} ET".encode("latin-1")
+
+
+def _stream(writer: PdfWriter, data: bytes, entries: Dict[str, object] = None):
+    stream = DecodedStreamObject()
+    stream.set_data(data)
+    for key, value in (entries or {}).items():
+        stream[_name(key)] = value
+    return writer._add_object(stream)
+
+
+def _form(writer: PdfWriter, data: bytes, resources: DictionaryObject):
+    return _stream(writer, data, {
+        "/Type": _name("/XObject"),
+        "/Subtype": _name("/Form"),
+        "/BBox": ArrayObject([NumberObject(0), NumberObject(0), NumberObject(612), NumberObject(792)]),
+        "/Resources": resources
+    })
+
+
+def write_pdf(
+    path,
+    pages: Sequence[Page],
+    outline: Sequence[Tuple[str, int]] = (),
+    page_labels: Sequence[Tuple[int, str, str]] = ()
+) -> str:
+    """
+    Write a PDF with one page per entry of pages and return its path
+
+    Text pages draw their lines with a standard font. outline holds
+    top-level (title, 0-based page) entries; page_labels holds
+    (first page, style such as "/D" or "/r", prefix) ranges.
+    """
+    writer = PdfWriter()
+    font = writer._add_object(DictionaryObject({
+        _name("/Type"): _name("/Font"),
+        _name("/Subtype"): _name("/Type1"),
+        _name("/BaseFont"): _name("/Helvetica")
+    }))
+    fonts = DictionaryObject({_name("/F1"): font})
+
+    for entry in pages:
+        writer.add_blank_page(612, 792)
+        page = writer.pages[-1]
+        if isinstance(entry, ImagePage):
+            image = _stream(writer, b"\x80\x80\x80", {
+                "/Type": _name("/XObject"),
+                "/Subtype": _name("/Image"),
+                "/Width": NumberObject(1),
+                "/Height": NumberObject(1),
+                "/ColorSpace": _name("/DeviceRGB"),
+                "/BitsPerComponent": NumberObject(8)
+            })
+            resources = DictionaryObject({_name("/XObject"): DictionaryObject({_name("/Im0"): image})})
+            contents = b"q 540 0 0 720 36 36 cm /Im0 Do Q"
+        elif isinstance(entry, NestedFormPage):
+            inner = _form(writer, _text_operators(entry.text), DictionaryObject({_name("/Font"): fonts}))
+            outer = _form(writer, b"q /Fm1 Do Q", DictionaryObject({
+                _name("/XObject"): DictionaryObject({_name("/Fm1"): inner})
+            }))
+            resources = DictionaryObject({_name("/XObject"): DictionaryObject({_name("/Fm0"): outer})})
+            contents = b"q /Fm0 Do Q"
+        else:
+            resources = DictionaryObject({_name("/Font"): fonts})
+            contents = _text_operators(entry)
+        page[_name("/Resources")] = resources
+        page[_name("/Contents")] = _stream(writer, contents)
+
+    for title, page_index in outline:
+        writer.add_outline_item(title, page_index)
+
+    if page_labels:
+        numbers: List[object] = []
+        for start, style, prefix in page_labels:
+            label = DictionaryObject({_name("/S"): _name(style)})
+            if prefix:
+                label[_name("/P")] = TextStringObject(prefix)
+            numbers.extend([NumberObject(start), label])
+        writer._root_object[_name("/PageLabels")] = DictionaryObject({_name("/Nums"): ArrayObject(numbers)})
+
+    with open(path, "wb") as f:
+        writer.write(f)
+    return str(path)
@@ -0,0 +1,129 @@
+# File: backend/tests/test_batches.py
+
+import asyncio
+
+from app.api.v1 import batches
+from app.models.batch import BatchItem, BatchItemStatus
+from app.services.evaluation.batch import BatchManager, build_batch_status
+
+
+class FakeQuery:
+    """Just enough of the Supabase query builder for the batch status reads"""
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+
+    def select(self, columns):
+        return self
+
+    def eq(self, column, value):
+        self.rows = [row for row in self.rows if row[column] == value]
+        return self
+
+    def in_(self, column, values):
+        self.rows = [row for row in self.rows if row[column] in values]
+        return self
+
+    def gte(self, column, value):
+        self.rows = [row for row in self.rows if row[column] >= value]
+        return self
+
+    def order(self, column, desc=False):
+        self.rows.sort(key=lambda row: row[column], reverse=desc)
+        return self
+
+    def execute(self):
+        return type("Result", (), {"data": self.rows})()
+
+
+class FakeClient:
+    def __init__(self, tables):
+        self.tables = tables
+
+    def table(self, name):
+        return FakeQuery(self.tables.get(name, []))
+
+
+def test_manager_reports_each_start_and_records_outcomes():
+    items = [BatchItem(project_id="a", bp_id="bp-a"), BatchItem(project_id="b", bp_id="bp-b")]
+    started = []
+
+    async def runner(item):
+        if item.bp_id == "bp-b":
+            raise RuntimeError("extraction failed")
+        return {"status": "completed"}
+
+    def on_start(item):
+        started.append((item.bp_id, item.status))
+        raise RuntimeError("database unavailable")
+
+    asyncio.run(BatchManager(max_active_plans=1).run("batch", items, runner, on_start))
+
+    assert started == [("bp-a", BatchItemStatus.PROCESSING), ("bp-b", BatchItemStatus.PROCESSING)]
+    assert [item.status for item in items] == [BatchItemStatus.COMPLETED, BatchItemStatus.FAILED]
+    assert all(item.finished_at is not None for item in items)
+
+
+def test_status_finishes_with_the_last_item():
+    items = [
+        BatchItem(project_id="a", status=BatchItemStatus.COMPLETED, finished_at="2024-03-26T10:05:00"),
+        BatchItem(project_id="b", status=BatchItemStatus.FAILED, finished_at="2024-03-26T10:07:00"),
+    ]
+    status = build_batch_status("batch", "2024-03-26T10:00:00", items)
+    assert (status.completed, status.failed, status.progress) == (1, 1, 1.0)
+    assert status.finished_at.isoformat() == "2024-03-26T10:07:00"
+
+    items.append(BatchItem(project_id="c"))
+    status = build_batch_status("batch", "2024-03-26T10:00:00", items)
+    assert status.finished_at is None
+    assert status.queued == 1
+
+
+def test_status_is_derived_from_the_business_plans(monkeypatch):
+    created_at = "2024-03-26T10:00:00+00:00"
+    finished_at = "2024-03-26T10:09:00+00:00"
+    client = FakeClient({
+        "evaluation_batches": [{
+            "id": "batch",
+            "created_at": created_at,
+            "items": [
+                {"project_id": "done", "bp_id": "bp-done", "status": "queued"},
+                {"project_id": "review", "bp_id": "bp-review", "status": "queued"},
+                {"project_id": "running", "bp_id": "bp-running", "status": "processing",
+                 "started_at": "2024-03-26T10:01:00"},
+                {"project_id": "waiting", "bp_id": "bp-waiting", "status": "queued"},
+                {"project_id": "deleted", "bp_id": "bp-deleted", "status": "queued"},
+                {"project_id": "rejected", "status": "failed", "error": "Only PDF files are allowed"},
+            ]
+        }],
+        "business_plans": [
+            {"id": "bp-done", "status": "completed", "error_message": None, "updated_at": finished_at},
+            {"id": "bp-review", "status": "completed", "error_message": "评估超时", "updated_at": finished_at},
+            {"id": "bp-running", "status": "processing", "error_message": None, "updated_at": created_at},
+            {"id": "bp-waiting", "status": "processing", "error_message": None, "updated_at": created_at},
+        ],
+        "evaluations": [
+            {"business_plan_id": "bp-done", "total_score": 61, "created_at": "2024-03-20T10:00:00+00:00"},
+            {"business_plan_id": "bp-done", "total_score": 78, "created_at": "2024-03-26T10:08:00+00:00"},
+        ]
+    })
+    monkeypatch.setattr(batches.db, "get_client", lambda: client)
+
+    status = batches.load_batch_status("batch")
+
+    assert [(item.project_id, item.status) for item in status.items] == [
+        ("done", BatchItemStatus.COMPLETED),
+        ("review", BatchItemStatus.FAILED),
+        ("running", BatchItemStatus.PROCESSING),
+        ("waiting", BatchItemStatus.QUEUED),
+        ("deleted", BatchItemStatus.FAILED),
+        ("rejected", BatchItemStatus.FAILED),
+    ]
+    assert status.items[0].total_score == 78
+    assert status.items[1].error == "评估超时"
+    assert status.finished_at is None
+
+
+def test_unknown_batch_is_not_found(monkeypatch):
+    monkeypatch.setattr(batches.db, "get_client", lambda: FakeClient({}))
+    assert batches.load_batch_status("missing") is None
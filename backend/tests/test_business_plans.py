@@ -0,0 +1,31 @@
+# File: backend/tests/test_business_plans.py
+
+import asyncio
+
+import pytest
+
+from app.api.v1 import business_plans
+
+
+def _stream(monkeypatch, pieces):
+    async def stream_text_from_pdf(file_path):
+        for piece in pieces:
+            yield piece
+
+    monkeypatch.setattr(business_plans.document_processor, "stream_text_from_pdf", stream_text_from_pdf)
+
+
+async def _read(file_path):
+    return [piece async for piece in business_plans.stream_business_plan_text(file_path)]
+
+
+def test_streamed_text_is_passed_through(monkeypatch):
+    pieces = ["--- 第1页 ---\n" + "团队由五位创始人组成。" * 5]
+    _stream(monkeypatch, pieces)
+    assert asyncio.run(_read("plan.pdf")) == pieces
+
+
+def test_too_little_streamed_text_is_an_error(monkeypatch):
+    _stream(monkeypatch, ["--- 第1页 ---\n", "  短  "])
+    with pytest.raises(ValueError, match="too short"):
+        asyncio.run(_read("plan.pdf"))
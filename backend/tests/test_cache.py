@@ -0,0 +1,110 @@
+# File: backend/tests/test_cache.py
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.evaluation.cache import LLMResponseCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LLMResponseCache(str(tmp_path / "llm_cache.sqlite3"), max_bytes=1000, ttl_seconds=3600)
+
+
+class TestMakeKey:
+    def test_same_inputs_same_key(self):
+        key = LLMResponseCache.make_key("deepseek-chat", 0.3, "system", "prompt", tier="full", max_tokens=2000)
+        assert key == LLMResponseCache.make_key("deepseek-chat", 0.3, "system", "prompt", tier="full", max_tokens=2000)
+
+    @pytest.mark.parametrize("changes", [
+        {"model": "deepseek-reasoner"},
+        {"temperature": 0.7},
+        {"system_prompt": "other system"},
+        {"user_prompt": "other prompt"},
+        {"tier": "fast"},
+        {"max_tokens": 4000},
+        {"options": {}},
+        {"options": {"response_format": {"type": "text"}}},
+    ])
+    def test_every_input_is_part_of_the_key(self, changes):
+        inputs = dict(
+            model="deepseek-chat", temperature=0.3, system_prompt="system", user_prompt="prompt",
+            tier="full", max_tokens=2000, options={"response_format": {"type": "json_object"}}
+        )
+        assert LLMResponseCache.make_key(**inputs) != LLMResponseCache.make_key(**{**inputs, **changes})
+
+    def test_option_order_does_not_matter(self):
+        first = LLMResponseCache.make_key("deepseek-chat", 0.3, "system", "prompt", options={"a": 1, "b": 2})
+        assert first == LLMResponseCache.make_key("deepseek-chat", 0.3, "system", "prompt", options={"b": 2, "a": 1})
+
+
+class TestLLMResponseCache:
+    def test_round_trip(self, cache):
+        assert cache.get("key") is None
+        cache.set("key", "团队能力: 24")
+        assert cache.get("key") == "团队能力: 24"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["entries"] == 1
+
+    def test_replacing_an_entry_keeps_the_size_total(self, cache):
+        cache.set("key", "a" * 100)
+        cache.set("key", "b" * 50)
+        assert cache.get("key") == "b" * 50
+        assert cache._total_size == 50
+        assert cache.stats()["size_bytes"] == 50
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        cache = LLMResponseCache(str(tmp_path / "llm_cache.sqlite3"), max_bytes=1000, ttl_seconds=0.01)
+        cache.set("key", "value")
+        time.sleep(0.02)
+        assert cache.get("key") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_least_recently_used_entries_are_evicted(self, cache):
+        for index in range(4):
+            cache.set(f"key-{index}", str(index) * 200)
+        # Touch the oldest entry so key-1 becomes the least recently used
+        assert cache.get("key-0") is not None
+
+        cache.set("key-4", "4" * 300)
+
+        assert cache.get("key-1") is None
+        assert cache.get("key-0") is not None
+        assert cache.get("key-4") is not None
+        stats = cache.stats()
+        assert stats["size_bytes"] <= cache.max_bytes * cache.EVICT_TARGET_RATIO
+        assert stats["evictions"] >= 1
+
+    def test_eviction_counts_what_other_workers_wrote(self, cache, tmp_path):
+        other_worker = LLMResponseCache(str(tmp_path / "llm_cache.sqlite3"), max_bytes=1000, ttl_seconds=3600)
+        cache.set("key-0", "0" * 400)
+        other_worker.set("key-1", "1" * 400)
+        # Over the limit by this process's count alone, and further over in the shared file
+        cache.set("key-2", "2" * 700)
+        assert cache.stats()["size_bytes"] <= cache.max_bytes * cache.EVICT_TARGET_RATIO
+
+    def test_expiry_sweep_resyncs_the_total(self, cache, tmp_path, monkeypatch):
+        other_worker = LLMResponseCache(str(tmp_path / "llm_cache.sqlite3"), max_bytes=1000, ttl_seconds=3600)
+        cache.set("key-0", "0" * 400)
+        other_worker.set("key-1", "1" * 400)
+        monkeypatch.setattr(cache, "EXPIRY_SWEEP_SECONDS", 0)
+        cache.set("key-2", "2" * 400)
+        assert cache.stats()["size_bytes"] <= cache.max_bytes * cache.EVICT_TARGET_RATIO
+
+    def test_disabled_cache(self, tmp_path):
+        cache = LLMResponseCache(str(tmp_path / "llm_cache.sqlite3"), max_bytes=1000, ttl_seconds=3600, enabled=False)
+        cache.set("key", "value")
+        assert cache.get("key") is None
+        assert not (tmp_path / "llm_cache.sqlite3").exists()
+
+    def test_async_methods(self, cache):
+        async def scenario():
+            assert await cache.get_async("key") is None
+            await cache.set_async("key", "value")
+            assert await cache.get_async("key") == "value"
+            return await cache.stats_async()
+
+        assert asyncio.run(scenario())["entries"] == 1
@@ -0,0 +1,64 @@
+# File: backend/tests/test_cascade.py
+
+from app.models.evaluation import EvaluationMode
+from app.services.evaluation.cascade import FAST_TIER, FULL_TIER, select_escalations
+from app.services.evaluation.deepseek_client import deepseek_client
+
+MAX_SCORES = {"A": 30, "B": 20, "C": 20, "D": 15, "E": 15}
+
+
+def _results(scores, **flags):
+    results = {
+        dimension: {"score": score, "max_score": MAX_SCORES[dimension]}
+        for dimension, score in zip(MAX_SCORES, scores)
+    }
+    for dimension, flag in flags.items():
+        results[dimension][flag] = True
+    return results
+
+
+class TestSelectEscalations:
+    def test_confident_results_far_from_a_threshold_are_accepted(self):
+        assert select_escalations(_results([12, 8, 8, 6, 6]), margin=5) == {}
+
+    def test_low_confidence_dimensions_are_escalated(self):
+        results = _results([12, 8, 8, 6, 6], A="fallback", B="model_repaired", C="scores_adjusted")
+        assert select_escalations(results, margin=5) == {
+            "A": ["evaluation_failed"],
+            "B": ["json_repaired"],
+            "C": ["inconsistent_scores"],
+        }
+
+    def test_near_a_threshold_the_largest_swings_are_escalated_until_it_can_be_crossed(self):
+        # 58 is 2 below 60; the 5 point margin gives A 1.5 points of swing and B and C 1.0 each
+        assert select_escalations(_results([18, 12, 12, 8, 8]), margin=5) == {
+            "A": ["near_status_threshold"],
+            "B": ["near_status_threshold"],
+        }
+
+    def test_escalated_dimensions_count_toward_the_threshold_first(self):
+        escalations = select_escalations(_results([18, 12, 12, 8, 8], D="scores_adjusted"), margin=5)
+        # D's 0.75 plus A's 1.5 cover the 2 points
+        assert escalations == {"D": ["inconsistent_scores"], "A": ["near_status_threshold"]}
+
+    def test_nothing_is_added_when_the_threshold_cannot_be_crossed(self):
+        # 55 is the full margin below 60: even every dimension together only reaches it
+        assert select_escalations(_results([17, 11, 11, 8, 8]), margin=5) == {}
+
+    def test_swing_is_capped_by_the_room_left(self):
+        # A and B are at their maximum, so only C, D and E can lift 58 over 60
+        assert select_escalations(_results([30, 20, 4, 2, 2]), margin=5) == {
+            "C": ["near_status_threshold"],
+            "D": ["near_status_threshold"],
+            "E": ["near_status_threshold"],
+        }
+
+
+class TestCascadeMode:
+    def test_same_model_in_both_tiers_runs_per_dimension(self, monkeypatch):
+        monkeypatch.setattr(FAST_TIER, "model", FULL_TIER.model)
+        assert deepseek_client._resolve_evaluation_mode("cascade") == EvaluationMode.PER_DIMENSION
+
+    def test_cheaper_fast_model_runs_the_cascade(self, monkeypatch):
+        monkeypatch.setattr(FAST_TIER, "model", FULL_TIER.model + "-lite")
+        assert deepseek_client._resolve_evaluation_mode("cascade") == EvaluationMode.CASCADE
@@ -0,0 +1,42 @@
+# File: backend/tests/test_document_cache.py
+
+import os
+
+from app.services.document.document_cache import DocumentCache
+
+
+def test_least_recently_used_document_is_evicted():
+    cache = DocumentCache(max_entries=2)
+    cache.put("a", "document a")
+    cache.put("b", "document b")
+    assert cache.get("a") == "document a"
+    cache.put("c", "document c")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "document a"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_zero_entries_disables_the_cache():
+    cache = DocumentCache(max_entries=0)
+    cache.put("a", "document a")
+    assert cache.get("a") is None
+
+
+def test_identical_files_share_a_fingerprint(tmp_path):
+    cache = DocumentCache(max_entries=2)
+    (tmp_path / "a.pdf").write_bytes(b"%PDF-1.4 plan")
+    (tmp_path / "b.pdf").write_bytes(b"%PDF-1.4 plan")
+    assert cache.fingerprint(str(tmp_path / "a.pdf")) == cache.fingerprint(str(tmp_path / "b.pdf"))
+
+
+def test_changed_file_is_hashed_again(tmp_path):
+    cache = DocumentCache(max_entries=2)
+    path = tmp_path / "plan.pdf"
+    path.write_bytes(b"%PDF-1.4 first")
+    first = cache.fingerprint(str(path))
+
+    path.write_bytes(b"%PDF-1.4 second version")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert cache.fingerprint(str(path)) != first
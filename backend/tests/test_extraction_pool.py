@@ -0,0 +1,49 @@
+# File: backend/tests/test_extraction_pool.py
+
+import asyncio
+import operator
+import time
+
+import pytest
+
+from app.services.document.extraction_pool import ExtractionPool, ExtractionTimeoutError
+
+
+@pytest.fixture
+def pool():
+    pool = ExtractionPool(workers=2, timeout=30)
+    yield pool
+    pool._restart(pool._generation)
+
+
+def test_job_runs_in_a_worker_process(pool):
+    assert asyncio.run(pool.run(operator.add, 2, 3)) == 5
+    assert pool.stats()["completed"] == 1
+
+
+def test_job_over_its_timeout_is_killed_and_the_pool_recreated(pool):
+    async def scenario():
+        with pytest.raises(ExtractionTimeoutError):
+            await pool.run(time.sleep, 60, timeout=3)
+        return await pool.run(operator.add, 2, 3)
+
+    assert asyncio.run(scenario()) == 5
+    stats = pool.stats()
+    assert (stats["timed_out"], stats["restarts"], stats["failed"], stats["completed"]) == (1, 1, 1, 1)
+
+
+def test_jobs_running_beside_a_timed_out_job_are_resubmitted(pool):
+    async def scenario():
+        # Start the pool so the timeout below is not spent spawning workers
+        await pool.run(operator.add, 0, 0)
+        return await asyncio.gather(
+            pool.run(time.sleep, 60, timeout=1),
+            pool.run(time.sleep, 2),
+            return_exceptions=True
+        )
+
+    hung, resubmitted = asyncio.run(scenario())
+    assert isinstance(hung, ExtractionTimeoutError)
+    assert resubmitted is None
+    stats = pool.stats()
+    assert (stats["restarts"], stats["completed"], stats["failed"]) == (1, 2, 1)
@@ -0,0 +1,80 @@
+# File: backend/tests/test_fair_scheduler.py
+
+import asyncio
+
+from app.services.evaluation.fair_scheduler import FairCallPool
+
+
+async def _run_calls(pool, owners, order, hold=0.01):
+    async def call(owner, index):
+        async with pool.slot(owner):
+            order.append(owner)
+            await asyncio.sleep(hold)
+
+    tasks = []
+    for owner, count in owners:
+        tasks.extend(asyncio.create_task(call(owner, index)) for index in range(count))
+        # Let the owner queue all of its calls before the next one arrives
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+
+
+def test_slots_are_shared_round_robin_across_owners():
+    pool = FairCallPool(max_concurrency=1)
+    order = []
+    asyncio.run(_run_calls(pool, [("plan-a", 4), ("plan-b", 2), ("plan-c", 2)], order))
+    # plan-a takes the free slot first, then owners alternate
+    assert order == ["plan-a", "plan-a", "plan-b", "plan-c", "plan-a", "plan-b", "plan-c", "plan-a"]
+
+
+def test_concurrency_is_bounded():
+    pool = FairCallPool(max_concurrency=3)
+    active = []
+    peak = []
+
+    async def call():
+        async with pool.slot("plan"):
+            active.append(1)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.pop()
+
+    async def scenario():
+        await asyncio.gather(*(call() for _ in range(10)))
+
+    asyncio.run(scenario())
+    assert max(peak) == 3
+    assert pool.stats()["active"] == 0
+
+
+def test_cancelled_waiter_gives_up_its_place():
+    pool = FairCallPool(max_concurrency=1)
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def holder():
+            async with pool.slot("plan-a"):
+                await release.wait()
+
+        async def waiter(owner):
+            async with pool.slot(owner):
+                return owner
+
+        holding = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        cancelled = asyncio.create_task(waiter("plan-b"))
+        queued = asyncio.create_task(waiter("plan-c"))
+        await asyncio.sleep(0)
+        assert pool.stats()["queued"] == 2
+
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        await holding
+        assert await queued == "plan-c"
+        assert cancelled.cancelled()
+        return pool.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats == {"max_concurrency": 1, "active": 0, "queued": 0, "waiting_owners": 0}
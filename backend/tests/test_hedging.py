@@ -0,0 +1,137 @@
+# File: backend/tests/test_hedging.py
+
+import asyncio
+
+from app.services.evaluation.hedging import LatencyHistogram, RequestHedger
+
+
+class Result:
+    def __init__(self, source):
+        self.source = source
+
+
+def _hedger(**overrides):
+    options = dict(enabled=True, percentile=90, max_extra_ratio=1.0, min_samples=3, window=20)
+    options.update(overrides)
+    return RequestHedger(**options)
+
+
+def _warm_up(hedger, calls=4, latency=0.02):
+    """Fill the latency histogram and the hedge budget's window with fast calls"""
+    async def fast_call(duplicate):
+        await asyncio.sleep(latency)
+        return Result("warm-up")
+
+    async def scenario():
+        for _ in range(calls):
+            await hedger.run(fast_call)
+
+    asyncio.run(scenario())
+
+
+def _make_call(primary_delay, duplicate_delay, calls=None):
+    async def make_call(duplicate):
+        if calls is not None:
+            calls.append(duplicate)
+        await asyncio.sleep(duplicate_delay if duplicate else primary_delay)
+        return Result("duplicate" if duplicate else "primary")
+    return make_call
+
+
+def test_latency_histogram_percentile():
+    histogram = LatencyHistogram(window=10)
+    assert histogram.percentile(90) is None
+    for latency in range(1, 11):
+        histogram.record(latency)
+    assert histogram.percentile(50) == 5
+    assert histogram.percentile(90) == 9
+
+
+def test_no_hedge_while_warming_up():
+    hedger = _hedger()
+    calls = []
+    result = asyncio.run(hedger.run(_make_call(0.05, 0.0, calls)))
+    assert result.source == "primary"
+    assert calls == [False]
+    assert hedger.hedge_delay() is None
+
+
+def test_slow_call_is_hedged_and_duplicate_wins():
+    hedger = _hedger()
+    _warm_up(hedger)
+    result = asyncio.run(hedger.run(_make_call(0.5, 0.01)))
+    assert result.source == "duplicate"
+    assert result.hedge == "won"
+    assert hedger.stats()["hedges_fired"] == 1
+    assert hedger.stats()["hedge_wins"] == 1
+
+
+def test_lost_primary_records_its_elapsed_time():
+    hedger = _hedger()
+    _warm_up(hedger, latency=0.05)
+    asyncio.run(hedger.run(_make_call(0.5, 0.01)))
+    # Hedged after ~0.05s, answered ~0.01s later: the primary's time, not the duplicate's
+    assert hedger.histogram._samples[-1] >= 0.05
+
+
+def test_primary_can_still_win():
+    hedger = _hedger()
+    _warm_up(hedger)
+    result = asyncio.run(hedger.run(_make_call(0.05, 0.5)))
+    assert result.source == "primary"
+    assert result.hedge == "lost"
+
+
+def test_admit_refusal_skips_the_hedge():
+    hedger = _hedger()
+    _warm_up(hedger)
+    calls = []
+
+    async def admit():
+        return False
+
+    result = asyncio.run(hedger.run(_make_call(0.05, 0.0, calls), admit=admit))
+    assert result.source == "primary"
+    assert calls == [False]
+    assert hedger.stats()["hedges_skipped"] == 1
+
+
+def test_hedges_are_capped_by_the_extra_call_ratio():
+    hedger = _hedger(max_extra_ratio=0.25)
+    _warm_up(hedger, calls=4)
+    calls = []
+
+    async def scenario():
+        for _ in range(3):
+            await hedger.run(_make_call(0.2, 0.0, calls))
+
+    asyncio.run(scenario())
+    # A quarter of the window: the first slow call may be hedged after 4 calls,
+    # a second hedge would need 8
+    assert hedger.stats()["hedges_fired"] == 1
+    assert hedger.stats()["hedges_skipped"] == 2
+
+
+def test_first_error_is_raised_when_every_attempt_fails():
+    hedger = _hedger()
+    _warm_up(hedger, latency=0.01)
+
+    async def make_call(duplicate):
+        await asyncio.sleep(0.03)
+        raise RuntimeError("duplicate" if duplicate else "primary")
+
+    try:
+        asyncio.run(hedger.run(make_call))
+    except RuntimeError as e:
+        assert str(e) == "primary"
+    else:
+        raise AssertionError("expected the primary's error")
+
+
+def test_disabled_hedger_runs_the_call_once():
+    hedger = _hedger(enabled=False)
+    calls = []
+    result = asyncio.run(hedger.run(_make_call(0.05, 0.0, calls)))
+    assert result.source == "primary"
+    assert calls == [False]
+    assert hedger.stats()["calls"] == 0
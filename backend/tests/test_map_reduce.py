@@ -0,0 +1,73 @@
+# File: backend/tests/test_map_reduce.py
+
+from app.services.evaluation.map_reduce import DigestChunker, parse_summary, render_digest, split_pages
+from app.utils.token_utils import estimate_tokens
+
+PAGES = [f"第{number}页介绍公司在该领域的进展与计划，包含若干数据和说明。" * 3 for number in range(1, 41)]
+MAX_TOKENS = estimate_tokens(PAGES[0]) * 6
+
+
+def _document(pages):
+    return "\n\n".join(f"--- 第{number}页 ---\n{page}" for number, page in enumerate(pages, 1))
+
+
+def _chunk(pages, max_tokens=MAX_TOKENS, pieces=1):
+    chunker = DigestChunker(max_tokens)
+    step = -(-len(pages) // pieces)
+    chunks = []
+    for start in range(0, len(pages), step):
+        chunks.extend(chunker.add_text(_document(pages[start:start + step])))
+    return chunks + chunker.finish()
+
+
+def test_split_pages_drops_markers():
+    assert split_pages("--- 第1页 --- 概况 --- 第2页 --- 团队") == ["概况", "团队"]
+
+
+def test_chunks_hold_whole_pages_within_the_budget():
+    chunks = _chunk(PAGES)
+    assert "\n".join(chunks) == "\n".join(PAGES)
+    assert all(estimate_tokens(chunk) <= MAX_TOKENS for chunk in chunks)
+    assert 1 < len(chunks) < len(PAGES)
+
+
+def test_chunks_do_not_depend_on_how_the_text_is_streamed():
+    assert _chunk(PAGES, pieces=7) == _chunk(PAGES)
+
+
+def test_editing_a_page_keeps_the_chunks_away_from_it():
+    chunks = _chunk(PAGES)
+    edited_pages = list(PAGES)
+    edited_pages[20] = "第21页已更新：新增两家签约客户。"
+    edited_chunks = _chunk(edited_pages)
+
+    changed = set(edited_chunks) - set(chunks)
+    assert any("第21页已更新" in chunk for chunk in changed)
+    # Only the edited page's chunk and those up to the next content-defined boundary change
+    assert len(changed) <= 2
+    assert edited_chunks[:2] == chunks[:2]
+    assert edited_chunks[-2:] == chunks[-2:]
+
+
+def test_oversized_page_is_split():
+    chunks = _chunk(["开头。", "很长的一页内容。" * 200, "结尾。"], max_tokens=100)
+    assert chunks[0] == "开头。"
+    assert chunks[-1] == "结尾。"
+    assert all(estimate_tokens(chunk) <= 100 for chunk in chunks)
+
+
+def test_summary_without_known_dimensions_is_rejected():
+    assert parse_summary(["团队能力"], {"其他": ["x"]}) is None
+    assert parse_summary(["团队能力", "市场前景"], {"团队能力": "三位创始人"}) == {
+        "团队能力": ["三位创始人"], "市场前景": []
+    }
+
+
+def test_digest_lists_repeated_facts_once():
+    digest = render_digest(
+        ["团队能力", "市场前景"],
+        [{"团队能力": ["三位创始人"]}, {"团队能力": ["三位创始人", "CEO曾任高管"]}],
+        token_budget=1000
+    )
+    assert digest.count("三位创始人") == 1
+    assert "【市场前景】\n- 未提及" in digest
@@ -0,0 +1,83 @@
+# File: backend/tests/test_parsed_document.py
+
+import gzip
+import json
+
+import pytest
+
+from app.core.config.settings import settings
+from app.services.document.processor import ParsedDocument
+
+
+def _document(file_path, sha256="abc", **overrides):
+    options = dict(
+        valid=True,
+        page_count=2,
+        pages=["Team of five founders", "Market size 2 billion"],
+        file_size=1234,
+        sha256=sha256
+    )
+    options.update(overrides)
+    return ParsedDocument(str(file_path), **options)
+
+
+@pytest.fixture
+def saved(tmp_path):
+    document = _document(tmp_path / "plan.pdf")
+    document.save()
+    return document
+
+
+class TestSidecar:
+    def test_load_reads_only_the_header(self, saved, tmp_path):
+        loaded = ParsedDocument.load(str(tmp_path / "plan.pdf"), "abc")
+        assert loaded.page_count == 2
+        assert loaded.file_size == 1234
+        assert loaded._pages is None and loaded._text is None
+        assert loaded.sections == saved.sections
+
+    def test_text_and_pages_are_read_on_first_access(self, saved, tmp_path):
+        loaded = ParsedDocument.load(str(tmp_path / "plan.pdf"), "abc")
+        assert loaded.text == saved.text
+        assert loaded._pages is None
+        assert loaded.pages == saved.pages
+
+    def test_missing_sidecar(self, tmp_path):
+        assert ParsedDocument.load(str(tmp_path / "plan.pdf"), "abc") is None
+
+    def test_other_file_content_is_a_miss(self, saved, tmp_path):
+        assert ParsedDocument.load(str(tmp_path / "plan.pdf"), "other") is None
+
+    def test_other_extractor_version_is_a_miss(self, saved, tmp_path):
+        sidecar = ParsedDocument.sidecar_path(str(tmp_path / "plan.pdf"))
+        with gzip.open(sidecar, "rt", encoding="utf-8") as f:
+            lines = f.readlines()
+        header = json.loads(lines[0])
+        header["extractor_version"] = "0/PyPDF2-0"
+        with gzip.open(sidecar, "wt", encoding="utf-8") as f:
+            f.writelines([json.dumps(header) + "\n"] + lines[1:])
+        assert ParsedDocument.load(str(tmp_path / "plan.pdf"), "abc") is None
+
+    def test_unreadable_sidecar_is_a_miss(self, tmp_path):
+        ParsedDocument.sidecar_path(str(tmp_path / "plan.pdf")).write_bytes(b"not gzip")
+        assert ParsedDocument.load(str(tmp_path / "plan.pdf"), "abc") is None
+
+    @pytest.mark.parametrize("setting, value", [
+        ("PDF_BOILERPLATE_LINE_RATIO", 0.9),
+        ("PDF_BOILERPLATE_MIN_PAGES", 10),
+    ])
+    def test_another_boilerplate_setting_is_a_miss(self, saved, tmp_path, monkeypatch, setting, value):
+        monkeypatch.setattr(settings, setting, value)
+        assert ParsedDocument.load(str(tmp_path / "plan.pdf"), "abc") is None
+
+    def test_sampled_document_is_a_miss_under_another_budget(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "PDF_TEXT_BUDGET_TOKENS", 1000)
+        _document(tmp_path / "plan.pdf", covered_pages=[0]).save()
+        assert ParsedDocument.load(str(tmp_path / "plan.pdf"), "abc").covered_pages == [0]
+        monkeypatch.setattr(settings, "PDF_TEXT_BUDGET_TOKENS", 2000)
+        assert ParsedDocument.load(str(tmp_path / "plan.pdf"), "abc") is None
+
+    def test_failed_write_leaves_no_sidecar(self, tmp_path):
+        document = _document(tmp_path / "missing-dir" / "plan.pdf")
+        document.save()
+        assert not ParsedDocument.sidecar_path(document.file_path).exists()
@@ -0,0 +1,156 @@
+# File: backend/tests/test_parsing.py
+
+import json
+
+import pytest
+
+from app.services.evaluation.parsing import check_dimension_output, extract_json
+from app.services.evaluation.streaming import IncrementalJSONParser
+
+TEAM_CONFIG = {
+    "max_score": 30,
+    "sub_dimensions": {"核心团队背景": 15, "团队完整性": 15}
+}
+
+
+def _team_output(**overrides):
+    output = {
+        "score": 24,
+        "comments": "团队经验丰富",
+        "sub_dimensions": [
+            {"sub_dimension": "核心团队背景", "score": 12, "comments": "行业背景强"},
+            {"sub_dimension": "团队完整性", "score": 12, "comments": "缺少财务负责人"}
+        ],
+        "missing_info": []
+    }
+    output.update(overrides)
+    return output
+
+
+class TestExtractJson:
+    def test_plain_json(self):
+        assert extract_json('{"score": 24}') == {"score": 24}
+
+    def test_markdown_fence(self):
+        assert extract_json('评估结果如下：\n```json\n{"score": 24}\n```') == {"score": 24}
+
+    def test_surrounding_prose(self):
+        assert extract_json('Here you go: {"score": 24, "comments": "ok"} Hope this helps.') == {
+            "score": 24,
+            "comments": "ok"
+        }
+
+    def test_truncated_output_is_closed(self):
+        assert extract_json('{"score": 24, "sub_dimensions": [{"score": 12}') == {
+            "score": 24,
+            "sub_dimensions": [{"score": 12}]
+        }
+
+    def test_truncated_string_falls_back_to_last_complete_element(self):
+        result = extract_json('{"score": 24, "comments": "团队经验')
+        assert result["score"] == 24
+
+    def test_near_json_is_normalized(self):
+        text = "{'score': 24, passed: True, note: None, items: [1, 2,],}"
+        assert extract_json(text) == {"score": 24, "passed": True, "note": None, "items": [1, 2]}
+
+    def test_single_quoted_string_with_double_quote(self):
+        assert extract_json("{'comments': 'the \"core\" team'}") == {"comments": 'the "core" team'}
+
+    def test_unparseable_raises_with_original_text(self):
+        with pytest.raises(json.JSONDecodeError) as error:
+            extract_json("no json here")
+        assert error.value.doc == "no json here"
+
+
+class TestCheckDimensionOutput:
+    def test_valid_output(self):
+        check = check_dimension_output(TEAM_CONFIG, _team_output())
+        assert check.ok
+        assert check.result["score"] == 24
+        assert check.repairs == []
+        assert not check.result["scores_adjusted"]
+
+    def test_not_an_object(self):
+        check = check_dimension_output(TEAM_CONFIG, [1, 2])
+        assert not check.ok
+        assert check.errors
+
+    def test_string_scores_are_coerced(self):
+        output = _team_output(score="24分")
+        output["sub_dimensions"][0]["score"] = "12/15"
+        check = check_dimension_output(TEAM_CONFIG, output)
+        assert check.ok
+        assert check.result["score"] == 24
+        assert check.result["sub_dimensions"][0]["score"] == 12
+
+    def test_numbered_sub_dimension_names_are_matched(self):
+        output = _team_output()
+        output["sub_dimensions"][0]["sub_dimension"] = "1. 核心团队背景"
+        check = check_dimension_output(TEAM_CONFIG, output)
+        assert check.ok
+        assert check.result["sub_dimensions"][0]["sub_dimension"] == "核心团队背景"
+        assert check.repairs
+
+    def test_scores_are_clamped_and_total_recomputed(self):
+        output = _team_output(score=40)
+        output["sub_dimensions"][0]["score"] = 20
+        check = check_dimension_output(TEAM_CONFIG, output)
+        assert check.ok
+        assert check.result["sub_dimensions"][0]["score"] == 15
+        assert check.result["score"] == 27
+        assert check.result["scores_adjusted"]
+
+    def test_missing_sub_dimension_score_is_an_error(self):
+        output = _team_output()
+        output["sub_dimensions"][1]["score"] = None
+        check = check_dimension_output(TEAM_CONFIG, output)
+        assert not check.ok
+        assert check.result is None
+        assert any("团队完整性" in error for error in check.errors)
+
+
+class TestIncrementalJSONParser:
+    def test_values_are_reported_as_they_complete(self):
+        parser = IncrementalJSONParser()
+        assert parser.feed('{"score": 2') == []
+        assert parser.feed('4, "comm') == [(("score",), 24)]
+        assert parser.feed('ents": "团队') == []
+        assert parser.feed('经验丰富"}') == [(("comments",), "团队经验丰富")]
+        assert parser.done
+
+    def test_nested_paths(self):
+        parser = IncrementalJSONParser()
+        events = parser.feed(
+            '{"sub_dimensions": [{"sub_dimension": "团队", "score": 12}, {"score": 9.5}], "ok": true}'
+        )
+        assert events == [
+            (("sub_dimensions", 0, "sub_dimension"), "团队"),
+            (("sub_dimensions", 0, "score"), 12),
+            (("sub_dimensions", 1, "score"), 9.5),
+            (("ok",), True)
+        ]
+
+    def test_prose_and_fences_are_skipped(self):
+        parser = IncrementalJSONParser()
+        events = parser.feed('```json\n{"score": 24}\n```\n{"score": 99}')
+        assert events == [(("score",), 24)]
+        assert parser.feed('{"score": 1}') == []
+
+    def test_escaped_characters(self):
+        parser = IncrementalJSONParser()
+        events = parser.feed('{"comments": "the \\"core\\" team\\n"}')
+        assert events == [(("comments",), 'the "core" team\n')]
+
+    def test_matches_full_parse(self):
+        document = {"score": 24, "sub_dimensions": [{"score": 12, "comments": "好"}], "missing_info": []}
+        text = json.dumps(document, ensure_ascii=False)
+        parser = IncrementalJSONParser()
+        events = []
+        for ch in text:
+            events.extend(parser.feed(ch))
+        assert events == [
+            (("score",), 24),
+            (("sub_dimensions", 0, "score"), 12),
+            (("sub_dimensions", 0, "comments"), "好")
+        ]
@@ -0,0 +1,240 @@
+# File: backend/tests/test_processor.py
+
+import asyncio
+
+import PyPDF2
+import pytest
+
+from app.core.config.settings import settings
+from app.services.document import processor as processor_module
+from app.services.document.document_cache import DocumentCache
+from app.services.document.extraction_pool import extraction_pool
+from app.services.document.processor import DocumentProcessor, clean_extracted_text
+from app.utils.token_utils import estimate_tokens
+from pdf_builder import ImagePage, NestedFormPage, write_pdf
+
+
+@pytest.fixture
+def processor():
+    return DocumentProcessor()
+
+
+@pytest.fixture
+def jobs(monkeypatch):
+    """Run extraction jobs inline and keep parsed documents in a fresh cache; returns the jobs run"""
+    calls = []
+
+    async def run(fn, *args, timeout=None):
+        calls.append((fn.__name__, args))
+        return fn(*args)
+
+    monkeypatch.setattr(extraction_pool, "run", run)
+    monkeypatch.setattr(processor_module, "document_cache", DocumentCache(max_entries=8))
+    return calls
+
+
+def _count_classifications(processor, monkeypatch):
+    classified = []
+    classify_page = processor._classify_page
+
+    def counting(page):
+        classified.append(page)
+        return classify_page(page)
+
+    monkeypatch.setattr(processor, "_classify_page", counting)
+    return classified
+
+
+class TestImageOnlyPages:
+    def test_text_only_page_is_extracted(self, processor, tmp_path):
+        document = processor.parse_pdf_sync(write_pdf(tmp_path / "plan.pdf", ["Team of five founders"]))
+        assert document.pages == ["Team of five founders"]
+        assert document.image_only_pages == 0
+
+    def test_text_in_a_nested_form_is_extracted(self, processor, tmp_path):
+        document = processor.parse_pdf_sync(write_pdf(tmp_path / "plan.pdf", [NestedFormPage("Market size 2 billion")]))
+        assert document.pages == ["Market size 2 billion"]
+        assert document.image_only_pages == 0
+
+    def test_image_only_page_is_not_extracted(self, processor, tmp_path):
+        document = processor.parse_pdf_sync(write_pdf(tmp_path / "plan.pdf", ["Overview", ImagePage()]))
+        assert document.pages == ["Overview", ""]
+        assert document.image_only_pages == 1
+        assert not document.mostly_images
+
+    def test_scanned_plan_is_mostly_images(self, processor, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "PDF_IMAGE_ONLY_RATIO", 0.8)
+        document = processor.parse_pdf_sync(write_pdf(tmp_path / "plan.pdf", [ImagePage()] * 5))
+        assert document.mostly_images
+
+    def test_short_plan_classifies_each_page_once(self, processor, tmp_path, monkeypatch):
+        classified = _count_classifications(processor, monkeypatch)
+        processor.parse_pdf_sync(write_pdf(tmp_path / "plan.pdf", ["Page one", ImagePage(), "Page three"]))
+        assert len(classified) == 3
+
+
+class TestLongPlanClassification:
+    def test_text_plan_stops_classifying_once_the_ratio_is_ruled_out(self, processor, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "PDF_IMAGE_ONLY_RATIO", 0.8)
+        document = processor.parse_pdf_sync(write_pdf(tmp_path / "plan.pdf", ["Text"] * 10), max_pages=2)
+        # 8 image-only pages are needed; after 3 text pages only 7 remain
+        assert sorted(document.classified_pages) == [0, 1, 2]
+        assert not document.mostly_images
+        assert document._pages is None
+
+    def test_scanned_plan_stops_classifying_once_the_ratio_is_reached(self, processor, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "PDF_IMAGE_ONLY_RATIO", 0.8)
+        document = processor.parse_pdf_sync(write_pdf(tmp_path / "plan.pdf", [ImagePage()] * 10), max_pages=2)
+        assert len(document.classified_pages) == 8
+        assert document.mostly_images
+        assert document.pages == [""] * 10
+
+    def test_extraction_jobs_reuse_the_classification(self, processor, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "PDF_IMAGE_ONLY_RATIO", 0.8)
+        pdf = write_pdf(tmp_path / "plan.pdf", [f"Page {number}" for number in range(1, 11)])
+        classified = _count_classifications(processor, monkeypatch)
+
+        document = processor.parse_pdf_sync(pdf, max_pages=2)
+        first_half = processor.extract_pages_sync(pdf, list(range(5)), document.classified(range(5)))
+        second_half = processor.extract_pages_sync(pdf, list(range(5, 10)), document.classified(range(5, 10)))
+
+        assert first_half + second_half == [f"Page {number}" for number in range(1, 11)]
+        assert len(classified) == 10
+
+
+class TestExtractionPlan:
+    """Which extraction a plan gets: whole in the first job, page ranges or sampled batches"""
+
+    @pytest.fixture(autouse=True)
+    def thresholds(self, monkeypatch):
+        monkeypatch.setattr(extraction_pool, "workers", 2)
+        monkeypatch.setattr(settings, "PDF_PARALLEL_MIN_PAGES", 4)
+        monkeypatch.setattr(settings, "PDF_MIN_PAGES_PER_WORKER", 2)
+        monkeypatch.setattr(settings, "PDF_STREAM_BATCH_PAGES", 2)
+        monkeypatch.setattr(settings, "PDF_TEXT_BUDGET_TOKENS", 0)
+        monkeypatch.setattr(settings, "PDF_SAMPLING_MIN_PAGES", 6)
+
+    def _parse(self, processor, tmp_path, page_count):
+        page_texts = [f"Page {number}" for number in range(1, page_count + 1)]
+        document = asyncio.run(processor.parse_document(write_pdf(tmp_path / "plan.pdf", page_texts)))
+        assert document.pages == page_texts
+        return document
+
+    def test_short_plan_is_parsed_by_the_first_job(self, processor, tmp_path, jobs):
+        self._parse(processor, tmp_path, 3)
+        assert [name for name, _ in jobs] == ["_parse_in_worker"]
+
+    def test_long_plan_is_split_into_page_ranges(self, processor, tmp_path, jobs):
+        document = self._parse(processor, tmp_path, 8)
+        assert [(name, args[1]) for name, args in jobs[1:]] == [
+            ("_extract_pages_in_worker", [0, 1, 2, 3]),
+            ("_extract_pages_in_worker", [4, 5, 6, 7]),
+        ]
+        assert document.covered_pages is None
+
+    def test_budget_samples_plans_from_the_sampling_threshold(self, processor, tmp_path, jobs, monkeypatch):
+        monkeypatch.setattr(settings, "PDF_TEXT_BUDGET_TOKENS", 100000)
+        document = self._parse(processor, tmp_path, 9)
+        # Sampled in batches by thirds, one batch per worker in flight
+        assert [args[1] for _, args in jobs[1:]] == [[0, 3], [6, 1], [4, 7], [2, 5], [8]]
+        assert document.covered_pages is None
+
+    def test_budget_leaves_plans_below_the_sampling_threshold_to_page_ranges(
+        self, processor, tmp_path, jobs, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "PDF_TEXT_BUDGET_TOKENS", 100000)
+        self._parse(processor, tmp_path, 5)
+        assert [args[1] for _, args in jobs[1:]] == [[0, 1], [2, 3, 4]]
+
+    def test_single_worker_parses_unbudgeted_plans_in_the_first_job(self, processor, tmp_path, jobs, monkeypatch):
+        monkeypatch.setattr(extraction_pool, "workers", 1)
+        self._parse(processor, tmp_path, 8)
+        assert len(jobs) == 1
+
+    def test_page_ranges_keep_the_minimum_pages_per_worker(self, processor, monkeypatch):
+        monkeypatch.setattr(settings, "PDF_MIN_PAGES_PER_WORKER", 5)
+        assert processor._page_ranges(8) == [(0, 8)]
+        assert processor._page_ranges(10) == [(0, 5), (5, 10)]
+
+
+class TestTextBudget:
+    def _plan(self, processor, path):
+        pdf_reader = PyPDF2.PdfReader(path)
+        return processor._plan_pages(pdf_reader, len(pdf_reader.pages))
+
+    def test_outline_sections_are_sampled_round_robin_with_appendices_last(self, processor, tmp_path):
+        pdf = write_pdf(
+            tmp_path / "plan.pdf",
+            [f"Page {number}" for number in range(1, 10)],
+            outline=[("Overview", 0), ("Team", 3), ("Appendix A", 6)]
+        )
+        assert self._plan(processor, pdf) == [0, 3, 1, 4, 2, 5, 6, 7, 8]
+
+    def test_page_label_ranges_are_sections(self, processor, tmp_path):
+        pdf = write_pdf(
+            tmp_path / "plan.pdf",
+            [f"Page {number}" for number in range(1, 9)],
+            page_labels=[(0, "/r", ""), (2, "/D", ""), (6, "/D", "A-")]
+        )
+        # Roman front matter is a section; the prefixed range after the body is an appendix
+        assert self._plan(processor, pdf) == [0, 2, 1, 3, 4, 5, 6, 7]
+
+    def test_plans_without_structure_are_sampled_by_thirds(self, processor, tmp_path):
+        pdf = write_pdf(tmp_path / "plan.pdf", [f"Page {number}" for number in range(1, 10)])
+        assert self._plan(processor, pdf) == [0, 3, 6, 1, 4, 7, 2, 5, 8]
+
+    def test_extraction_stops_at_the_budget(self, processor, tmp_path, jobs, monkeypatch):
+        page_texts = [f"Page {number:02d} " + "revenue " * 12 for number in range(1, 13)]
+        page_tokens = estimate_tokens(clean_extracted_text(page_texts[0]))
+        monkeypatch.setattr(settings, "PDF_TEXT_BUDGET_TOKENS", page_tokens * 3)
+        monkeypatch.setattr(settings, "PDF_SAMPLING_MIN_PAGES", 4)
+        monkeypatch.setattr(settings, "PDF_STREAM_BATCH_PAGES", 2)
+        monkeypatch.setattr(extraction_pool, "workers", 1)
+
+        document = asyncio.run(processor.parse_document(write_pdf(tmp_path / "plan.pdf", page_texts)))
+
+        # Thirds order 0, 4, 8, 1, ...: the second batch of two reaches the budget
+        assert document.covered_pages == [0, 1, 4, 8]
+        assert document.info()["covered_pages"] == [1, 2, 5, 9]
+        assert [bool(page_text) for page_text in document.pages] == [
+            page_index in (0, 1, 4, 8) for page_index in range(12)
+        ]
+
+
+class TestStreamText:
+    def _stream_pages(self, processor, monkeypatch, page_count, error=None):
+        async def stream_raw_pages(file_path):
+            for number in range(1, page_count + 1):
+                yield number, f"Page {number} covers the {number}th part of the plan in some detail"
+            if error is not None:
+                raise error
+
+        monkeypatch.setattr(processor, "_stream_raw_pages", stream_raw_pages)
+
+    def _read(self, processor, pieces):
+        async def scenario():
+            async for piece in processor.stream_text_from_pdf("plan.pdf"):
+                pieces.append(piece)
+
+        asyncio.run(scenario())
+
+    def test_pages_are_streamed(self, processor, monkeypatch):
+        self._stream_pages(processor, monkeypatch, 6)
+        pieces = []
+        self._read(processor, pieces)
+        assert len(pieces) == 6
+        assert "--- 第6页 ---" in pieces[-1]
+
+    def test_failure_after_streaming_started_is_raised(self, processor, monkeypatch):
+        self._stream_pages(processor, monkeypatch, 6, error=RuntimeError("worker crashed"))
+        pieces = []
+        with pytest.raises(RuntimeError):
+            self._read(processor, pieces)
+        assert len(pieces) == 6
+
+    def test_failure_before_streaming_yields_the_fallback_text(self, processor, monkeypatch):
+        self._stream_pages(processor, monkeypatch, 1, error=RuntimeError("worker crashed"))
+        pieces = []
+        self._read(processor, pieces)
+        assert len(pieces) == 1
+        assert "文本提取失败" in pieces[0]
@@ -0,0 +1,83 @@
+# File: backend/tests/test_progress.py
+
+import asyncio
+import time
+
+from app.services.evaluation.progress import EvaluationProgressHub
+
+
+def _drain(queue):
+    events = []
+    while not queue.empty():
+        events.append(queue.get_nowait())
+    return events
+
+
+def test_snapshot_tracks_dimensions_and_result():
+    hub = EvaluationProgressHub()
+    hub.publish("project", {"type": "evaluation_started"})
+    hub.publish("project", {"type": "dimension_partial", "dimension": "团队能力", "field": "score", "value": 20})
+    hub.publish("project", {
+        "type": "dimension_completed", "dimension": "团队能力", "score": 24, "max_score": 30, "tier": "full"
+    })
+    hub.publish("project", {"type": "evaluation_completed", "total_score": 80})
+
+    snapshot = hub.snapshot("project")
+    assert snapshot["status"] == "completed"
+    assert snapshot["total_score"] == 80
+    assert snapshot["dimensions"]["团队能力"] == {"status": "completed", "score": 24, "max_score": 30, "tier": "full"}
+
+
+def test_subscribers_receive_events():
+    async def scenario():
+        hub = EvaluationProgressHub()
+        queue = hub.subscribe("project")
+        hub.publish("project", {"type": "evaluation_started"})
+        hub.publish("other", {"type": "evaluation_started"})
+        return _drain(queue)
+
+    events = asyncio.run(scenario())
+    assert [(event["type"], event["project_id"]) for event in events] == [("evaluation_started", "project")]
+
+
+def test_full_queue_drops_the_oldest_event():
+    async def scenario():
+        hub = EvaluationProgressHub(max_queue_size=2)
+        queue = hub.subscribe("project")
+        for score in range(3):
+            hub.publish("project", {"type": "dimension_partial", "dimension": "团队能力", "field": "score", "value": score})
+        return _drain(queue)
+
+    assert [event["value"] for event in asyncio.run(scenario())] == [1, 2]
+
+
+def test_scheduling_a_run_resets_the_previous_result():
+    hub = EvaluationProgressHub()
+    hub.publish("project", {"type": "evaluation_completed", "total_score": 80})
+    hub.reset("project")
+    assert hub.snapshot("project") == {"status": "processing", "dimensions": {}}
+
+
+def test_finished_snapshot_is_dropped_when_its_subscribers_leave():
+    async def scenario():
+        hub = EvaluationProgressHub()
+        queue = hub.subscribe("project")
+        hub.publish("project", {"type": "evaluation_started"})
+        hub.unsubscribe("project", queue)
+        # Still running: a later subscriber needs the snapshot
+        assert hub.snapshot("project")["status"] == "processing"
+
+        queue = hub.subscribe("project")
+        hub.publish("project", {"type": "evaluation_failed", "error": "timeout"})
+        hub.unsubscribe("project", queue)
+        return hub.snapshot("project")
+
+    assert asyncio.run(scenario()) == {}
+
+
+def test_finished_snapshot_expires_without_subscribers():
+    hub = EvaluationProgressHub(finished_ttl=0.01)
+    hub.publish("project", {"type": "evaluation_completed", "total_score": 80})
+    assert hub.snapshot("project")["status"] == "completed"
+    time.sleep(0.02)
+    assert hub.snapshot("project") == {}
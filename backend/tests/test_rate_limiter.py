@@ -0,0 +1,201 @@
+# File: backend/tests/test_rate_limiter.py
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.evaluation.rate_limiter import LLMProviderUnavailableError, RequestScheduler, SharedRateLimiter
+
+
+@pytest.fixture
+def limiter(tmp_path):
+    return SharedRateLimiter(
+        str(tmp_path / "rate_limit.sqlite3"),
+        requests_per_minute=60,
+        tokens_per_minute=6000,
+        failure_threshold=3,
+        cooldown_seconds=30
+    )
+
+
+def _scheduler(limiter, max_retries=2, max_queue_wait=5.0):
+    return RequestScheduler(
+        limiter,
+        max_retries=max_retries,
+        backoff_base=0.001,
+        backoff_max=0.01,
+        attempt_timeout=1.0,
+        max_queue_wait=max_queue_wait
+    )
+
+
+class Completion:
+    def __init__(self, total_tokens=100):
+        self.usage = type("Usage", (), {"total_tokens": total_tokens})()
+
+
+class TestTokenBuckets:
+    def test_requests_are_admitted_within_budget(self, limiter):
+        assert limiter.try_acquire(100) == 0
+        assert limiter.try_acquire(100) == 0
+
+    def test_token_budget_asks_to_wait(self, limiter):
+        assert limiter.try_acquire(5000) == 0
+        wait_seconds = limiter.try_acquire(2000)
+        # About 1000 tokens short at 100 tokens per second
+        assert 9 < wait_seconds <= 10
+
+    def test_request_budget_asks_to_wait(self, tmp_path):
+        limiter = SharedRateLimiter(
+            str(tmp_path / "rate_limit.sqlite3"), requests_per_minute=1, tokens_per_minute=6000,
+            failure_threshold=3, cooldown_seconds=30
+        )
+        assert limiter.try_acquire(10) == 0
+        assert limiter.try_acquire(10) > 50
+
+    def test_oversized_request_is_capped_at_the_budget(self, limiter):
+        assert limiter.try_acquire(100000) == 0
+
+    def test_reconcile_credits_unused_tokens(self, limiter):
+        assert limiter.try_acquire(5000) == 0
+        limiter.reconcile_tokens(5000, 1000)
+        assert limiter.try_acquire(4000) == 0
+
+    def test_state_is_shared_between_workers(self, limiter, tmp_path):
+        other_worker = SharedRateLimiter(
+            str(tmp_path / "rate_limit.sqlite3"), requests_per_minute=60, tokens_per_minute=6000,
+            failure_threshold=3, cooldown_seconds=30
+        )
+        assert limiter.try_acquire(5000) == 0
+        assert other_worker.try_acquire(2000) > 0
+
+
+class TestCircuitBreaker:
+    def test_closed_until_the_threshold(self, limiter):
+        limiter.record_failure()
+        limiter.record_failure()
+        assert limiter.breaker_wait() == 0
+
+    def test_opens_after_threshold_failures(self, limiter):
+        for _ in range(3):
+            limiter.record_failure()
+        assert 29 < limiter.breaker_wait() <= 30
+
+    def test_success_closes_the_breaker(self, limiter):
+        for _ in range(3):
+            limiter.record_failure()
+        limiter.record_success()
+        assert limiter.breaker_wait() == 0
+
+    def test_half_open_admits_one_probe(self, tmp_path):
+        limiter = SharedRateLimiter(
+            str(tmp_path / "rate_limit.sqlite3"), requests_per_minute=60, tokens_per_minute=6000,
+            failure_threshold=1, cooldown_seconds=0.5
+        )
+        limiter.record_failure()
+        assert limiter.breaker_wait() > 0
+        time.sleep(0.55)
+        # The first caller after the cooldown is the probe; the rest keep waiting
+        assert limiter.breaker_wait() == 0
+        assert limiter.breaker_wait() > 0
+
+
+class TestExtraRequests:
+    def test_admitted_within_budget(self, limiter):
+        assert limiter.admit_extra(5000)
+        # The extra request's tokens were taken
+        assert limiter.try_acquire(2000) > 0
+
+    def test_refused_instead_of_waiting_for_tokens(self, limiter):
+        assert limiter.try_acquire(5000) == 0
+        assert not limiter.admit_extra(2000)
+
+    def test_refused_while_the_breaker_is_open(self, limiter):
+        for _ in range(3):
+            limiter.record_failure()
+        assert not limiter.admit_extra(100)
+
+    def test_never_takes_the_half_open_probe(self, tmp_path):
+        limiter = SharedRateLimiter(
+            str(tmp_path / "rate_limit.sqlite3"), requests_per_minute=60, tokens_per_minute=6000,
+            failure_threshold=1, cooldown_seconds=0.5
+        )
+        limiter.record_failure()
+        time.sleep(0.55)
+        assert not limiter.admit_extra(100)
+        # The probe is left to a regular request
+        assert limiter.breaker_wait() == 0
+
+    def test_async(self, limiter):
+        assert asyncio.run(limiter.admit_extra_async(100))
+
+
+class TestRequestScheduler:
+    def test_returns_the_result_with_its_retry_count(self, limiter):
+        attempts = []
+
+        async def call():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise asyncio.TimeoutError()
+            return Completion()
+
+        result = asyncio.run(_scheduler(limiter).run(call, estimated_tokens=100))
+        assert result.retries == 2
+        assert len(attempts) == 3
+
+    def test_raises_unavailable_after_max_retries(self, limiter):
+        async def call():
+            raise asyncio.TimeoutError()
+
+        with pytest.raises(LLMProviderUnavailableError) as error:
+            asyncio.run(_scheduler(limiter, max_retries=2).run(call, estimated_tokens=100))
+        # Failed calls carry the retries they used, for telemetry
+        assert error.value.retries == 2
+
+    def test_non_retryable_errors_are_not_retried(self, limiter):
+        attempts = []
+
+        async def call():
+            attempts.append(1)
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError) as error:
+            asyncio.run(_scheduler(limiter).run(call, estimated_tokens=100))
+        assert len(attempts) == 1
+        assert error.value.retries == 0
+
+    def test_open_breaker_beyond_queue_budget_fails_fast(self, limiter):
+        for _ in range(3):
+            limiter.record_failure()
+
+        async def call():
+            return Completion()
+
+        started = time.monotonic()
+        with pytest.raises(LLMProviderUnavailableError):
+            asyncio.run(_scheduler(limiter, max_queue_wait=1.0).run(call, estimated_tokens=100))
+        assert time.monotonic() - started < 1.0
+
+    def test_success_resets_failures_and_reconciles_tokens(self, limiter):
+        limiter.record_failure()
+        limiter.record_failure()
+
+        async def call():
+            return Completion(total_tokens=100)
+
+        asyncio.run(_scheduler(limiter).run(
+            call, estimated_tokens=5000, usage_tokens=lambda result: result.usage.total_tokens
+        ))
+        limiter.record_failure()
+        assert limiter.breaker_wait() == 0
+        # 4900 of the 5000 estimated tokens were credited back
+        assert limiter.try_acquire(5500) == 0
+
+    def test_retry_after_header(self):
+        response = type("Response", (), {"headers": {"retry-after": "7"}})()
+        error = Exception()
+        error.response = response
+        assert RequestScheduler._retry_after_seconds(error) == 7.0
+        assert RequestScheduler._retry_after_seconds(Exception()) is None
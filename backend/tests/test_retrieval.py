@@ -0,0 +1,53 @@
+# File: backend/tests/test_retrieval.py
+
+from app.services.evaluation.retrieval import DocumentIndex, StreamingReadiness, tokenize
+from app.utils.token_utils import estimate_tokens
+
+CHUNKS = [
+    "公司概况：我们是一家做企业软件的初创公司。",
+    "核心团队由三位创始人组成，CEO曾任大型科技公司高管。",
+    "市场规模预计三年内增长到五百亿元，主要竞争对手有两家。",
+    "产品采用自研算法，已申请三项专利。",
+    "本轮融资两千万元，资金用途为研发与市场推广。",
+]
+
+
+def test_tokenize_mixes_chinese_bigrams_and_ascii_words():
+    assert tokenize("团队CEO 30%增长") == ["团队", "增长", "ceo", "30%"]
+
+
+def test_matching_chunks_score_higher():
+    index = DocumentIndex(CHUNKS)
+    scores = index.score(tokenize("团队") + tokenize("创始人"))
+    assert max(range(len(CHUNKS)), key=lambda i: scores[i]) == 1
+    assert scores[4] == 0
+
+
+def test_whole_document_within_the_budget_is_kept():
+    assert DocumentIndex(CHUNKS).select(["团队"], token_budget=10000) == "\n".join(CHUNKS)
+
+
+def test_selection_keeps_the_opening_and_the_best_matches_in_document_order():
+    budget = estimate_tokens(CHUNKS[0]) + estimate_tokens(CHUNKS[4]) + estimate_tokens(CHUNKS[2])
+    selected = DocumentIndex(CHUNKS).select(["融资", "资金", "市场"], token_budget=budget)
+    assert selected == "\n……\n".join([CHUNKS[0], CHUNKS[2], CHUNKS[4]])
+
+
+def test_chunks_without_any_match_are_not_selected():
+    budget = sum(estimate_tokens(chunk) for chunk in CHUNKS) - 1
+    selected = DocumentIndex(CHUNKS).select(["专利"], token_budget=budget, include_opening=False)
+    assert selected == CHUNKS[3]
+
+
+def test_empty_document_selects_nothing():
+    assert DocumentIndex([]).select(["团队"], token_budget=100) == ""
+
+
+def test_dimensions_become_ready_once_enough_relevant_text_streamed():
+    page = "核心团队由三位创始人组成，" * 10
+    readiness = StreamingReadiness(["团队能力", "财务情况"], token_budget=estimate_tokens(page), ready_factor=1.5)
+
+    assert readiness.add_page(page) == []
+    assert readiness.add_page(page) == ["团队能力"]
+    assert readiness.add_page(page) == []
+    assert not readiness.all_ready
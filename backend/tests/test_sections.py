@@ -0,0 +1,115 @@
+# File: backend/tests/test_sections.py
+
+from app.services.document.sections import (
+    SECTION_OTHER,
+    SECTION_OVERVIEW,
+    build_section_index,
+    classify_heading,
+    heading_lines,
+    section_spans,
+)
+
+PAGES = [
+    "创新科技商业计划书\n本公司成立于2019年，总部位于杭州。",
+    "一、核心团队\n创始人张三曾任某上市公司技术总监。\n联合创始人负责销售。",
+    "二、产品与技术\n我们的产品是一套企业数字化平台。\n已获得12项发明专利。",
+    "平台采用微服务架构，研发投入占收入的30%。",
+    "三、市场分析\n目标市场规模超过500亿元，年增速20%。",
+    "四、财务预测\n预计2025年营业收入1.2亿元。\n本轮融资3000万元。",
+]
+
+
+def _document_text(pages):
+    """Merged text with page markers, as ParsedDocument.text builds it"""
+    return "".join(
+        f"\n--- 第{number}页 ---\n{page}\n" for number, page in enumerate(pages, start=1)
+    )
+
+
+class TestHeadings:
+    def test_classify_heading(self):
+        assert classify_heading("核心团队") == "团队能力"
+        assert classify_heading("Financial Projections") == "财务情况"
+        assert classify_heading("产品与技术") == "产品&技术"
+        assert classify_heading("致谢") is None
+
+    def test_last_matching_word_wins(self):
+        assert classify_heading("技术团队") == "团队能力"
+
+    def test_numbered_headings(self):
+        assert heading_lines(PAGES[1]) == [("一、核心团队", "团队能力")]
+        assert heading_lines("第三章 市场分析\n正文") == [("第三章 市场分析", "市场前景")]
+
+    def test_numbered_chapter_without_dimension_is_other(self):
+        assert heading_lines("五、发展历程") == [("五、发展历程", SECTION_OTHER)]
+
+    def test_figures_and_sentences_are_not_headings(self):
+        page = "1.2亿元市场规模\n我们的团队，经验丰富\n市场占有率第1"
+        assert heading_lines(page) == []
+
+    def test_unnumbered_slide_titles(self):
+        assert heading_lines("Market Opportunity\nsome body text about the market") == [
+            ("Market Opportunity", "市场前景")
+        ]
+        assert heading_lines("我们的团队成员来自多家知名互联网公司和研究机构") == []
+
+
+class TestBuildSectionIndex:
+    def test_sections_from_headings(self):
+        text = _document_text(PAGES)
+        sections = build_section_index(text, PAGES)
+
+        assert [entry["section"] for entry in sections] == [
+            SECTION_OVERVIEW, "团队能力", "产品&技术", "市场前景", "财务情况"
+        ]
+        assert sections[0]["source"] == "start"
+        assert sections[1] == {
+            "section": "团队能力",
+            "title": "一、核心团队",
+            "start": text.find("一、核心团队"),
+            "end": text.find("--- 第3页 ---") + len("--- 第3页 ---") + 1,
+            "pages": [2, 3],
+            "source": "heading"
+        }
+        # The product section runs on over the page without a heading, up to
+        # the market heading on page 5
+        assert sections[2]["pages"] == [3, 5]
+        assert "微服务架构" in text[sections[2]["start"]:sections[2]["end"]]
+        assert sections[3]["start"] == text.find("三、市场分析")
+
+    def test_sections_are_contiguous(self):
+        text = _document_text(PAGES)
+        sections = build_section_index(text, PAGES)
+        assert sections[0]["start"] == 0
+        assert sections[-1]["end"] == len(text)
+        for previous, current in zip(sections, sections[1:]):
+            assert previous["end"] == current["start"]
+
+    def test_outline_entries_start_sections(self):
+        pages = ["封面", "我们的创始人来自名校。", "收入预测如下。"]
+        text = _document_text(pages)
+        sections = build_section_index(text, pages, outline=[(1, "团队介绍"), (2, "财务规划")])
+
+        assert [(entry["section"], entry["title"], entry["source"]) for entry in sections] == [
+            (SECTION_OVERVIEW, None, "start"),
+            ("团队能力", "团队介绍", "outline"),
+            ("财务情况", "财务规划", "outline"),
+        ]
+        assert sections[1]["start"] == text.find("--- 第2页 ---")
+
+    def test_keyword_density_starts_a_section(self):
+        pages = [
+            "一、核心团队\n创始人经验丰富。",
+            "市场规模 市场需求 行业增速 竞争格局 目标客户 市场份额 用户痛点",
+        ]
+        sections = build_section_index(_document_text(pages), pages)
+        assert [entry["section"] for entry in sections][-1] == "市场前景"
+        assert sections[-1]["source"] == "keywords"
+
+    def test_text_without_page_markers(self):
+        assert build_section_index("没有页码标记的文本", ["没有页码标记的文本"]) == []
+
+    def test_section_spans(self):
+        sections = build_section_index(_document_text(PAGES), PAGES)
+        spans = section_spans(sections, ["财务情况", "团队能力"])
+        assert [entry["section"] for entry in spans] == ["团队能力", "财务情况"]
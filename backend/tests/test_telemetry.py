@@ -0,0 +1,52 @@
+# File: backend/tests/test_telemetry.py
+
+import pytest
+
+from app.core.config.settings import settings
+from app.services.evaluation.telemetry import Histogram, LLMTelemetry, estimate_cost
+
+
+def test_cache_hit_tokens_are_priced_separately(monkeypatch):
+    monkeypatch.setattr(settings, "DEEPSEEK_PRICE_INPUT_CACHE_HIT", 0.1)
+    monkeypatch.setattr(settings, "DEEPSEEK_PRICE_INPUT_CACHE_MISS", 1.0)
+    monkeypatch.setattr(settings, "DEEPSEEK_PRICE_OUTPUT", 2.0)
+    assert estimate_cost(1_000_000, 500_000, prompt_cache_hit_tokens=400_000) == pytest.approx(0.04 + 0.6 + 1.0)
+
+
+def test_histogram_percentiles_report_bucket_bounds():
+    histogram = Histogram((1, 5, 10))
+    for value in (0.5, 0.8, 3, 4, 20):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {"1": 2, "5": 2, "10": 0, "+Inf": 1}
+    assert snapshot["p50"] == 5
+    # The +Inf bucket reports the largest value seen
+    assert histogram.percentile(100) == 20
+    assert Histogram((1,)).percentile(50) is None
+
+
+def test_calls_are_counted_per_dimension_and_model():
+    telemetry = LLMTelemetry()
+    telemetry.record_call("团队能力", "deepseek-chat", {"latency_seconds": 2.5, "prompt_tokens": 800, "retries": 1})
+    telemetry.record_call("团队能力", "deepseek-chat", {"outcome": "timeout", "latency_seconds": 60})
+    telemetry.record_call("产品技术", "deepseek-chat", {"outcome": "invalid_json", "estimated_cost": 0.002})
+    telemetry.record_cached("产品技术", "deepseek-chat")
+    telemetry.record_fallback("产品技术", "deepseek-chat")
+
+    stats = telemetry.stats()
+    team = stats["by_dimension"]["团队能力"]
+    assert (team["calls"], team["errors"], team["retries"]) == (2, 1, 1)
+    assert team["outcomes"] == {"ok": 1, "timeout": 1}
+    assert team["histograms"]["latency_seconds"]["count"] == 2
+    assert team["histograms"]["prompt_tokens"]["count"] == 1
+
+    model = stats["by_model"]["deepseek-chat"]
+    assert (model["calls"], model["errors"], model["cached_responses"], model["fallbacks"]) == (3, 2, 1, 1)
+    assert model["estimated_cost"] == 0.002
+
+
+def test_unlabelled_calls_are_grouped():
+    telemetry = LLMTelemetry()
+    telemetry.record_call("", "deepseek-chat", {})
+    assert list(telemetry.stats()["by_dimension"]) == ["unlabelled"]
@@ -0,0 +1,112 @@
+# File: backend/tests/test_text_processing.py
+
+from app.services.document.text_processing import BoilerplateFilter, TextChunker, normalize_text
+from app.utils.token_utils import estimate_tokens
+
+ENGLISH_SENTENCE = "The team has shipped three products to enterprise customers. "
+CHINESE_SENTENCE = "团队已向企业客户交付三款产品并实现盈利。"
+
+
+def test_normalize_text():
+    assert normalize_text("  团队\n\t介绍  ") == "团队 介绍"
+    assert normalize_text("ab ") == ""
+    assert normalize_text("团") == "团"
+    assert normalize_text("") == ""
+
+
+class TestTokenChunks:
+    def test_empty_text(self):
+        assert TextChunker("").token_chunks(100) == []
+
+    def test_short_text_is_one_chunk(self):
+        assert TextChunker("团队介绍。  产品介绍。").token_chunks(100) == ["团队介绍。 产品介绍。"]
+
+    def test_chunks_stay_within_budget(self):
+        text = (ENGLISH_SENTENCE + CHINESE_SENTENCE) * 60
+        chunks = TextChunker(text).token_chunks(200)
+        assert len(chunks) > 1
+        for chunk in chunks:
+            # estimate_tokens rounds down and adds one
+            assert estimate_tokens(chunk) <= 201
+
+    def test_chunks_end_at_sentence_boundaries(self):
+        text = CHINESE_SENTENCE * 50
+        chunks = TextChunker(text).token_chunks(100)
+        assert all(chunk.endswith("。") for chunk in chunks)
+
+    def test_chunks_cover_the_text_without_overlap(self):
+        text = (ENGLISH_SENTENCE + CHINESE_SENTENCE) * 40
+        chunker = TextChunker(text)
+        assert "".join(chunker.token_chunks(150)).replace(" ", "") == chunker.text.replace(" ", "")
+
+    def test_overlap_repeats_the_end_of_the_previous_chunk(self):
+        text = CHINESE_SENTENCE * 50
+        chunks = TextChunker(text).token_chunks(100, overlap_tokens=20)
+        for previous, current in zip(chunks, chunks[1:]):
+            assert current[:10] in previous
+
+    def test_mixed_text_is_weighted_per_character(self):
+        # Chinese costs twice as much per character, so its chunks are shorter
+        chinese_chunks = TextChunker(CHINESE_SENTENCE * 50).token_chunks(120)
+        english_chunks = TextChunker(ENGLISH_SENTENCE * 50).token_chunks(120)
+        assert len(chinese_chunks[0]) < len(english_chunks[0])
+
+    def test_unbroken_text_still_advances(self):
+        chunks = TextChunker("字" * 1000).token_chunks(60)
+        assert "".join(chunks) == "字" * 1000
+        assert all(len(chunk) <= 100 for chunk in chunks)
+
+
+class TestChunks:
+    def test_character_chunks_overlap(self):
+        text = CHINESE_SENTENCE * 100
+        chunks = TextChunker(text).chunks(chunk_size=400, overlap=50)
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 401 for chunk in chunks)
+        assert chunks[1][:20] in chunks[0]
+
+
+def _page(number: int, body: str) -> str:
+    """A page with a two-line header and footer around three body lines"""
+    return "\n".join([
+        "创新科技 商业计划书",
+        "2024 融资版",
+        body,
+        f"第{number}部分的补充说明",
+        f"第{number}部分的小结",
+        "机密文件",
+        f"第 {number} 页"
+    ])
+
+
+class TestBoilerplateFilter:
+    def test_repeated_header_and_numbered_footer_are_removed(self):
+        pages = [_page(number, f"第{number}部分的正文内容") for number in range(1, 6)]
+        boilerplate = BoilerplateFilter.from_pages(pages, line_ratio=0.6, min_pages=3)
+        assert boilerplate.strip(pages[2]) == "第3部分的正文内容\n第3部分的补充说明\n第3部分的小结"
+        assert boilerplate.stats()["repeated_lines_removed"] == 4
+        assert boilerplate.stats()["tokens_saved"] > 0
+
+    def test_too_few_pages_keeps_everything(self):
+        pages = [_page(number, "正文") for number in range(1, 3)]
+        boilerplate = BoilerplateFilter.from_pages(pages, line_ratio=0.6, min_pages=3)
+        assert boilerplate.strip(pages[0]) == pages[0]
+
+    def test_numbers_in_body_lines_are_not_masked(self):
+        pages = [_page(number, f"营业收入 {number}00 万元") for number in range(1, 4)]
+        boilerplate = BoilerplateFilter.from_pages(pages, line_ratio=0.6, min_pages=2)
+        assert boilerplate.strip(pages[0]).startswith("营业收入 100 万元\n")
+
+    def test_duplicate_paragraphs_are_dropped_after_first_occurrence(self):
+        paragraph = "本公司致力于为中小企业提供一站式数字化转型解决方案，覆盖营销、供应链与财务管理等环节。"
+        pages = [f"第一页\n{paragraph}", f"第二页\n{paragraph.replace('，', ', ')}"]
+        boilerplate = BoilerplateFilter.from_pages(pages, line_ratio=0.9, min_pages=2)
+        assert boilerplate.strip(pages[0]) == pages[0]
+        assert boilerplate.strip(pages[1]) == "第二页"
+        assert boilerplate.stats()["duplicate_paragraphs_removed"] == 1
+
+    def test_disabled_with_zero_ratio(self):
+        paragraph = "本公司致力于为中小企业提供一站式数字化转型解决方案，覆盖营销、供应链与财务管理等环节。"
+        pages = [_page(1, paragraph), _page(2, paragraph), _page(3, paragraph)]
+        boilerplate = BoilerplateFilter.from_pages(pages, line_ratio=0, min_pages=2)
+        assert [boilerplate.strip(page) for page in pages] == pages
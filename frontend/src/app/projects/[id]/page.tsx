@@ -215,42 +215,62 @@ export default function ProjectDetailPage() {
     }
   }, [projectId, missingInfoSaving]);
 
-  // Initial data loading
-  useEffect(() => {
-    const fetchData = async () => {
+  // Initial data loading, repeated when a running evaluation finishes
+  const fetchData = useCallback(async () => {
+    try {
+      const [projectRes, scoresRes, missingInfoRes] = await Promise.all([
+        projectApi.getDetail(projectId),
+        scoreApi.getScores(projectId),
+        scoreApi.getMissingInfo(projectId), // Use existing API for backward compatibility
+      ]);
+
+      setProject(projectRes.data);
+      setScores(scoresRes.data.dimensions);
+      originalScoresRef.current = [...scoresRes.data.dimensions];
+      setMissingInfo(missingInfoRes.data.items);
+
+      // Set team members state
+      const teamMembersValue = projectRes.data.team_members || "";
+      setTeamMembers(teamMembersValue);
+      setOriginalTeamMembers(teamMembersValue);
+
+      // Try to get BP info
       try {
-        const [projectRes, scoresRes, missingInfoRes] = await Promise.all([
-          projectApi.getDetail(projectId),
-          scoreApi.getScores(projectId),
-          scoreApi.getMissingInfo(projectId), // Use existing API for backward compatibility
-        ]);
-
-        setProject(projectRes.data);
-        setScores(scoresRes.data.dimensions);
-        originalScoresRef.current = [...scoresRes.data.dimensions];
-        setMissingInfo(missingInfoRes.data.items);
-
-        // Set team members state
-        const teamMembersValue = projectRes.data.team_members || "";
-        setTeamMembers(teamMembersValue);
-        setOriginalTeamMembers(teamMembersValue);
-
-        // Try to get BP info
-        try {
-          const bpInfoRes = await businessPlanApi.getInfo(projectId);
-          setBpInfo(bpInfoRes.data);
-        } catch (bpError) {
-          console.log("No BP found for project:", projectId);
-        }
-      } catch (err: any) {
-        setError(err.response?.data?.message || "获取项目详情失败");
-      } finally {
-        setLoading(false);
+        const bpInfoRes = await businessPlanApi.getInfo(projectId);
+        setBpInfo(bpInfoRes.data);
+      } catch (bpError) {
+        console.log("No BP found for project:", projectId);
       }
-    };
-    fetchData();
+    } catch (err: any) {
+      setError(err.response?.data?.message || "获取项目详情失败");
+    } finally {
+      setLoading(false);
+    }
   }, [projectId]);
 
+  useEffect(() => {
+    fetchData();
+  }, [fetchData]);
+
+  // Live evaluation progress while the BP is being processed
+  const isProcessing = project?.status === 'processing';
+  useEffect(() => {
+    if (!isProcessing) return;
+    const unsubscribe = businessPlanApi.subscribeEvents(projectId, (event) => {
+      if (event.type === 'snapshot') {
+        setProcessingStatus({ dimensions: event.dimensions || {} });
+      } else if (event.type === 'dimension_completed') {
+        setProcessingStatus((prev: any) => ({
+          dimensions: { ...(prev?.dimensions || {}), [event.dimension]: { status: 'completed', score: event.score } },
+        }));
+      } else if (['evaluation_completed', 'evaluation_failed', 'status'].includes(event.type)) {
+        setProcessingStatus(null);
+        fetchData();
+      }
+    });
+    return unsubscribe;
+  }, [projectId, isProcessing, fetchData]);
+
   // BP download handler
   const handleDownloadBP = async () => {
     if (!bpInfo?.file_exists) {
@@ -372,6 +392,14 @@ export default function ProjectDetailPage() {
                     提交时间：{project.created_at?.slice(0, 10)}
                   </div>
 
+                  {/* Live evaluation progress */}
+                  {isProcessing && processingStatus && (
+                    <div className="text-purple-500 text-sm mb-4">
+                      <i className="fa-solid fa-spinner fa-spin mr-1"></i>
+                      评估中：已完成 {Object.values(processingStatus.dimensions).filter((d: any) => d.status === 'completed').length} 个维度
+                    </div>
+                  )}
+
                   {/* BP Document Link */}
                   <div className="mb-4">
                     {bpInfo?.file_exists ? (
@@ -323,6 +323,22 @@ export const businessPlanApi = {
     const response = await api.get<ApiResponse<any>>(`projects/${projectId}/business-plans/status`);
     return handleResponse(response);
   },
+
+  // Subscribe to live evaluation progress (server-sent events); returns an unsubscribe function
+  subscribeEvents: (projectId: string, onEvent: (event: any) => void): (() => void) => {
+    const source = new EventSource(`${getApiBaseUrl()}/projects/${projectId}/business-plans/events`);
+    source.onmessage = (message) => {
+      const event = JSON.parse(message.data);
+      onEvent(event);
+      // The server ends the stream once evaluation is over; close so EventSource does not reconnect
+      const finished = ['evaluation_completed', 'evaluation_failed', 'status'].includes(event.type)
+        || (event.type === 'snapshot' && ['completed', 'failed'].includes(event.status));
+      if (finished) {
+        source.close();
+      }
+    };
+    return () => source.close();
+  },
     // Get business plan information
   getInfo: async (projectId: string): Promise<ApiResponse<any>> => {
     const response = await api.get<ApiResponse<any>>(`projects/${projectId}/business-plans/info`);